@@ -0,0 +1,276 @@
+"""
+Étrend elemzés
+--------------
+A naplózott napok kalória összegeinek (daily_totals) trendjei NumPy
+tömbökön, soronkénti Python ciklus nélkül:
+- 7 és 30 napos mozgó átlag (a nem naplózott napok kimaradnak)
+- napi egyenleg (hiány / többlet) a napi kerethez (TDEE) képest
+- a keret alatt maradt napok sorozatai (jelenlegi és leghosszabb)
+- a hét napjai szerinti átlagok
+
+A napok egy folytonos naptárba kerülnek az első és az utolsó naplózott
+nap között, a nem naplózott napok értéke NaN.
+
+Az étrend oldal grafikonja (TrendChart) és a parancssori jelentés is
+ezt használja, a jelentés felület nélkül futtatható:
+
+    python -m app.analytics felhasznalo@example.com --tdee 2200
+"""
+
+import argparse
+from collections import namedtuple
+import numpy as np
+
+WEEKDAYS = ("Hétfő", "Kedd", "Szerda", "Csütörtök", "Péntek", "Szombat", "Vasárnap")
+CHART_DAYS = 30
+CHART_PADDING = 8
+
+TrendSummary = namedtuple("TrendSummary", ["logged_days", "first", "last", "average_7", "average_30",
+                                           "balance_30", "current_streak", "longest_streak", "weekdays"])
+TrendSummary.__doc__ = "A trendek összefoglalója az utolsó naplózott napig."
+
+ChartGeometry = namedtuple("ChartGeometry", ["bars", "over", "line", "target"])
+ChartGeometry.__doc__ = "A grafikon elemei képpontokban (oszlopok, kereten felüli jelölés, átlag vonal, keret)."
+
+
+def _round(value):
+    """NaN helyett None, egyébként egész szám."""
+    return None if np.isnan(value) else int(round(float(value)))
+
+
+class MealTrends:
+    """
+    Egy felhasználó napi kalória összegei folytonos naptárban.
+    """
+
+    def __init__(self, dates=(), kcal=()):
+        """
+        Args:
+            dates: ["YYYY-MM-DD", ...] növekvő sorrendben
+            kcal: A napok kalória összegei
+        """
+        logged = np.array(dates, dtype="datetime64[D]")
+        if logged.size:
+            self.days = np.arange(logged[0], logged[-1] + 1)
+            self.kcal = np.full(self.days.size, np.nan)
+            self.kcal[(logged - logged[0]).astype(np.int64)] = np.asarray(kcal, dtype=float)
+        else:
+            self.days = logged
+            self.kcal = np.array([], dtype=float)
+
+    @classmethod
+    def load(cls, meals, user_id):
+        """A felhasználó összes naplózott napja egyetlen lekérdezéssel (MealRepository.daily_kcal)."""
+        rows = meals.daily_kcal(user_id)
+        dates, kcal = zip(*rows) if rows else ((), ())
+        return cls(dates, kcal)
+
+    def __len__(self):
+        return self.days.size
+
+    @property
+    def logged(self):
+        """Logikai tömb: naplózott-e a nap."""
+        return ~np.isnan(self.kcal)
+
+    def rolling_average(self, window):
+        """
+        Mozgó átlag a naplózott napokra: minden napra az azt megelőző
+        `window` nap (a napot is beleértve) naplózott napjainak átlaga.
+
+        Returns:
+            Tömb a naptár minden napjára, NaN ha az ablakban nincs naplózott nap
+        """
+        sums = np.concatenate(([0.0], np.cumsum(np.nan_to_num(self.kcal))))
+        counts = np.concatenate(([0], np.cumsum(self.logged)))
+        end = np.arange(1, self.days.size + 1)
+        start = np.maximum(end - window, 0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (sums[end] - sums[start]) / (counts[end] - counts[start])
+
+    def balance(self, tdee):
+        """Returns: Napi egyenleg (bevitel - keret), NaN a nem naplózott napokon"""
+        return self.kcal - tdee
+
+    def streaks(self, target):
+        """
+        A keret alatt (vagy pontosan a kereten) maradt naplózott napok sorozatai.
+        Egy nem naplózott nap megszakítja a sorozatot.
+
+        Returns:
+            (jelenlegi, leghosszabb): a jelenlegi az utolsó naplózott nappal végződő sorozat
+        """
+        under = np.zeros(self.days.size + 2, dtype=np.int8)
+        with np.errstate(invalid="ignore"):
+            under[1:-1] = self.kcal <= target
+        edges = np.diff(under)
+        lengths = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+        if not lengths.size:
+            return 0, 0
+        current = int(lengths[-1]) if under[-2] else 0
+        return current, int(lengths.max())
+
+    def weekday_averages(self):
+        """Returns: 7 elemű tömb (hétfőtől vasárnapig), NaN ha a napon nincs naplózás"""
+        logged = self.logged
+        weekdays = (self.days[logged].astype(np.int64) + 3) % 7
+        totals = np.bincount(weekdays, weights=self.kcal[logged], minlength=7)
+        counts = np.bincount(weekdays, minlength=7)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return totals / counts
+
+    def between(self, first, last):
+        """
+        A naptár egy szakasza (a naplózott időszakon kívüli napok NaN értékkel).
+
+        Args:
+            first, last: "YYYY-MM-DD" (mindkettőt beleértve)
+
+        Returns:
+            (napok, kcal, 7 napos átlag)
+        """
+        days = np.arange(np.datetime64(first, "D"), np.datetime64(last, "D") + 1)
+        kcal = np.full(days.size, np.nan)
+        average = np.full(days.size, np.nan)
+        if self.days.size:
+            index = (days - self.days[0]).astype(np.int64)
+            inside = (index >= 0) & (index < self.days.size)
+            kcal[inside] = self.kcal[index[inside]]
+            average[inside] = self.rolling_average(7)[index[inside]]
+        return days, kcal, average
+
+    def summary(self, tdee=None):
+        """
+        Args:
+            tdee: Napi kalória keret, nélküle az egyenleg és a sorozatok None értékűek
+
+        Returns:
+            TrendSummary
+        """
+        if not self.days.size:
+            return TrendSummary(0, None, None, None, None, None, None, None, [None] * 7)
+        if tdee:
+            last_30 = self.balance(tdee)[-30:]
+            balance_30 = _round(np.nanmean(last_30)) if np.any(~np.isnan(last_30)) else None
+            current_streak, longest_streak = self.streaks(tdee)
+        else:
+            balance_30 = current_streak = longest_streak = None
+        return TrendSummary(int(self.logged.sum()),
+                            str(self.days[0]),
+                            str(self.days[-1]),
+                            _round(self.rolling_average(7)[-1]),
+                            _round(self.rolling_average(30)[-1]),
+                            balance_30,
+                            current_streak,
+                            longest_streak,
+                            [_round(value) for value in self.weekday_averages()])
+
+    def plot(self, last, width, height, tdee=None, days=CHART_DAYS):
+        """
+        A `last` napig tartó `days` napos grafikon elemei képpontokban.
+
+        Args:
+            last: Az utolsó nap ("YYYY-MM-DD")
+            width, height: A rajzterület mérete
+            tdee: Napi keret (vízszintes vonal és a kereten felüli oszlopok jelölése)
+
+        Returns:
+            ChartGeometry: bars [(x0, y0, x1, y1), ...], over [bool, ...],
+            line [x, y, x, y, ...], target y vagy None
+        """
+        first = np.datetime64(last, "D") - (days - 1)
+        _, kcal, average = self.between(str(first), last)
+
+        values = np.concatenate((kcal, average, [tdee or 0.0]))
+        values = values[~np.isnan(values)]
+        top = values.max() * 1.1 if values.size and values.max() > 0 else 1.0
+        scale = (height - 2 * CHART_PADDING) / top
+        bottom = height - CHART_PADDING
+
+        slot = (width - 2 * CHART_PADDING) / days
+        left = CHART_PADDING + np.arange(days) * slot
+        logged = ~np.isnan(kcal)
+        bars = np.column_stack((left + slot * 0.15,
+                                bottom - np.nan_to_num(kcal) * scale,
+                                left + slot * 0.85,
+                                np.full(days, bottom)))[logged]
+        with np.errstate(invalid="ignore"):
+            over = (kcal > tdee)[logged] if tdee else np.zeros(int(logged.sum()), dtype=bool)
+
+        smoothed = ~np.isnan(average)
+        line = np.column_stack((left + slot / 2, bottom - np.nan_to_num(average) * scale))[smoothed]
+
+        return ChartGeometry(bars.round().tolist(),
+                             over.tolist(),
+                             line.round().ravel().tolist(),
+                             round(bottom - tdee * scale) if tdee else None)
+
+
+def report_lines(trends, tdee=None):
+    """
+    Szöveges jelentés a trendekről (parancssori, felület nélküli használatra).
+
+    Returns:
+        A jelentés sorai
+    """
+    summary = trends.summary(tdee)
+    if not summary.logged_days:
+        return ["Nincs naplózott nap."]
+
+    lines = [f"Naplózott napok: {summary.logged_days} ({summary.first} - {summary.last})",
+             f"7 napos átlag: {summary.average_7} kcal",
+             f"30 napos átlag: {summary.average_30} kcal"]
+    if tdee:
+        if summary.balance_30 is not None:
+            lines.append(f"Átlagos napi egyenleg (30 nap): {summary.balance_30:+d} kcal")
+        lines.append(f"Keret alatti napok sorozata: {summary.current_streak} nap "
+                     f"(leghosszabb: {summary.longest_streak} nap)")
+    lines.append("Átlag a hét napjai szerint:")
+    for name, average in zip(WEEKDAYS, summary.weekdays):
+        lines.append(f"  {name:<10}{'-' if average is None else f'{average} kcal'}")
+    return lines
+
+
+def main(argv=None):
+    """
+    Jelentés készítése egy vagy több felhasználóról.
+
+    Args:
+        argv: Parancssori argumentumok (alapértelmezetten sys.argv[1:])
+
+    Returns:
+        0 ha minden felhasználó megvan, egyébként 1
+    """
+    from app.database import ConnectionManager
+    from app.migrations import migrate
+    from app.paths import resource_path
+    from app.repositories import UserRepository, MealRepository
+
+    parser = argparse.ArgumentParser(prog="python -m app.analytics",
+                                     description="MyFitPlan étrend trendek jelentése")
+    parser.add_argument("emails", nargs="+", help="A felhasználók e-mail címei")
+    parser.add_argument("--tdee", type=float, help="Napi kalória keret az egyenleghez és a sorozatokhoz")
+    parser.add_argument("--db", default=resource_path("myfitplan.db"), help="Az adatbázis fájl")
+    args = parser.parse_args(argv)
+
+    db = ConnectionManager(args.db, prepare=migrate)
+    users = UserRepository(db)
+    meals = MealRepository(db)
+    status = 0
+    try:
+        for email in args.emails:
+            print(email)
+            user_id = users.find_id(email)
+            if user_id is None:
+                print("  Nincs ilyen felhasználó.")
+                status = 1
+                continue
+            for line in report_lines(MealTrends.load(meals, user_id), args.tdee):
+                print(f"  {line}")
+    finally:
+        db.close()
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
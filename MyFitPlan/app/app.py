@@ -9,38 +9,35 @@ Főbb funkciók:
 - Étrend követése és napi kalória számolás
 - Edzésterv készítése és kezelése
 - Gyakorlatok hozzáadása izomcsoportok szerint
+- Elvégzett sorozatok naplózása edzés közben
+- Kalória előzmények napi, heti és havi bontásban
+- Más alkalmazásokból exportált étkezési napló importálása (CSV, JSON lines)
 
 Az alkalmazás SQLite adatbázist használ az adatok tárolására.
+
+Indításkor csak a bejelentkező képernyőhöz szükséges rész készül el az
+első kirajzolás előtt. Az étrend és edzés kezelő (és moduljaik) első
+használatkor töltődnek be, a többi oldal stílusai az első oldalváltáskor
+állnak be, az adatbázis séma ellenőrzése pedig az első kapcsolat
+megnyitásakor fut (legkésőbb közvetlenül az első kirajzolás után).
 """
 
 import ttkbootstrap as ttk
-import sqlite3
-import os
-import sys
+from collections import deque
 from pathlib import Path
+from app.paths import resource_path
 from app.user_manager import UserManager
-from app.diet_manager import DietManager
-from app.training_manager import TrainingManager
-
-
-def resource_path(relative_path):
-    """ 
-    Fájlok elérési útjának kezelése.
-    
-    Args:
-        relative_path: A fájl relatív elérési útja
-        
-    Returns:
-        A fájl abszolút elérési útja
-    """
-    if getattr(sys, 'frozen', False):
-        base_path = os.path.dirname(sys.executable)
-    else:
-        base_path = os.path.dirname(os.path.abspath(__file__))
-        if os.path.basename(base_path) == "app":
-            base_path = os.path.dirname(base_path)
-    return os.path.join(base_path, relative_path)
-
+from app.database import ConnectionManager
+from app.db_worker import DatabaseWorker
+from app.repositories import (UserRepository, MealRepository, TrainingDayRepository, ExerciseRepository,
+                              WorkoutSetRepository)
+from app.catalog import FoodCatalog, ExerciseCatalog
+from app.history import CalorieHistory
+from app.screens import ScreenManager
+from app.assets import ImageAssets, NAVIGATION_IMAGES
+from app.dialogs import DialogPool
+from app.startup import StartupProfiler
+from app.scheduler import UiScheduler
 
 
 class MyFitPlan:
@@ -48,12 +45,17 @@ class MyFitPlan:
     Az alkalmazás fő osztálya, ami kezeli a bejelentkezési és regisztrációs felületet,
     az adatbázis műveleteket, valamint az alkalmazás egyéb funkcióit.
     """
-    def __init__(self, root):
+    def __init__(self, root, profiler=None):
         """
         Az alkalmazás inicializálása.
-        Beállítja az ablak tulajdonságait, létrehozza az adatbázis kapcsolatot,
-        és beállítja a stílusokat.
+        Beállítja az ablak tulajdonságait, előkészíti az adatbázis elérést,
+        beállítja a bejelentkező képernyő stílusait és megjeleníti azt.
+
+        Args:
+            root: A Tk főablak
+            profiler: StartupProfiler az indítási szakaszok méréséhez (opcionális)
         """
+        self.profiler = profiler or StartupProfiler()
         self.root = root
         self.root.title("MyFitPlan")
         self.root.state('zoomed')
@@ -68,15 +70,31 @@ class MyFitPlan:
         self.root.configure(bg="#090e51")
 
         self.screen_stack = []
+        self.screens = ScreenManager(self.root)
+        self.assets = ImageAssets(self.root)
+        self.dialogs = DialogPool(self.root)
+        self.pending_messages = deque()
+        self.scheduler = UiScheduler(self.root)
+        self.top_frame = None
 
         db_path = resource_path('myfitplan.db')
-        self.db_connection = sqlite3.connect(db_path)
-        self.db_cursor = self.db_connection.cursor()
-        self.create_database()
+        self.db = ConnectionManager(db_path, prepare=self.create_database)
+        self.users = UserRepository(self.db)
+        self.meals = MealRepository(self.db)
+        self.training_days = TrainingDayRepository(self.db)
+        self.exercises = ExerciseRepository(self.db)
+        self.workout_sets = WorkoutSetRepository(self.db)
+        self.food_catalog = FoodCatalog(self.meals)
+        self.exercise_catalog = ExerciseCatalog(self.exercises)
+        self.calorie_history = CalorieHistory(self.meals)
+        self.db_worker = DatabaseWorker(self.root, self.db, error_handler=self.database_error)
+        self.root.protocol("WM_DELETE_WINDOW", self.quit)
 
         self.user_manager = UserManager(self)
-        self.meal_manager = DietManager(self)
-        self.training_manager = TrainingManager(self)
+        self._meal_manager = None
+        self._training_manager = None
+        self._history_manager = None
+        self.styles_configured = False
 
         self.activity_factors = {"Csekély": 1.2,
                                  "Mérsékelt": 1.375,
@@ -84,13 +102,63 @@ class MyFitPlan:
                                  "Átlagon felüli": 1.725,
                                  "Nagyon magas": 1.9}
 
-        self.configure_styles()
-        self.user_manager.login_or_register()
+        with self.profiler.phase("bejelentkező stílusok"):
+            self.configure_login_styles()
+        with self.profiler.phase("bejelentkező képernyő"):
+            self.user_manager.login_or_register()
         self.logged_in_user = None
         self.user_id = None
+        self.root.after_idle(self.first_frame)
+
+    @property
+    def meal_manager(self):
+        """Az étrend kezelő, első használatkor betöltve."""
+        if self._meal_manager is None:
+            from app.diet_manager import DietManager
+            self._meal_manager = DietManager(self)
+        return self._meal_manager
+
+    @property
+    def training_manager(self):
+        """Az edzés kezelő, első használatkor betöltve."""
+        if self._training_manager is None:
+            from app.training_manager import TrainingManager
+            self._training_manager = TrainingManager(self)
+        return self._training_manager
+
+    @property
+    def history_manager(self):
+        """A kalória előzmények kezelő, első használatkor betöltve."""
+        if self._history_manager is None:
+            from app.history_manager import HistoryManager
+            self._history_manager = HistoryManager(self)
+        return self._history_manager
+
+    def first_frame(self):
+        """
+        Az első kirajzolás után fut (a bejelentkező képernyő kirajzolása
+        a korábban ütemezett üresjárati feladatok között megtörténik).
+        Rögzíti az időt, majd elindítja a halasztott előkészítést.
+        """
+        self.profiler.mark_first_frame()
+        self.root.after(0, self.warm_up)
 
-    def configure_styles(self):
-        """Stílusok beállítása"""
+    def warm_up(self):
+        """
+        Halasztott előkészítés az első kirajzolás után: az adatbázis
+        kapcsolat megnyitása (és ezzel a séma ellenőrzése), hogy a
+        bejelentkezés már ne várjon rá, valamint a navigációs sáv képeinek
+        betöltése, hogy az első oldal megnyitásakor már a memóriában legyenek.
+        Profilozáskor itt készül a jelentés.
+        """
+        with self.profiler.phase("séma ellenőrzés"):
+            self.db.connection()
+        with self.profiler.phase("navigációs képek"):
+            self.assets.preload(NAVIGATION_IMAGES)
+        self.profiler.report()
+
+    def configure_login_styles(self):
+        """A bejelentkező képernyő és az üzenetablak stílusainak beállítása (az első kirajzolás előtt)."""
         style = ttk.Style()
         style.configure('darkbutton.TButton', background="#09053a", foreground="#8b87dc", 
                         font=("Colibri", 10), relief="solid", borderwidth=1, bordercolor="#ff4e1a")
@@ -98,10 +166,18 @@ class MyFitPlan:
                   foreground=[('active', 'white')], relief=[('active', 'solid')])
         style.configure('lightbutton.TButton', background="#09053a", foreground="#8b87dc", font=("Colibri", 15), relief="solid", borderwidth=1, bordercolor="#ff4e1a")
         style.map('lightbutton.TButton', background=[('active', '#110a6b')], foreground=[('active', 'white')], relief=[('active', 'solid')])
+        style.configure("Screen.TFrame", background="#090e51")
         style.configure("Custom.TLabelframe", background="#090e51")
         style.configure("Custom.TLabelframe.Label", background="#090e51", font=("Colibri", 20), foreground="#8b87dc")
         style.configure("Custom.TEntry", fieldbackground="#090e51", highlightthickness=0,)
         style.configure("Custom.TLabel", background="#090e51", foreground="#8b87dc")
+
+    def configure_styles(self):
+        """A bejelentkezés utáni oldalak stílusainak beállítása (első oldalváltáskor, egyszer)."""
+        if self.styles_configured:
+            return
+        self.styles_configured = True
+        style = ttk.Style()
         style.configure('Frameborder1.TFrame', borderwidth=0, relief='solid', bordercolor='#ff4e1a', background='#40098d')
         style.configure('Frameborder.TFrame', borderwidth=1, relief='solid', bordercolor='#ff4e1a', background='#09053a')
         style.configure('menubutton.TButton', background='#40098d', borderwidth=1, bordercolor="#ff4e1a", highlightthickness=0, relief="flat")
@@ -118,84 +194,87 @@ class MyFitPlan:
         style.map("Custom.Treeview", background=[('selected', '#09053a')], foreground=[('selected', '#ff4e1a')])
         
 
-    def create_database(self):
+    def create_database(self, connection=None):
         """
-        Adatbázis struktúra létrehozása.
-        
-        Létrehozott táblák:
-        - users: Felhasználói adatok tárolása
-        - users_meals: Felhasználók étkezéseinek naplózása
-        - training_days: Edzésnapok tárolása
-        - exercises: Felhasználók által összeállított edzéstervek gyakorlatai
-        
-        Minden tábla csak akkor jön létre, ha még nem létezik.
+        Adatbázis struktúra létrehozása és frissítése.
+
+        A táblákat és indexeket a migrációs modul hozza létre (app/migrations.py).
+        Csak a még le nem futott migrációk futnak, a verziót a
+        `PRAGMA user_version` tárolja, így a meglévő adatbázisok helyben frissülnek.
+
+        A ConnectionManager az első kapcsolat megnyitásakor hívja meg (prepare).
+        A migrációk a katalógus táblákat is (újra)tölthetik, ezért utána az
+        étel és gyakorlat katalógus gyorsítótára érvénytelenítődik.
+
+        Args:
+            connection: A frissen megnyitott kapcsolat (alapértelmezett: a szál kapcsolata)
         """
+        from app.migrations import migrate
+        migrate(connection or self.db.connection())
+        self.food_catalog.invalidate()
+        self.exercise_catalog.invalidate()
 
-        self.db_cursor.execute(''' 
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL UNIQUE,
-                vezeteknev TEXT NOT NULL,
-                keresztnev TEXT NOT NULL,
-                email TEXT NOT NULL UNIQUE,
-                jelszo TEXT NOT NULL,
-                eletkor INTEGER,
-                magassag INTEGER,
-                testsuly INTEGER,
-                nem TEXT,
-                aktivitas TEXT
-            )
-        ''')
-
-
-        self.db_cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users_meals (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                table_name TEXT NOT NULL,
-                food_name TEXT NOT NULL,
-                calories INTEGER NOT NULL,
-                amount REAL NOT NULL,
-                date TEXT NOT NULL,
-                FOREIGN KEY(user_id) REFERENCES users(id)
-            )
-        ''')
-
-
-        self.db_cursor.execute('''
-            CREATE TABLE IF NOT EXISTS training_days (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER NOT NULL,
-                day_name TEXT NOT NULL,
-                FOREIGN KEY(user_id) REFERENCES users(id),
-                UNIQUE(user_id, day_name)
-            )
-        ''')
+    def database_error(self, error):
+        """
+        Háttérben futó adatbázis művelet hibájának megjelenítése.
+        Akkor hívódik, ha a műveletnek nincs saját hibakezelője.
+        """
+        self.custom_messagebox("Hiba", f"Adatbázis hiba történt: {error}")
 
- 
-        self.db_cursor.execute('''
-            CREATE TABLE IF NOT EXISTS exercises (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                day_id INTEGER NOT NULL,
-                exercise_name TEXT NOT NULL,
-                sets INTEGER NOT NULL,
-                reps INTEGER NOT NULL,
-                weight REAL,
-                equipment TEXT,
-                difficulty TEXT,
-                description TEXT,
-                FOREIGN KEY(day_id) REFERENCES training_days(id)
-            )
-        ''')
-
-        self.db_connection.commit()
+    def meals_imported(self):
+        """
+        Tömeges étkezés importálás után az étkezésekből számolt gyorsítótárak
+        (előzmények, napok, trendek) eldobása, a következő megjelenítés újratölti őket.
+        """
+        self.calorie_history.clear()
+        if self._meal_manager is not None:
+            self._meal_manager.snapshots.clear()
+            self._meal_manager.snapshot = None
+            self._meal_manager.trends = None
+
+    def quit(self):
+        """
+        Kilépés az alkalmazásból.
+        Előbb megvárja, hogy a háttérszál minden függőben lévő írást
+        elmentsen az adatbázisba, csak utána állítja le az eseményhurkot.
+        """
+        self.db_worker.stop()
+        self.root.quit()
 
     def clear_screen(self):
         """
         Képernyő tartalmának törlése.
-        Eltávolít minden widgetet a felületről.
+        Eltávolít minden widgetet a felületről, a felépített oldalakat
+        és a navigációs sávot is (ezek a következő megjelenítéskor újraépülnek).
+        A felugró ablakok (DialogPool) megmaradnak, csak elrejtődnek,
+        az ütemezett feladatok és eseménykötések (UiScheduler) törlődnek.
         """
+        self.scheduler.cancel_all()
+        self.dialogs.hide_all()
         for widget in self.root.winfo_children():
-            widget.destroy()
+            if not self.dialogs.owns(widget):
+                widget.destroy()
+        self.screens.reset()
+        self.top_frame = None
+
+    def show_screen(self, name, build, refresh=None):
+        """
+        Bejelentkezés utáni oldal megjelenítése a navigációs sávval.
+
+        Az oldal csak az első megjelenítéskor épül fel, utána a kerete
+        kerül előre és a refresh függvény frissíti az adatait.
+        A bejelentkező oldalról érkezve előbb törli a képernyőt.
+
+        Args:
+            name: Az oldal neve
+            build: build(keret), az oldal widgetjeinek létrehozása
+            refresh: refresh(), az oldal adatainak frissítése
+        """
+        self.configure_styles()
+        if self.screens.is_empty():
+            self.clear_screen()
+        self.screens.show(name, build, refresh)
+        self.load_navigation_bar()
 
     def custom_messagebox(self, title, message, login=False, diet=False, profile=False):
         """
@@ -206,29 +285,42 @@ class MyFitPlan:
         - login: átirányítás a bejelentkező oldalra
         - diet: átirányítás az étrend oldalra
         - profile: átirányítás a profil oldalra
+
+        Az ablak egyszer épül fel (DialogPool), utána csak a szövege
+        és az átirányítás cserélődik. Ha egy üzenet már látható, az új
+        üzenet sorba kerül, és az előző bezárása után jelenik meg, így
+        egyik üzenet sem írja felül a másik szövegét és átirányítását.
         """
-        message_window = ttk.Toplevel(self.root)
-        message_window.title(title)
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
-        window_width = 500
-        window_height = 200
-        position_right = int(screen_width / 2 - window_width / 2)
-        position_down = int(screen_height / 2 - window_height / 2)
-        message_window.geometry(f"{window_width}x{window_height}+{position_right}+{position_down}")
-        message_window.grab_set()
-
-        label = ttk.Label(message_window, text=message,
-                          font=("Colibri", 15),
-                          bootstyle="secondary")
-        label.pack(pady=50)
-
-        rendben = ttk.Button(message_window, text="Rendben",
-                             style="lightbutton.TButton",
-                             cursor="hand2",
-                             takefocus=False,
-                             command=lambda: self.close_messagebox(message_window, login, diet, profile))
-        rendben.pack(pady=10)
+        def build(dialog):
+            label = ttk.Label(dialog.window, text="",
+                              font=("Colibri", 15),
+                              bootstyle="secondary")
+            label.pack(pady=50)
+
+            rendben = ttk.Button(dialog.window, text="Rendben",
+                                 style="lightbutton.TButton",
+                                 cursor="hand2",
+                                 takefocus=False)
+            rendben.pack(pady=10)
+
+            def reset(title, message, login, diet, profile):
+                dialog.window.title(title)
+                label.configure(text=message)
+                rendben.configure(command=lambda: self.close_messagebox(dialog, login, diet, profile))
+
+            dialog.on_reset = reset
+            dialog.on_hide = lambda: self.root.after_idle(self.show_next_message)
+
+        message_window = self.dialogs.get("message", title, 500, 200, build, modal=True)
+        if message_window.visible:
+            self.pending_messages.append((title, message, login, diet, profile))
+            return
+        message_window.show(title, message, login, diet, profile)
+
+    def show_next_message(self):
+        """A sorban várakozó következő üzenet megjelenítése (az előző bezárása után)."""
+        if self.pending_messages:
+            self.custom_messagebox(*self.pending_messages.popleft())
 
     def back(self):
         """
@@ -245,7 +337,7 @@ class MyFitPlan:
         Üzenetablak bezárása és opcionális átirányítás.
         Az átirányítási paraméterek alapján navigál a megfelelő oldalra.
         """
-        message_window.destroy()
+        message_window.hide()
         if login==True:
             self.user_manager.login_page()
         if diet==True:
@@ -261,17 +353,28 @@ class MyFitPlan:
         - Profil ikon és gomb
         - Étrend ikon és gomb
         - Edzés ikon és gomb
+        - Előzmények ikon és gomb
         - Kijelentkezés ikon és gomb
         - Bezárás ikon és gomb
+
+        A sáv egyszer épül fel, ismételt hívásra csak előre kerül
+        (az oldalak keretei fölé). A képeket az ImageAssets tároló adja,
+        a fél méretű ikonok előre kicsinyítve vannak a Képek mappában.
+        A jobb oldali háttérkép átméretezéskor üresjáratban, egyszer
+        igazodik az ablak széléhez (UiScheduler).
         """
+        if self.top_frame is not None and self.top_frame.winfo_exists():
+            ttk.tk.Misc.tkraise(self.top_frame)
+            return
+
         self.top_frame = ttk.Canvas(self.root, height=110)
         self.top_frame.grid_propagate(False)
         self.top_frame.grid(row=0, column=0, columnspan=5, padx=0, pady=0, sticky="new")
 
-        self.bg1_image = ttk.PhotoImage(file=resource_path("Képek/backg1.png"))
+        self.bg1_image = self.assets.image("backg1.png")
         self.top_frame.create_image(0, 0, image=self.bg1_image, anchor="nw")
 
-        self.bg2_image = ttk.PhotoImage(file=resource_path("Képek/backg2.png"))
+        self.bg2_image = self.assets.image("backg2.png")
         
         self.bg2 = self.top_frame.create_image(self.root.winfo_screenwidth(), 0, image=self.bg2_image, anchor="ne")
 
@@ -282,13 +385,14 @@ class MyFitPlan:
                 except ttk.TclError:
                     pass
 
-        self.bg_update_binding = self.root.bind('<Configure>', update_bg2_position)
+        self.scheduler.bind("navigation_background", self.root, "<Configure>", update_bg2_position)
         
-        self.profile_icon = ttk.PhotoImage(file=resource_path("Képek/profile.png")).subsample(2)
-        self.food_icon = ttk.PhotoImage(file=resource_path("Képek/diet.png")).subsample(2)
-        self.weight_icon = ttk.PhotoImage(file=resource_path("Képek/weight.png")).subsample(2)
-        self.logout = ttk.PhotoImage(file=resource_path("Képek/logout.png")).subsample(2)
-        self.exit = ttk.PhotoImage(file=resource_path("Képek/exit.png")).subsample(2)
+        self.profile_icon = self.assets.image("profile.png", subsample=2)
+        self.food_icon = self.assets.image("diet.png", subsample=2)
+        self.weight_icon = self.assets.image("weight.png", subsample=2)
+        self.history_icon = self.assets.image("history.png", subsample=2)
+        self.logout = self.assets.image("logout.png", subsample=2)
+        self.exit = self.assets.image("exit.png", subsample=2)
 
         self.left_frame = ttk.Frame(self.top_frame,
                                     style="Frameborder1.TFrame")
@@ -308,7 +412,7 @@ class MyFitPlan:
 
         self.food_button = ttk.Button(self.left_frame,
                                       image=self.food_icon,
-                                      command=self.meal_manager.diet_page,
+                                      command=lambda: self.meal_manager.diet_page(),
                                       style="menubutton.TButton",
                                       cursor="hand2",
                                       takefocus=False)
@@ -316,12 +420,20 @@ class MyFitPlan:
 
         self.weight_button = ttk.Button(self.left_frame,
                                         image=self.weight_icon, 
-                                        command=self.training_manager.training_page,
+                                        command=lambda: self.training_manager.training_page(),
                                         style="menubutton.TButton", 
                                         cursor="hand2", 
                                         takefocus=False)
         self.weight_button.grid(row=0, column=3, pady=(2,0), padx=2, sticky="nsew")
 
+        self.history_button = ttk.Button(self.left_frame,
+                                         image=self.history_icon,
+                                         command=lambda: self.history_manager.history_page(),
+                                         style="menubutton.TButton",
+                                         cursor="hand2",
+                                         takefocus=False)
+        self.history_button.grid(row=0, column=4, pady=(2,0), padx=2, sticky="nsew")
+
         self.logout_button = ttk.Button(self.left_frame, 
                                         image=self.logout, 
                                         command=self.user_manager.logout,
@@ -332,7 +444,7 @@ class MyFitPlan:
 
         self.exit_button = ttk.Button(self.left_frame,
                                       image=self.exit,
-                                      command=self.root.quit,
+                                      command=self.quit,
                                       style="menubutton.TButton",
                                       cursor="hand2",
                                       takefocus=False)
@@ -348,7 +460,7 @@ class MyFitPlan:
 
         self.food_label_button = ttk.Button(self.left_frame,
                                             text="Étrend", 
-                                            command=self.meal_manager.diet_page,
+                                            command=lambda: self.meal_manager.diet_page(),
                                             style="words.TButton", 
                                             cursor="hand2", 
                                             takefocus=False)
@@ -356,12 +468,20 @@ class MyFitPlan:
 
         self.weight_label_button = ttk.Button(self.left_frame,
                                               text="Edzés",
-                                              command=self.training_manager.training_page,
+                                              command=lambda: self.training_manager.training_page(),
                                               style="words.TButton", 
                                               cursor="hand2", 
                                               takefocus=False)
         self.weight_label_button.grid(row=1, column=3, pady=(0, 2), padx=2, sticky="nsew")
 
+        self.history_label_button = ttk.Button(self.left_frame,
+                                               text="Előzmények",
+                                               command=lambda: self.history_manager.history_page(),
+                                               style="words.TButton",
+                                               cursor="hand2",
+                                               takefocus=False)
+        self.history_label_button.grid(row=1, column=4, pady=(0, 2), padx=2, sticky="nsew")
+
         self.logout_label_button = ttk.Button(self.left_frame, 
                                               text="Kijelentkezés", 
                                               command=self.user_manager.logout,
@@ -372,7 +492,7 @@ class MyFitPlan:
 
         self.exit_label_button = ttk.Button(self.left_frame, 
                                             text="Bezárás", 
-                                            command=self.root.quit,
+                                            command=self.quit,
                                             style="words.TButton", 
                                             cursor="hand2", 
                                             takefocus=False)
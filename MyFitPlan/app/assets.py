@@ -0,0 +1,89 @@
+"""
+Kép erőforrások
+---------------
+A `Képek/` mappa képeinek közös tárolója. Minden kép (és minden
+kicsinyített változata) egyszer töltődik be, első használatkor, utána
+mindenki ugyanazt a PhotoImage objektumot kapja meg. A navigációs sáv
+újraépítése így nem dekódol újra PNG fájlokat és nem halmoz fel
+ugyanabból a képből több példányt.
+
+A kicsinyített változatok előre elkészítve a `Képek/kicsi_<arány>/`
+mappában vannak (pl. `Képek/kicsi_2/profile.png` a fél méretű ikon).
+Ha egy változat hiányzik, a teljes méretű képből készül `subsample`-lel.
+
+A navigációs sáv képeit (NAVIGATION_IMAGES) az alkalmazás az első
+kirajzolás után előtölti (`preload`), így bejelentkezéskor már készen állnak.
+"""
+
+import os
+import ttkbootstrap as ttk
+from app.paths import resource_path
+
+IMAGE_DIR = "Képek"
+
+NAVIGATION_IMAGES = [("backg1.png", 1),
+                     ("backg2.png", 1),
+                     ("profile.png", 2),
+                     ("diet.png", 2),
+                     ("weight.png", 2),
+                     ("history.png", 2),
+                     ("logout.png", 2),
+                     ("exit.png", 2)]
+
+
+def scaled_image_path(name, subsample):
+    """Az előre kicsinyített változat relatív elérési útja."""
+    return f"{IMAGE_DIR}/kicsi_{subsample}/{name}"
+
+
+class ImageAssets:
+    """
+    Betöltött képek (fájlnév, kicsinyítés) szerint.
+    """
+    def __init__(self, root):
+        """
+        Args:
+            root: A Tk főablak, a képek ehhez tartoznak
+        """
+        self.root = root
+        self.images = {}
+
+    def image(self, name, subsample=1):
+        """
+        Kép lekérése a tárolóból, szükség esetén betöltése.
+
+        Args:
+            name: A fájl neve a Képek mappában (pl. "profile.png")
+            subsample: Kicsinyítés aránya (2 = fél méret)
+
+        Returns:
+            PhotoImage, ugyanarra a kérésre mindig ugyanaz a példány
+        """
+        key = (name, subsample)
+        image = self.images.get(key)
+        if image is None:
+            image = self._load(name, subsample)
+            self.images[key] = image
+        return image
+
+    def preload(self, images=NAVIGATION_IMAGES):
+        """
+        Képek előzetes betöltése.
+
+        Args:
+            images: [(fájlnév, kicsinyítés), ...]
+        """
+        for name, subsample in images:
+            self.image(name, subsample)
+
+    def _load(self, name, subsample):
+        if subsample == 1:
+            return ttk.PhotoImage(master=self.root, file=resource_path(f"{IMAGE_DIR}/{name}"))
+
+        scaled_path = resource_path(scaled_image_path(name, subsample))
+        if os.path.exists(scaled_path):
+            return ttk.PhotoImage(master=self.root, file=scaled_path)
+        return self.image(name).subsample(subsample)
+
+    def __len__(self):
+        return len(self.images)
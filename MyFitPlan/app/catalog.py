@@ -0,0 +1,133 @@
+"""
+Katalógus gyorsítótár
+---------------------
+Az étel és a gyakorlat katalógus nem változik futás közben, ezért az első
+használatkor egyetlen lekérdezéssel betöltődik, és a folyamat végéig
+a memóriában marad. A legördülő listák szövegei betöltéskor előre
+elkészülnek, így a popupok megnyitása és a kategória / izomcsoport váltás
+nem futtat SQL lekérdezést.
+
+Ha a katalógus tartalma megváltozik (újraimportálás), az `invalidate()`
+hívás után a következő használat újratölti. A katalógus táblákat a
+migrációk töltik fel (a foods táblát a CSV fájlokból), ezért az alkalmazás
+minden migráció futtatása után érvényteleníti a gyorsítótárakat.
+"""
+
+from collections import namedtuple
+from app.food_index import FoodIndex
+
+Food = namedtuple("Food", ["id", "name", "kcal_per_100", "unit"])
+Food.__doc__ = "Egy étel a katalógusból (foods tábla sora)."
+
+
+def food_label(food):
+    """A legördülő listában megjelenő szöveg, pl. "alma (52 kcal/100g)"."""
+    return f"{food.name} ({food.kcal_per_100} kcal/100{food.unit})"
+
+
+def food_calories(food, amount):
+    """A megadott mennyiség (g/ml) kalóriatartalma egészre kerekítve."""
+    return round(food.kcal_per_100 / 100 * amount)
+
+
+class FoodCatalog:
+    """
+    Az étel katalógus gyorsítótára kategóriák szerint.
+
+    Az adatokat a MealRepository.all_foods() tölti be lustán (első használatkor).
+    """
+
+    def __init__(self, meals):
+        """
+        Args:
+            meals: MealRepository példány
+        """
+        self.meals = meals
+        self.foods_by_category = None
+        self.labels_by_category = None
+        self.search_index = None
+
+    def _load(self):
+        if self.foods_by_category is None:
+            foods_by_category = {}
+            for category, food_id, name, kcal_per_100, unit in self.meals.all_foods():
+                foods_by_category.setdefault(category, []).append(Food(food_id, name, kcal_per_100, unit))
+            self.labels_by_category = {category: [food_label(food) for food in foods]
+                                       for category, foods in foods_by_category.items()}
+            self.foods_by_category = foods_by_category
+        return self.foods_by_category
+
+    def categories(self):
+        """Returns: A kategóriák nevei betűrendben"""
+        return sorted(self._load())
+
+    def foods(self, category):
+        """Returns: [Food, ...] az adott kategóriából (a labels() sorrendjében)"""
+        return self._load().get(category, [])
+
+    def labels(self, category):
+        """Returns: Az adott kategória ételeinek előre elkészített szövegei"""
+        self._load()
+        return self.labels_by_category.get(category, [])
+
+    def index(self):
+        """Returns: A teljes katalógusra épített FoodIndex (első híváskor épül fel)"""
+        if self.search_index is None:
+            self.search_index = FoodIndex([food for foods in self._load().values() for food in foods])
+        return self.search_index
+
+    def invalidate(self):
+        """A gyorsítótár ürítése, a következő használat újratölti a katalógust."""
+        self.foods_by_category = None
+        self.labels_by_category = None
+        self.search_index = None
+
+
+def exercise_label(name, equipment, difficulty):
+    """A gyakorlat legördülő listában megjelenő szöveg, pl. "Fekvőtámasz | Nincs | Kezdő"."""
+    return f"{name} | {equipment} | {difficulty}"
+
+
+class ExerciseCatalog:
+    """
+    A gyakorlat katalógus gyorsítótára.
+
+    - labels_by_group: izomcsoport -> a legördülő lista szövegei
+    - info_by_name: (izomcsoport, gyakorlat neve) -> (eszközök, nehézség, leírás)
+
+    Az adatokat az ExerciseRepository.catalog_entries() tölti be lustán.
+    """
+
+    def __init__(self, exercises):
+        """
+        Args:
+            exercises: ExerciseRepository példány
+        """
+        self.exercises = exercises
+        self.labels_by_group = None
+        self.info_by_name = None
+
+    def _load(self):
+        if self.labels_by_group is None:
+            labels_by_group = {}
+            info_by_name = {}
+            for group, name, equipment, difficulty, description in self.exercises.catalog_entries():
+                labels_by_group.setdefault(group, []).append(exercise_label(name, equipment, difficulty))
+                info_by_name.setdefault((group, name), (equipment, difficulty, description))
+            self.info_by_name = info_by_name
+            self.labels_by_group = labels_by_group
+
+    def labels(self, muscle_group):
+        """Returns: Az izomcsoport gyakorlatainak szövegei ("név | eszközök | nehézség")"""
+        self._load()
+        return self.labels_by_group.get(muscle_group, [])
+
+    def info(self, muscle_group, exercise_name):
+        """Returns: (szükséges eszközök, nehézségi szint, leírás) vagy None"""
+        self._load()
+        return self.info_by_name.get((muscle_group, exercise_name))
+
+    def invalidate(self):
+        """A gyorsítótár ürítése, a következő használat újratölti a katalógust."""
+        self.labels_by_group = None
+        self.info_by_name = None
@@ -0,0 +1,83 @@
+"""
+Adatbázis kapcsolatkezelő
+-------------------------
+Minden szál saját sqlite3 kapcsolatot kap, a kapcsolatok WAL módban
+(write-ahead log) nyílnak meg. WAL módban az olvasások a háttérszál
+írásaival párhuzamosan futhatnak, nem kell megvárniuk egymást.
+
+Az adatbázis előkészítése (séma ellenőrzés, migráció) az első kapcsolat
+megnyitásakor fut le egyszer, bármelyik szálon történik is az, így az
+indításkor nem kell előre megnyitni az adatbázist.
+"""
+
+import sqlite3
+import threading
+
+
+class ConnectionManager:
+    """
+    Szálankénti adatbázis kapcsolatok kezelése.
+
+    A kapcsolatot az első `connection()` hívás nyitja meg az adott szálon,
+    utána ugyanazt a kapcsolatot kapja vissza a szál minden hívásnál.
+    """
+    BUSY_TIMEOUT_MS = 5000
+    MMAP_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, db_path, prepare=None):
+        """
+        Args:
+            db_path: Az adatbázis fájl elérési útja
+            prepare: prepare(kapcsolat), az első megnyitott kapcsolattal egyszer fut le
+                     (pl. migráció), a többi szál megvárja
+        """
+        self.db_path = db_path
+        self.local = threading.local()
+        self.prepare = prepare
+        self.prepare_lock = threading.Lock()
+
+    def connection(self):
+        """
+        Az aktuális szálhoz tartozó kapcsolat lekérdezése (szükség esetén megnyitása).
+
+        Returns:
+            sqlite3.Connection
+        """
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = self._open()
+            self._prepare(connection)
+            self.local.connection = connection
+        return connection
+
+    def close(self):
+        """Az aktuális szál kapcsolatának lezárása."""
+        connection = getattr(self.local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self.local.connection = None
+
+    def _prepare(self, connection):
+        if self.prepare is None:
+            return
+        with self.prepare_lock:
+            if self.prepare is not None:
+                self.prepare(connection)
+                self.prepare = None
+
+    def _open(self):
+        """
+        Új kapcsolat megnyitása a beállításokkal:
+        - journal_mode=WAL: olvasás és írás párhuzamosan (a mód az adatbázis
+          fájlban tárolódik, csak akkor állítódik, ha még nem WAL)
+        - busy_timeout: zárolt adatbázis esetén várakozás hiba helyett
+        - synchronous=NORMAL: WAL módban biztonságos, commitonként kevesebb fsync
+        - mmap_size: memóriába leképezett olvasás
+        """
+        connection = sqlite3.connect(self.db_path, timeout=self.BUSY_TIMEOUT_MS / 1000)
+        if connection.execute("PRAGMA journal_mode").fetchone()[0].lower() != "wal":
+            connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute(f"PRAGMA busy_timeout = {self.BUSY_TIMEOUT_MS}")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute(f"PRAGMA mmap_size = {self.MMAP_SIZE}")
+        return connection
@@ -0,0 +1,206 @@
+"""
+Napi étkezés pillanatkép
+------------------------
+Egy felhasználó egy napjának étkezései egyetlen lekérdezésből
+(MealRepository.for_day). Ebből rajzolódik az étrend oldal négy
+táblázata és a kalória mérő is, így dátumváltáskor egy lekérdezés fut
+a táblázatonkénti lapok és a napi összesítő külön lekérdezése helyett.
+
+Új étel mentése után a pillanatkép a beszúrt sorokból frissül a
+memóriában (`add`), nem kell újra lekérdezni a napot.
+
+A betöltött napok egy LRU gyorsítótárba (SnapshotCache) kerülnek, így a
+napok közti oda-vissza lépkedés nem fut lekérdezést. Egy nap betöltése
+után a szomszédos napok és az adott hét többi napja a háttérben, az
+adatbázis szálon (DatabaseWorker) egyetlen lekérdezéssel előre betöltődik.
+"""
+
+import bisect
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+MEAL_TABLES = ("breakfast_table", "lunch_table", "dinner_table", "other_table")
+
+
+class DaySnapshot:
+    """
+    Egy nap étkezései étkezésenként, azonosító szerint rendezve,
+    az étkezésenkénti és a napi kalória összegekkel.
+    """
+
+    def __init__(self, user_id, date, rows=()):
+        """
+        Args:
+            user_id: A felhasználó azonosítója
+            date: A nap ("YYYY-MM-DD")
+            rows: [(id, table_name, food_name, calories, amount), ...] azonosító szerint növekvő sorrendben
+        """
+        self.user_id = user_id
+        self.date = date
+        self.meals = {table_name: [] for table_name in MEAL_TABLES}
+        self.totals = dict.fromkeys(MEAL_TABLES, 0)
+        self.ids = set()
+        for row in rows:
+            self.add(*row)
+
+    @classmethod
+    def load(cls, meals, user_id, date):
+        """
+        Pillanatkép betöltése egyetlen lekérdezéssel.
+
+        Args:
+            meals: MealRepository példány
+        """
+        return cls(user_id, date, meals.for_day(user_id, date))
+
+    def matches(self, user_id, date):
+        """Igaz, ha a pillanatkép az adott felhasználó adott napjáról készült."""
+        return self.user_id == user_id and self.date == date
+
+    @property
+    def total(self):
+        """A nap összes kalóriája."""
+        return sum(self.totals.values())
+
+    def add(self, meal_id, table_name, food_name, calories, amount):
+        """
+        Egy étkezés sor hozzáadása (a mentett sor azonosítójával).
+
+        A már szereplő azonosítójú sor nem kerül be újra (pl. ha a pillanatkép
+        a mentés után töltődött be, és már tartalmazza).
+        """
+        if meal_id in self.ids:
+            return
+        self.ids.add(meal_id)
+        rows = self.meals.setdefault(table_name, [])
+        row = (meal_id, food_name, calories, amount)
+        if rows and rows[-1][0] > meal_id:
+            bisect.insort(rows, row)
+        else:
+            rows.append(row)
+        self.totals[table_name] = self.totals.get(table_name, 0) + int(calories)
+
+    def page(self, table_name, after_id=None, before_id=None, limit=50):
+        """
+        Egy étkezés sorainak egy lapja kulcsos lapozással (a VirtualTable fetch_page formájában).
+
+        Returns:
+            [(id, food_name, calories, amount), ...] azonosító szerint növekvő sorrendben
+        """
+        rows = self.meals.get(table_name, [])
+        if before_id is not None:
+            end = bisect.bisect_left(rows, (before_id,))
+            return rows[max(end - limit, 0):end]
+        start = bisect.bisect_left(rows, ((after_id or 0) + 1,))
+        return rows[start:start + limit]
+
+
+def neighbour_dates(date):
+    """
+    Az előre betöltendő napok: az előző és a következő nap, majd a hét
+    (hétfőtől vasárnapig) többi napja.
+
+    Returns:
+        ["YYYY-MM-DD", ...] a nap nélkül, érvénytelen dátumra üres lista
+    """
+    try:
+        day = datetime.strptime(date, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return []
+    monday = day - timedelta(days=day.weekday())
+    days = [day - timedelta(days=1), day + timedelta(days=1)] + [monday + timedelta(days=n) for n in range(7)]
+    return list(dict.fromkeys(other.isoformat() for other in days if other != day))
+
+
+class SnapshotCache:
+    """
+    Napi pillanatképek LRU gyorsítótára (felhasználó, nap) szerint.
+
+    Csak a felület szálán használható; a háttérben betöltött napok a
+    DatabaseWorker callbackjén keresztül, a felület szálán kerülnek be.
+    """
+    CAPACITY = 60
+
+    def __init__(self, meals, worker, capacity=CAPACITY):
+        """
+        Args:
+            meals: MealRepository példány
+            worker: DatabaseWorker, ezen futnak az előtöltő lekérdezések
+            capacity: Legfeljebb ennyi nap marad a memóriában
+        """
+        self.meals = meals
+        self.worker = worker
+        self.capacity = capacity
+        self.snapshots = OrderedDict()
+        self.loading = set()
+
+    def get(self, user_id, date):
+        """
+        A nap pillanatképe a gyorsítótárból, ha nincs benne, betöltése.
+
+        Returns:
+            DaySnapshot
+        """
+        key = (user_id, date)
+        snapshot = self.snapshots.get(key)
+        if snapshot is None:
+            snapshot = DaySnapshot.load(self.meals, user_id, date)
+            self._store(snapshot)
+        else:
+            self.snapshots.move_to_end(key)
+        return snapshot
+
+    def add(self, user_id, date, rows):
+        """
+        Mentett étkezések beírása a gyorsítótárban lévő napba (write-through).
+
+        Ha a nap nincs a gyorsítótárban, nincs teendő: a következő
+        betöltés már az adatbázisból olvassa a sorokat.
+
+        Args:
+            rows: [(id, table_name, food_name, calories, amount), ...]
+        """
+        snapshot = self.snapshots.get((user_id, date))
+        if snapshot is not None:
+            for row in rows:
+                snapshot.add(*row)
+
+    def prefetch(self, user_id, date):
+        """
+        A szomszédos napok háttérbeli betöltése (lásd neighbour_dates).
+
+        A már betöltött vagy éppen töltődő napok kimaradnak. A lekérdezés a
+        DatabaseWorker sorába kerül, így a korábban elküldött írások után fut.
+        """
+        dates = [other for other in neighbour_dates(date)
+                 if (user_id, other) not in self.snapshots and (user_id, other) not in self.loading]
+        if not dates:
+            return
+        keys = {(user_id, other) for other in dates}
+        self.loading |= keys
+
+        def loaded(rows):
+            self.loading -= keys
+            rows_by_date = {other: [] for other in dates}
+            for row_date, *row in rows:
+                rows_by_date[row_date].append(row)
+            for other, day_rows in rows_by_date.items():
+                if (user_id, other) not in self.snapshots:
+                    self._store(DaySnapshot(user_id, other, day_rows))
+
+        def failed(_):
+            self.loading -= keys
+
+        self.worker.submit(self.meals.for_days, user_id, dates, callback=loaded, error_callback=failed)
+
+    def clear(self):
+        """Minden nap eldobása (pl. tömeges importálás után)."""
+        self.snapshots.clear()
+
+    def _store(self, snapshot):
+        self.snapshots[(snapshot.user_id, snapshot.date)] = snapshot
+        while len(self.snapshots) > self.capacity:
+            self.snapshots.popitem(last=False)
+
+    def __len__(self):
+        return len(self.snapshots)
@@ -0,0 +1,163 @@
+"""
+Adatbázis író szál
+------------------
+Az írási műveletek (INSERT, UPDATE, DELETE) egy külön szálon futnak,
+saját adatbázis kapcsolattal, így a commit (és a lemezre írás) nem
+akasztja meg a Tk eseményhurkot.
+
+A műveletek egy sorba kerülnek, a szál sorrendben hajtja végre őket.
+A szál az első műveletnél nyitja meg a kapcsolatát.
+Egy művelet általában egy repository író metódusa, ami a háttérszálon
+a szál saját kapcsolatát használja (ConnectionManager).
+Az eredményt (vagy a hibát) a felület szálán, `root.after` segítségével
+kapja meg a hívó a callback függvényen keresztül.
+
+Csoportos commit: a szál egyszerre kiveszi a sorból az összes várakozó
+műveletet (legfeljebb MAX_BATCH darabot), és egyetlen tranzakcióban,
+egyetlen commit-tal írja ki őket. Minden művelet saját SAVEPOINT-ot kap,
+így egy hibás művelet csak a saját változásait görgeti vissza.
+"""
+
+import queue
+import threading
+
+
+class DatabaseWorker:
+    """
+    Háttérszál, ami egy sorból veszi az írási műveleteket.
+
+    A sorban egyszerre várakozó műveletek közös tranzakcióban futnak:
+    a köteg végén egy commit, hibás művelet esetén csak annak a
+    változásai görgetődnek vissza. A callback és error_callback
+    függvények a felület szálán hívódnak meg.
+    """
+    POLL_INTERVAL = 20
+    MAX_BATCH = 100
+
+    def __init__(self, root, db, error_handler=None):
+        """
+        Args:
+            root: A Tk főablak (a callbackek ütemezéséhez)
+            db: ConnectionManager, ebből kapja a szál a saját kapcsolatát
+            error_handler: Alapértelmezett hibakezelő, ha a műveletnek nincs error_callbackje
+        """
+        self.root = root
+        self.db = db
+        self.error_handler = error_handler
+        self.tasks = queue.Queue()
+        self.results = queue.Queue()
+        self.pending = 0
+        self.poll_id = None
+        self.thread = threading.Thread(target=self._run, name="MyFitPlan-db-worker", daemon=True)
+        self.thread.start()
+
+    def submit(self, operation, *args, callback=None, error_callback=None):
+        """
+        Művelet sorba állítása.
+
+        Args:
+            operation: Függvény, amit a szál `operation(*args)` formában hív meg
+            callback: A felület szálán hívódik a művelet visszatérési értékével
+            error_callback: A felület szálán hívódik a kivétellel, ha a művelet sikertelen
+        """
+        self.pending += 1
+        self.tasks.put((operation, args, callback, error_callback))
+        self._schedule_poll()
+
+    def flush(self):
+        """
+        Megvárja, amíg minden sorban álló művelet lefut,
+        majd a felület szálán kiosztja az eredményeket.
+        """
+        self.tasks.join()
+        self._dispatch_results()
+
+    def stop(self):
+        """A sor kiürítése és a szál leállítása (kilépéskor hívandó)."""
+        if not self.thread.is_alive():
+            return
+        self.tasks.put(None)
+        self.thread.join()
+        self._dispatch_results()
+        if self.poll_id is not None:
+            self.root.after_cancel(self.poll_id)
+            self.poll_id = None
+
+    def _run(self):
+        connection = None
+        try:
+            running = True
+            while running:
+                batch = self._next_batch()
+                running = None not in batch
+                tasks = [task for task in batch if task is not None]
+                if tasks and connection is None:
+                    connection = self.db.connection()
+                for result in self._run_batch(connection, tasks):
+                    self.results.put(result)
+                for _ in batch:
+                    self.tasks.task_done()
+        finally:
+            self.db.close()
+
+    def _next_batch(self):
+        """Vár az első műveletre, majd hozzáveszi a sorban már várakozókat is."""
+        batch = [self.tasks.get()]
+        while batch[-1] is not None and len(batch) < self.MAX_BATCH:
+            try:
+                batch.append(self.tasks.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run_batch(self, connection, tasks):
+        """
+        Műveletek végrehajtása egy tranzakcióban.
+
+        Returns:
+            [(callback, érték), ...] a műveletek sorrendjében
+        """
+        if not tasks:
+            return []
+
+        results = []
+        connection.execute("BEGIN")
+        for operation, args, callback, error_callback in tasks:
+            connection.execute("SAVEPOINT task")
+            try:
+                result = operation(*args)
+            except Exception as error:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK TO task")
+                    connection.execute("RELEASE task")
+                results.append((error_callback or self.error_handler, error))
+            else:
+                connection.execute("RELEASE task")
+                results.append((callback, result))
+
+        try:
+            connection.commit()
+        except Exception as error:
+            connection.rollback()
+            return [(error_callback or self.error_handler, error) for _, _, _, error_callback in tasks]
+        return results
+
+    def _schedule_poll(self):
+        if self.poll_id is None:
+            self.poll_id = self.root.after(self.POLL_INTERVAL, self._poll)
+
+    def _poll(self):
+        self.poll_id = None
+        self._dispatch_results()
+        if self.pending > 0:
+            self._schedule_poll()
+
+    def _dispatch_results(self):
+        while True:
+            try:
+                callback, value = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            if callback:
+                callback(value)
@@ -0,0 +1,119 @@
+"""
+Felugró ablakok
+---------------
+Az alkalmazás felugró ablakai (üzenetablak, étel és gyakorlat hozzáadása,
+új nap, törlés megerősítése) típusonként egyszer épülnek fel. Bezáráskor
+nem semmisülnek meg, csak elrejtődnek (withdraw), a következő megnyitáskor
+alaphelyzetbe állnak és újra megjelennek.
+
+A pozíció a képernyő közepére egyszer, a megadott méretből számolódik,
+így megnyitáskor nincs szükség `update_idletasks()` hívásra. A widgetek
+és a `register`-rel létrehozott Tcl parancsok (validatecommand) is csak
+egyszer jönnek létre.
+"""
+
+import ttkbootstrap as ttk
+
+
+class Dialog:
+    """
+    Egy újrahasznosítható felugró ablak.
+
+    Az ablak widgetjeit a DialogPool-nak átadott build függvény hozza létre
+    a `window`-ba, és az `on_reset` függvénnyel állíthatja be, hogyan kerüljön
+    alaphelyzetbe az ablak minden megnyitás előtt. Az `on_hide` függvény
+    a látható ablak elrejtése után hívódik (bármilyen módon zárul is be).
+    """
+    def __init__(self, root, title, width, height, modal=False):
+        """
+        Args:
+            root: A Tk főablak
+            title: Az ablak címe
+            width, height: Az ablak mérete (a pozíció ebből számolódik)
+            modal: Megnyitáskor elkapja-e az egér és billentyűzet eseményeket (grab)
+        """
+        self.root = root
+        self.modal = modal
+        self.previous_grab = None
+        self.on_reset = None
+        self.on_hide = None
+        self.visible = False
+        self.window = ttk.Toplevel(root)
+        self.window.withdraw()
+        self.window.title(title)
+        x = root.winfo_screenwidth() // 2 - width // 2
+        y = root.winfo_screenheight() // 2 - height // 2
+        self.geometry = f"{width}x{height}+{x}+{y}"
+        self.window.geometry(self.geometry)
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
+
+    def show(self, *args):
+        """
+        Az ablak alaphelyzetbe állítása (on_reset(*args)) és megjelenítése.
+        """
+        if self.on_reset:
+            self.on_reset(*args)
+        self.window.geometry(self.geometry)
+        self.window.deiconify()
+        self.window.lift()
+        self.visible = True
+        if self.modal:
+            self.previous_grab = self.window.grab_current()
+            self.window.grab_set()
+
+    def hide(self):
+        """Az ablak elrejtése, a korábbi grab visszaadása."""
+        if self.modal:
+            self.window.grab_release()
+            previous, self.previous_grab = self.previous_grab, None
+            if previous is not None and previous is not self.window and previous.winfo_viewable():
+                previous.grab_set()
+        self.window.withdraw()
+        if self.visible:
+            self.visible = False
+            if self.on_hide:
+                self.on_hide()
+
+    def exists(self):
+        return bool(self.window.winfo_exists())
+
+
+class DialogPool:
+    """
+    A felépített felugró ablakok név szerint.
+    """
+    def __init__(self, root):
+        """
+        Args:
+            root: A Tk főablak, az ablakok ennek a gyerekei
+        """
+        self.root = root
+        self.dialogs = {}
+
+    def get(self, name, title, width, height, build, modal=False):
+        """
+        Ablak lekérése, első kéréskor létrehozása.
+
+        Args:
+            name: Az ablak típusa (pl. "add_food")
+            title, width, height, modal: Lásd Dialog
+            build: build(dialog), a widgetek létrehozása dialog.window-ba
+
+        Returns:
+            Dialog
+        """
+        dialog = self.dialogs.get(name)
+        if dialog is None or not dialog.exists():
+            dialog = Dialog(self.root, title, width, height, modal)
+            build(dialog)
+            self.dialogs[name] = dialog
+        return dialog
+
+    def owns(self, widget):
+        """Igaz, ha a widget a tárolt ablakok egyike."""
+        return any(dialog.window is widget for dialog in self.dialogs.values())
+
+    def hide_all(self):
+        for dialog in self.dialogs.values():
+            if dialog.exists():
+                dialog.hide()
@@ -1,6 +1,21 @@
 import ttkbootstrap as ttk
 from datetime import datetime
-import re
+from app.catalog import food_label, food_calories
+from app.virtual_table import virtual_table
+from app.table_sync import pending_iid
+from app.day_snapshot import SnapshotCache
+from app.trend_chart import TrendChart
+
+def load_trends(meals, user_id):
+    """
+    A felhasználó kalória trendjeinek betöltése az adatbázis háttérszálán.
+    Az app.analytics (és vele a NumPy) is itt, a felület szálán kívül töltődik be először.
+
+    Returns:
+        MealTrends
+    """
+    from app.analytics import MealTrends
+    return MealTrends.load(meals, user_id)
 
 class DietManager:
     def __init__(self, app):
@@ -14,24 +29,38 @@ class DietManager:
         self.food_input = None
         self.custom_food_entry = None
         self.amount_label = None
+        self.food_options = []
+        self.target_table = None
+        self.snapshot = None
+        self.snapshots = SnapshotCache(app.meals, app.db_worker)
+        self.trend_chart = None
+        self.trends = None
+        self.trends_loading = None
 
     def add_food(self, target_table):
-        """Étel hozzáadása funkció"""
-        popup = ttk.Toplevel()
-        popup.title("Étel hozzáadása")
-        popup.geometry("860x200")
-        
-        popup.update_idletasks()
-        width = popup.winfo_width()
-        height = popup.winfo_height()
-        x = (popup.winfo_screenwidth() // 2) - (width // 2)
-        y = (popup.winfo_screenheight() // 2) - (height // 2)
-        popup.geometry(f"{width}x{height}+{x}+{y}")
-
-        self.app.db_cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        table_names = [row[0] for row in self.app.db_cursor.fetchall() if row[0] in ['Alkoholos italok', 'Gabonafélék és hüvelyesek', 'Gyümölcsök', 
-                      'Halfélék', 'Húsfélék', 'Italok', 'Olajok', 'Szénhidrátok', 'Tejtermékek és tojások', 'Zöldségek']]
-        table_names.append("Egyéni")
+        """
+        Étel hozzáadása funkció.
+
+        A "Listához" gombbal több étel is összegyűjthető, a "Hozzáadás"
+        gomb ezeket (és a kitöltött ételt) egyszerre, egy tranzakcióban menti.
+
+        Az ablak egyszer épül fel (build_food_dialog), megnyitáskor csak
+        alaphelyzetbe áll.
+
+        Args:
+            target_table: Az étkezés táblázata, amihez az ételek kerülnek
+        """
+        dialog = self.app.dialogs.get("add_food", "Étel hozzáadása", 860, 420, self.build_food_dialog)
+        dialog.show(target_table)
+
+    def build_food_dialog(self, dialog):
+        """
+        Az étel hozzáadása ablak widgetjeinek létrehozása.
+
+        Args:
+            dialog: A DialogPool által létrehozott Dialog
+        """
+        popup = dialog.window
 
         ttk.Label(popup,
                   text="Típus",
@@ -40,7 +69,7 @@ class DietManager:
         meal_type_var = ttk.StringVar(popup)
         meal_type_input = ttk.Combobox(popup,
                                        textvariable=meal_type_var,
-                                       values=table_names,
+                                       values=[],
                                        state="readonly",
                                        font=("Colibri", 18),
                                        bootstyle="warning",
@@ -95,7 +124,7 @@ class DietManager:
                     self.app.custom_messagebox("Hiányzó adatok", "Kérlek, adj meg egy érvényes kalória értéket!")
                     return False
             else:
-                if not food_var.get():
+                if self.selected_food() is None:
                     self.app.custom_messagebox("Hiányzó adatok", "Kérlek, válassz egy ételt!")
                     return False
                 if not amount_input.get().isdigit() or int(amount_input.get()) <= 0:
@@ -104,44 +133,95 @@ class DietManager:
             return True
 
         meal_type_input.bind("<<ComboboxSelected>>", lambda event: self.load_food_options(event, meal_type_var))
+        self.food_input.bind("<KeyRelease>", lambda event: self.search_food_options(event, meal_type_var))
 
-        def add_selected_food():
+        pending_foods = []
+
+        def read_selected_food():
             if not validate_inputs():
-                return
+                return None
 
             selected_table = meal_type_var.get()
             amount = amount_input.get()
 
             if selected_table == "Egyéni":
-                food_name = self.custom_food_entry.get()
-                calories = int(amount)
-                amount_to_save = 0
-            else:
-                selected_food = food_var.get()
-                last_parenthesis_index = selected_food.rfind('(')
-                food_name = selected_food[:last_parenthesis_index].strip()
-                calories_text = re.search(r'\((.*?)\)', selected_food[last_parenthesis_index:])
-                calories_per_100 = int(calories_text.group(1).split()[0])
-                calories = round((calories_per_100 / 100 * int(amount)))
-                amount_to_save = int(amount)
+                return None, self.custom_food_entry.get(), int(amount), 0
+
+            food = self.selected_food()
+            return food.id, food.name, food_calories(food, int(amount)), int(amount)
+
+        def food_filled():
+            if meal_type_var.get() == "Egyéni":
+                return bool(self.custom_food_entry.get())
+            return bool(food_var.get())
+
+        def add_to_list():
+            food = read_selected_food()
+            if food is None:
+                return
+
+            pending_foods.append(food)
+            pending_table.insert("", "end", values=(food[1], f"{food[2]} kcal", food[3]))
+            food_var.set("")
+            self.custom_food_entry.delete(0, "end")
+            amount_input.delete(0, "end")
+
+        def add_selected_food():
+            foods = list(pending_foods)
+            if not foods or food_filled():
+                food = read_selected_food()
+                if food is None:
+                    return
+                foods.append(food)
 
-            target_table.insert("", "end", values=(food_name, f"{calories} kcal", amount_to_save))
+            target_table = self.target_table
+            items = [target_table.insert("", "end", iid=pending_iid(), values=(food_name, f"{calories} kcal", amount_to_save))
+                     for _, food_name, calories, amount_to_save in foods]
 
             selected_date = self.app.date_entry.entry.get()
-            
-            self.app.db_cursor.execute("""
-                INSERT INTO users_meals (user_id, table_name, food_name, calories, amount, date)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (self.app.user_id, 
-                  "breakfast_table" if target_table == self.app.breakfast_table else 
-                  "lunch_table" if target_table == self.app.lunch_table else 
-                  "dinner_table" if target_table == self.app.dinner_table else 
-                  "other_table", 
-                  food_name, calories, amount_to_save, selected_date))
-
-            self.app.db_connection.commit()
-            self.update_meter()
-            popup.destroy()
+            table_name = ("breakfast_table" if target_table == self.app.breakfast_table else 
+                          "lunch_table" if target_table == self.app.lunch_table else 
+                          "dinner_table" if target_table == self.app.dinner_table else 
+                          "other_table")
+
+            def undo_insert(error):
+                for item in items:
+                    if target_table.exists(item):
+                        target_table.delete(item)
+                self.app.database_error(error)
+
+            user_id = self.app.user_id
+
+            def saved(meal_ids):
+                rows = [(meal_id, table_name, food_name, calories, amount_to_save)
+                        for meal_id, (_, food_name, calories, amount_to_save) in zip(meal_ids, foods)]
+                self.snapshots.add(user_id, selected_date, rows)
+                self.app.calorie_history.invalidate(user_id, selected_date)
+                self.trends = None
+                self.app.scheduler.schedule("diet_chart", self.draw_trend_chart)
+                snapshot = self.snapshot
+                if snapshot is None or not snapshot.matches(user_id, selected_date):
+                    return
+                for row in rows:
+                    snapshot.add(*row)
+                self.app.scheduler.schedule(f"diet_table:{table_name}", virtual_table(target_table).refresh)
+                self.app.scheduler.schedule("diet_meter", self.update_meter)
+
+            self.app.db_worker.submit(self.app.meals.add_many,
+                                      [(self.app.user_id, table_name, food_name, calories, amount_to_save, selected_date, food_id)
+                                       for food_id, food_name, calories, amount_to_save in foods],
+                                      callback=saved,
+                                      error_callback=undo_insert)
+
+            dialog.hide()
+
+        list_button = ttk.Button(popup,
+                                 text="Listához",
+                                 style="darkbutton.TButton",
+                                 command=add_to_list,
+                                 cursor="hand2",
+                                 takefocus=False)
+        list_button.grid(row=3, column=0, pady=30)
 
         add_button = ttk.Button(popup,
                                 text="Hozzáadás",
@@ -151,10 +231,41 @@ class DietManager:
                                 takefocus=False)
         add_button.grid(row=3, column=1, pady=30)
 
-        popup.protocol("WM_DELETE_WINDOW", popup.destroy)
+        pending_table = ttk.Treeview(popup,
+                                     columns=("Étel", "Kcal", "g/ml"),
+                                     show="headings",
+                                     height=5,
+                                     style="Custom.Treeview")
+        for col in ("Étel", "Kcal", "g/ml"):
+            pending_table.heading(col, text=col, anchor="center")
+            pending_table.column(col, anchor="center")
+        pending_table.grid(row=4, column=0, columnspan=3, padx=30, sticky="ew")
+
+        def reset(target_table):
+            self.target_table = target_table
+            meal_type_input['values'] = ["Keresés"] + self.app.food_catalog.categories() + ["Egyéni"]
+            meal_type_var.set("")
+            food_var.set("")
+            self.food_options = []
+            self.food_input.configure(state="readonly")
+            self.food_input['values'] = []
+            self.food_input.grid()
+            self.custom_food_entry.delete(0, "end")
+            self.custom_food_entry.grid_remove()
+            self.amount_label.configure(text="Mennyiség (g/ml)")
+            amount_input.delete(0, "end")
+            pending_foods.clear()
+            pending_table.delete(*pending_table.get_children())
+
+        dialog.on_reset = reset
 
     def load_food_options(self, event, meal_type_var):
-        """Étel opciók betöltése"""
+        """
+        Étel opciók betöltése.
+
+        A "Keresés" típusnál az étel mező szerkeszthetővé válik, és
+        minden leütésre szűkül a találati lista (search_food_options).
+        """
         selected_table = meal_type_var.get()
         if selected_table == "Egyéni":
             self.food_input.grid_remove()
@@ -164,11 +275,43 @@ class DietManager:
             self.custom_food_entry.grid_remove()
             self.food_input.grid()
             self.amount_label.configure(text="Mennyiség (g/ml)")
-            if selected_table:
-                unit = "ml" if selected_table in ["Italok", "Alkoholos italok"] else "g"
-                self.app.db_cursor.execute(f'SELECT Név, Kalória FROM "{selected_table}";')
-                foods = [f"{row[0]} ({row[1]} kcal/100{unit})" for row in self.app.db_cursor.fetchall()]
-                self.food_input['values'] = foods
+            if selected_table == "Keresés":
+                self.food_input.configure(state="normal")
+                self.food_options = []
+                self.food_input['values'] = []
+            elif selected_table:
+                self.food_input.configure(state="readonly")
+                self.food_options = self.app.food_catalog.foods(selected_table)
+                self.food_input['values'] = self.app.food_catalog.labels(selected_table)
+
+    def search_food_options(self, event, meal_type_var):
+        """
+        Gépelés közbeni keresés az összes étel kategóriában.
+
+        A keresés a katalógus gyorsítótár prefix indexét használja (FoodIndex).
+        Enter lenyomására a találati lista le is nyílik. Ha a mezőben már
+        egy kiválasztott találat szövege áll, a lista nem változik.
+        """
+        if meal_type_var.get() != "Keresés":
+            return
+        if self.selected_food() is not None:
+            return
+        self.food_options = self.app.food_catalog.index().search(self.food_input.get())
+        self.food_input['values'] = [food_label(food) for food in self.food_options]
+        if event is not None and event.keysym == "Return":
+            self.food_input.event_generate("<Down>")
+
+    def selected_food(self):
+        """
+        A legördülő listában kiválasztott étel.
+
+        Returns:
+            Food, vagy None ha nincs a listából kiválasztott elem
+        """
+        index = self.food_input.current()
+        if 0 <= index < len(self.food_options):
+            return self.food_options[index]
+        return None
 
     def diet_page(self):
         """
@@ -179,46 +322,38 @@ class DietManager:
         - Dátumválasztó a napi étkezések megtekintéséhez
         - Négy étkezési kategória (reggeli, ebéd, vacsora, egyéb)
         - Étkezések hozzáadása gomb minden kategóriához
+        - Kalória trend grafikon (utolsó 30 nap, 7 napos átlag, napi keret)
         
         A kalória mérő színe változik a napi limit függvényében:
         - Világos lila: kevesebb mint 75%
         - Narancssárga: 75-100% között
         - Piros: 100% felett
-        """
-        self.app.clear_screen()
-        self.app.load_navigation_bar()
 
-        self.app.db_cursor.execute(
-            'SELECT eletkor, magassag, testsuly, nem, aktivitas FROM users WHERE email = ?', 
-            (self.app.logged_in_user,))
-        
-        user_data = self.app.db_cursor.fetchone()
+        Az oldal bejelentkezésenként egyszer épül fel (build_diet_page),
+        ismételt megjelenítéskor csak az adatai frissülnek (refresh_diet_page).
+        """
+        self.app.show_screen("diet", self.build_diet_page, self.refresh_diet_page)
 
-        if user_data:
-            eletkor, magassag, testsuly, nem, aktivitas = user_data
-            
-            if nem == "Férfi":
-                bmr = 10 * int(testsuly) + 6.25 * int(magassag) - 5 * int(eletkor) + 5
-            elif nem == "Nő":
-                bmr = 10 * int(testsuly) + 6.25 * int(magassag) - 5 * int(eletkor) - 161
-            
-            self.app.tdee = bmr * self.app.activity_factors.get(aktivitas)
+    def build_diet_page(self, screen):
+        """
+        Az étrend oldal widgetjeinek létrehozása a képernyő keretében.
 
-        self.app.meter = ttk.Meter(master=self.app.root,
+        Args:
+            screen: A ScreenManager által létrehozott keret
+        """
+        self.app.meter = ttk.Meter(master=screen,
                                    bootstyle="primary",
-                                   subtext=f"Napi max kcal: {int(self.app.tdee)} ",
                                    textfont="Colibri 20",
                                    subtextfont="Colibri 20",
                                    stripethickness=10,
-                                   metersize=350,
-                                   amounttotal=int(self.app.tdee))
+                                   metersize=350)
         self.app.meter.place(relx=0.5, rely=0.55, anchor="center")
 
         box_width = 0.25
         box_height = 0.25
         name_box_height = 0.05
         
-        self.app.date_select_frame = ttk.Frame(self.app.root)
+        self.app.date_select_frame = ttk.Frame(screen)
         self.app.date_select_frame.place(relx=0.375,
                                  rely=0.21,
                                  relwidth=box_width,
@@ -234,33 +369,28 @@ class DietManager:
                                             firstweekday=0)
         date_select_box.add(self.app.date_entry)
 
-        def update_button_click():
-            selected_date = self.app.date_entry.entry.get()
-            self.load_user_meals(selected_date)
-            self.update_meter()
-
         update_button = ttk.Button(self.app.date_select_frame,
                                    text="Lekérdezés",
-                                   command=update_button_click,
+                                   command=self.schedule_show_day,
                                    style="darkbutton.TButton",
                                    cursor="hand2",
                                    takefocus=False)
         date_select_box.add(update_button)
 
 
-        self.app.box1 = ttk.Frame(self.app.root,
+        self.app.box1 = ttk.Frame(screen,
                                   style="Frameborder.TFrame",
                                   relief="solid",
                                   borderwidth=1)
         self.app.box1.place(relx=0.05, rely=0.27, relwidth=box_width, relheight=box_height)
 
-        self.app.box2 = ttk.Frame(self.app.root, style="Frameborder.TFrame", relief="solid", borderwidth=1)
+        self.app.box2 = ttk.Frame(screen, style="Frameborder.TFrame", relief="solid", borderwidth=1)
         self.app.box2.place(relx=0.05,
                             rely=0.67,
                             relwidth=box_width,
                             relheight=box_height)
 
-        self.app.box3 = ttk.Frame(self.app.root,
+        self.app.box3 = ttk.Frame(screen,
                                   style="Frameborder.TFrame",
                                   relief="solid",
                                   borderwidth=1)
@@ -269,7 +399,7 @@ class DietManager:
                             relwidth=box_width,
                             relheight=box_height)
 
-        self.app.box4 = ttk.Frame(self.app.root,
+        self.app.box4 = ttk.Frame(screen,
                                   style="Frameborder.TFrame",
                                   relief="solid",
                                   borderwidth=1)
@@ -317,15 +447,11 @@ class DietManager:
         self.app.dinner_table = create_table(self.app.box3, columns, data_dinner)
         self.app.other_table = create_table(self.app.box4, columns, data_other)
 
-        self.load_user_meals()
-
-        self.update_meter()
-
         box_width = 0.25
         box_height = 0.25
         name_box_height = 0.05
 
-        self.app.boxname1 = ttk.Frame(self.app.root,
+        self.app.boxname1 = ttk.Frame(screen,
                                       style="Frameborder.TFrame",
                                       relief="solid",
                                       borderwidth=1)
@@ -335,7 +461,7 @@ class DietManager:
                   anchor="center",
                   style="meals.TLabel").pack(expand=True)
 
-        self.app.boxname2 = ttk.Frame(self.app.root,
+        self.app.boxname2 = ttk.Frame(screen,
                                       style="Frameborder.TFrame",
                                       relief="solid",
                                       borderwidth=1)
@@ -345,7 +471,7 @@ class DietManager:
                   anchor="center",
                   style="meals.TLabel").pack(expand=True)
 
-        self.app.boxname3 = ttk.Frame(self.app.root,
+        self.app.boxname3 = ttk.Frame(screen,
                                       style="Frameborder.TFrame",
                                       relief="solid",
                                       borderwidth=1)
@@ -355,7 +481,7 @@ class DietManager:
                   anchor="center",
                   style="meals.TLabel").pack(expand=True)
 
-        self.app.boxname4 = ttk.Frame(self.app.root,
+        self.app.boxname4 = ttk.Frame(screen,
                                       style="Frameborder.TFrame",
                                       relief="solid",
                                       borderwidth=1)
@@ -401,6 +527,93 @@ class DietManager:
                                      command=lambda: self.add_food(self.app.other_table))
         details_button4.place(relx=0.985, rely=0.5, anchor="e")
 
+        chart_frame = ttk.Frame(screen,
+                                style="Frameborder.TFrame",
+                                relief="solid",
+                                borderwidth=1)
+        chart_frame.place(relx=0.5, rely=0.86, anchor="center", relwidth=0.36, relheight=0.14)
+
+        trend_label = ttk.Label(chart_frame,
+                                text="",
+                                anchor="center",
+                                font=("Colibri", 11),
+                                style="meals.TLabel")
+        trend_label.pack(fill="x")
+
+        trend_canvas = ttk.Canvas(chart_frame,
+                                  background="#09053a",
+                                  highlightthickness=0)
+        trend_canvas.pack(expand=True, fill="both", padx=2, pady=(0, 2))
+        trend_canvas.bind("<Configure>", lambda event: self.app.scheduler.schedule("diet_chart", self.draw_trend_chart))
+
+        self.trend_chart = TrendChart(trend_canvas, trend_label)
+
+    def refresh_diet_page(self):
+        """
+        Az étrend oldal adatainak frissítése megjelenítéskor.
+
+        Újraszámolja a napi kalória keretet (TDEE) a felhasználó aktuális
+        adataiból (a profil közben módosulhatott), majd ütemezi a
+        dátumválasztóban kiválasztott nap étkezéseinek és a mérő
+        állásának kirajzolását (schedule_show_day).
+        """
+        user_data = self.app.users.body_data(self.app.logged_in_user)
+
+        if user_data:
+            eletkor, magassag, testsuly, nem, aktivitas = user_data
+            
+            if nem == "Férfi":
+                bmr = 10 * int(testsuly) + 6.25 * int(magassag) - 5 * int(eletkor) + 5
+            elif nem == "Nő":
+                bmr = 10 * int(testsuly) + 6.25 * int(magassag) - 5 * int(eletkor) - 161
+            
+            self.app.tdee = bmr * self.app.activity_factors.get(aktivitas)
+
+        self.app.meter.configure(subtext=f"Napi max kcal: {int(self.app.tdee)} ",
+                                 amounttotal=int(self.app.tdee))
+
+        self.schedule_show_day()
+
+    def schedule_show_day(self):
+        """
+        A kiválasztott nap kirajzolásának ütemezése a következő üresjáratra.
+        Az egymás utáni kérések (pl. gyors kattintások) egy kirajzolássá
+        vonódnak össze.
+        """
+        self.app.scheduler.schedule("diet_day", self.show_day)
+
+    def show_day(self):
+        """A dátumválasztóban kiválasztott nap étkezéseinek, a mérőnek és a trend grafikonnak a kirajzolása."""
+        self.load_user_meals(self.app.date_entry.entry.get())
+        self.update_meter()
+        self.draw_trend_chart()
+
+    def draw_trend_chart(self):
+        """
+        A trend grafikon kirajzolása a kiválasztott napig.
+
+        A trendek (MealTrends) a felhasználó összes naplózott napjából
+        egyszer, a háttérszálon töltődnek be, betöltés után a grafikon
+        újrarajzolódik. Étel mentésekor a trendek újratöltődnek.
+        """
+        user_id = self.app.user_id
+        if self.trends is None or self.trends[0] != user_id:
+            if self.trends_loading != user_id:
+                self.trends_loading = user_id
+
+                def loaded(trends):
+                    self.trends_loading = None
+                    if self.app.user_id == user_id:
+                        self.trends = (user_id, trends)
+                        self.app.scheduler.schedule("diet_chart", self.draw_trend_chart)
+
+                def failed(error):
+                    self.trends_loading = None
+
+                self.app.db_worker.submit(load_trends, self.app.meals, user_id,
+                                          callback=loaded, error_callback=failed)
+            return
+        self.trend_chart.draw(self.trends[1], self.app.date_entry.entry.get(), self.app.tdee)
 
     def load_user_meals(self, selected_date=None):
         """
@@ -416,50 +629,52 @@ class DietManager:
 
         Az "egyéni" kategóriába saját, előre nem definiált ételeket lehet hozzáadni.
         A kalóriát manuálisan kell megadni, a mennyiség pedig ebben az esetben mindíg 0.
+
+        A nap étkezései egyetlen lekérdezéssel egy DaySnapshot-ba kerülnek,
+        ebből rajzolódnak a táblázatok és a kalória mérő is (update_meter).
+        A napok gyorsítótárban maradnak, a szomszédos napok a háttérben
+        előre betöltődnek, így a dátumok közti lépkedés nem fut lekérdezést.
+        A táblázatok lapozva töltődnek (VirtualTable), a sorok az étkezés
+        azonosítójával szerepelnek, így frissítéskor csak a megváltozott
+        sorok íródnak át.
         """
         if not selected_date:
             selected_date = datetime.now().strftime("%Y-%m-%d")
 
+        tables = {"breakfast_table": self.app.breakfast_table,
+                  "lunch_table": self.app.lunch_table,
+                  "dinner_table": self.app.dinner_table,
+                  "other_table": self.app.other_table}
 
-        for table in [self.app.breakfast_table, self.app.lunch_table, self.app.dinner_table, self.app.other_table]:
-            table.delete(*table.get_children())
+        user_id = self.app.user_id
+        snapshot = self.snapshots.get(user_id, selected_date)
+        self.snapshot = snapshot
+        for table_name, table in tables.items():
+            def fetch_page(after_id, before_id, limit, table_name=table_name):
+                return [(meal_id, food_name, f"{calories} kcal", amount)
+                        for meal_id, food_name, calories, amount
+                        in snapshot.page(table_name, after_id, before_id, limit)]
 
-        self.app.db_cursor.execute("""SELECT table_name, food_name, calories, amount FROM users_meals WHERE user_id = ? AND date = ?""",
-                                  (self.app.user_id, selected_date))
-        meals = self.app.db_cursor.fetchall()
+            virtual_table(table).load((user_id, selected_date, table_name), fetch_page)
 
-        for meal in meals:
-            table_name, food_name, calories, amount = meal
-            if table_name == "breakfast_table":
-                self.app.breakfast_table.insert("", "end", values=(food_name, f"{calories} kcal", amount))
-            elif table_name == "lunch_table":
-                self.app.lunch_table.insert("", "end", values=(food_name, f"{calories} kcal", amount))
-            elif table_name == "dinner_table":
-                self.app.dinner_table.insert("", "end", values=(food_name, f"{calories} kcal", amount))
-            else:
-                self.app.other_table.insert("", "end", values=(food_name, f"{calories} kcal", amount))
+        self.snapshots.prefetch(user_id, selected_date)
 
 
     def update_meter(self):
         """
         Kalória mérő widget frissítése.
         
-        Kiszámítja az adott napra bevitt összes kalóriát,
-        és frissíti a mérő megjelenítését:
+        Az adott napra bevitt összes kalóriát a load_user_meals által
+        betöltött DaySnapshot-ból veszi (ha még nincs betöltve a napra,
+        a gyorsítótárból kéri), és frissíti a mérő megjelenítését:
         - Beállítja az aktuális értéket
         - Módosítja a színt az értékek alapján
         """
         selected_date = self.app.date_entry.entry.get()
-        total_calories = 0
-
-        self.app.db_cursor.execute("""SELECT user_id, calories, date FROM users_meals WHERE user_id = ? AND date = ?""",
-                                  (self.app.user_id, selected_date))
-        rows = self.app.db_cursor.fetchall()
 
-        for row in rows:
-            calories_str = row[1]
-            calories = int(calories_str)
-            total_calories += calories
+        if self.snapshot is None or not self.snapshot.matches(self.app.user_id, selected_date):
+            self.snapshot = self.snapshots.get(self.app.user_id, selected_date)
+        total_calories = self.snapshot.total
 
         self.app.meter.configure(amountused=total_calories)
 
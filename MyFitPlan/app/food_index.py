@@ -0,0 +1,99 @@
+"""
+Étel kereső index
+-----------------
+Memóriában tartott, szó eleji (prefix) kereső index az étel katalógushoz.
+Az index egyszer épül fel a katalógusból, utána minden leütésnél csak
+egy bináris keresés és a találati tartomány bejárása történik.
+
+A keresés ékezetfüggetlen: a nevek és a keresett szöveg is kisbetűsítve,
+ékezetek nélkül kerül összehasonlításra ("baran" -> "bárány", "ozg" -> "őzgerinc").
+"""
+
+import bisect
+import unicodedata
+
+
+def fold(text):
+    """
+    Szöveg kisbetűsítése és az ékezetek eltávolítása.
+
+    Args:
+        text: A szöveg (pl. "Bárány")
+
+    Returns:
+        str: Az összehasonlításra használt alak (pl. "barany")
+    """
+    decomposed = unicodedata.normalize("NFD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def _words(text):
+    return [word.strip("()[],.%") for word in fold(text).split() if word.strip("()[],.%")]
+
+
+class FoodIndex:
+    """
+    Prefix index az ételek neveinek szavaira.
+
+    Az index egy rendezett (szó, étel sorszám) lista, a keresés
+    a `bisect` modullal találja meg a prefixhez tartozó tartományt.
+    """
+    MAX_RESULTS = 50
+
+    def __init__(self, foods):
+        """
+        Args:
+            foods: [Food, ...] a teljes katalógus (bármi, aminek van name mezője)
+        """
+        self.foods = list(foods)
+        self.food_words = [_words(food.name) for food in self.foods]
+        entries = sorted((word, number)
+                         for number, words in enumerate(self.food_words)
+                         for word in set(words))
+        self.keys = [word for word, _ in entries]
+        self.numbers = [number for _, number in entries]
+
+    def search(self, text, limit=MAX_RESULTS):
+        """
+        Ételek keresése a név szavainak eleje alapján.
+
+        Több szó esetén minden szónak egyeznie kell a név valamelyik
+        szavának elejével. A találatok a leghosszabb keresett szóra
+        illeszkedő névszó szerint, betűrendben érkeznek.
+
+        Args:
+            text: A beírt szöveg
+            limit: Legfeljebb ennyi találat
+
+        Returns:
+            [Food, ...]
+        """
+        terms = _words(text)
+        if not terms:
+            return []
+
+        first = max(terms, key=len)
+        allowed = None
+        for term in terms:
+            if term is not first:
+                numbers = set(self.numbers[slice(*self._range(term))])
+                allowed = numbers if allowed is None else allowed & numbers
+
+        results = []
+        seen = set()
+        for number in self.numbers[slice(*self._range(first))]:
+            if number in seen or (allowed is not None and number not in allowed):
+                continue
+            seen.add(number)
+            results.append(self.foods[number])
+            if len(results) >= limit:
+                break
+        return results
+
+    def _range(self, prefix):
+        """A prefixszel kezdődő szavak (start, end) tartománya a rendezett listában."""
+        start = bisect.bisect_left(self.keys, prefix)
+        return start, bisect.bisect_left(self.keys, prefix + "\uffff", start)
+
+    def __len__(self):
+        return len(self.foods)
@@ -0,0 +1,124 @@
+"""
+Kalória előzmények
+------------------
+Napi, heti és havi kalória összesítések (MealRepository.daily_history)
+gyorsítótára hónaponként. Egy év betöltése egyetlen lekérdezés: a még
+nem betöltött hónapokat lefedő időszak egyszerre töltődik be, teljes
+hetekre kiterjesztve, így a hónap elejére / végére eső hetek összegei
+is pontosak.
+
+Ha egy napon változik az étkezések listája, az `invalidate()` a nap
+hónapját (és a hete által érintett hónapokat) eldobja, a következő
+megjelenítés újratölti őket.
+"""
+
+from collections import namedtuple
+from datetime import date as Date, timedelta
+
+HistoryDay = namedtuple("HistoryDay", ["date", "kcal", "week", "week_kcal", "week_days",
+                                       "month", "month_kcal", "month_days"])
+HistoryDay.__doc__ = "Egy naplózott nap összege a hetének és hónapjának összesítésével."
+
+
+def _week_bounds(day):
+    """Returns: (hétfő, vasárnap) a nap hetére"""
+    monday = day - timedelta(days=day.weekday())
+    return monday, monday + timedelta(days=6)
+
+
+def _month_bounds(month):
+    """Returns: (első nap, utolsó nap) a "YYYY-MM" hónapra"""
+    year, number = map(int, month.split("-"))
+    first = Date(year, number, 1)
+    following = Date(year + number // 12, number % 12 + 1, 1)
+    return first, following - timedelta(days=1)
+
+
+def months_between(first_month, last_month):
+    """Returns: ["YYYY-MM", ...] a két hónap között (mindkettőt beleértve)"""
+    year, number = map(int, first_month.split("-"))
+    months = []
+    while f"{year:04d}-{number:02d}" <= last_month:
+        months.append(f"{year:04d}-{number:02d}")
+        year, number = (year + 1, 1) if number == 12 else (year, number + 1)
+    return months
+
+
+def daily_rows(days):
+    """Returns: [(nap, kcal, napok száma), ...]"""
+    return [(day.date, day.kcal, 1) for day in days]
+
+
+def weekly_rows(days):
+    """Returns: [(hét hétfője, kcal, naplózott napok), ...] hetenként egyszer"""
+    return list({day.week: (day.week, day.week_kcal, day.week_days) for day in days}.values())
+
+
+def monthly_rows(days):
+    """Returns: [(hónap, kcal, naplózott napok), ...] hónaponként egyszer"""
+    return list({day.month: (day.month, day.month_kcal, day.month_days) for day in days}.values())
+
+
+class CalorieHistory:
+    """
+    Napi összesítések gyorsítótára (felhasználó, hónap) szerint.
+
+    Az adatokat a MealRepository.daily_history() tölti be.
+    """
+
+    def __init__(self, meals):
+        """
+        Args:
+            meals: MealRepository példány
+        """
+        self.meals = meals
+        self.months = {}
+
+    def year(self, user_id, year):
+        """Returns: [HistoryDay, ...] az év naplózott napjai"""
+        return self.between(user_id, f"{year:04d}-01", f"{year:04d}-12")
+
+    def between(self, user_id, first_month, last_month):
+        """
+        A hónapok naplózott napjai, a hiányzó hónapok egy lekérdezéssel töltődnek be.
+
+        Args:
+            first_month, last_month: "YYYY-MM"
+
+        Returns:
+            [HistoryDay, ...] dátum szerint növekvő sorrendben
+        """
+        months = months_between(first_month, last_month)
+        missing = [month for month in months if (user_id, month) not in self.months]
+        if missing:
+            self._load(user_id, missing)
+        return [day for month in months for day in self.months[(user_id, month)]]
+
+    def invalidate(self, user_id, date):
+        """
+        A nap változása után az érintett hónapok eldobása.
+
+        Args:
+            date: A megváltozott nap ("YYYY-MM-DD")
+        """
+        try:
+            day = Date.fromisoformat(date)
+        except (TypeError, ValueError):
+            return
+        for other in (day, *_week_bounds(day)):
+            self.months.pop((user_id, other.strftime("%Y-%m")), None)
+
+    def clear(self):
+        """Minden hónap eldobása (pl. tömeges importálás után)."""
+        self.months.clear()
+
+    def _load(self, user_id, months):
+        start, _ = _week_bounds(_month_bounds(months[0])[0])
+        _, end = _week_bounds(_month_bounds(months[-1])[1])
+        days_by_month = {month: [] for month in months}
+        for row in self.meals.daily_history(user_id, start.isoformat(), end.isoformat()):
+            day = HistoryDay(*row)
+            if day.month in days_by_month:
+                days_by_month[day.month].append(day)
+        for month, days in days_by_month.items():
+            self.months[(user_id, month)] = days
@@ -0,0 +1,247 @@
+import ttkbootstrap as ttk
+from datetime import datetime
+from tkinter import filedialog
+from app.history import daily_rows, weekly_rows, monthly_rows
+from app.meal_import import MealImport, food_lookup
+from app.table_sync import sync_rows
+
+class HistoryManager:
+    PERIODS = {"Napi": daily_rows,
+               "Heti": weekly_rows,
+               "Havi": monthly_rows}
+
+    def __init__(self, app):
+        self.app = app
+        self.year = None
+        self.period_var = None
+        self.year_label = None
+        self.history_table = None
+        self.summary_label = None
+        self.import_job = None
+
+    def history_page(self):
+        """
+        Kalória előzmények oldal megjelenítése.
+
+        Tartalmazza:
+        - Évválasztó (előző / következő év)
+        - Napi, heti vagy havi bontás választó
+        - Táblázat az időszakok összes és napi átlagos kalóriájával,
+          a napi keret (TDEE) százalékában
+        - Importálás gomb (más alkalmazásból exportált étkezési napló)
+
+        Az oldal bejelentkezésenként egyszer épül fel (build_history_page),
+        ismételt megjelenítéskor csak az adatai frissülnek (refresh_history_page).
+        """
+        self.app.show_screen("history", self.build_history_page, self.refresh_history_page)
+
+    def build_history_page(self, screen):
+        """
+        Az előzmények oldal widgetjeinek létrehozása a képernyő keretében.
+
+        Args:
+            screen: A ScreenManager által létrehozott keret
+        """
+        self.year = datetime.now().year
+
+        selector_frame = ttk.Frame(screen, style="Screen.TFrame")
+        selector_frame.place(relx=0.5, rely=0.20, anchor="center", relwidth=0.8)
+
+        ttk.Button(selector_frame,
+                   text="<",
+                   style="darkbutton.TButton",
+                   command=lambda: self.change_year(-1),
+                   cursor="hand2",
+                   takefocus=False,
+                   width=3).pack(side="left", padx=10)
+
+        self.year_label = ttk.Label(selector_frame,
+                                    text=str(self.year),
+                                    font=("Colibri", 16),
+                                    style="Custom.TLabel")
+        self.year_label.pack(side="left", padx=10)
+
+        ttk.Button(selector_frame,
+                   text=">",
+                   style="darkbutton.TButton",
+                   command=lambda: self.change_year(1),
+                   cursor="hand2",
+                   takefocus=False,
+                   width=3).pack(side="left", padx=10)
+
+        ttk.Button(selector_frame,
+                   text="Importálás",
+                   style="darkbutton.TButton",
+                   command=self.import_meals,
+                   cursor="hand2",
+                   takefocus=False).pack(side="left", padx=20)
+
+        self.period_var = ttk.StringVar(value="Napi")
+        period_input = ttk.Combobox(selector_frame,
+                                    textvariable=self.period_var,
+                                    values=list(self.PERIODS),
+                                    state="readonly",
+                                    bootstyle="warning",
+                                    width=10)
+        period_input.pack(side="right", padx=10)
+        period_input.bind("<<ComboboxSelected>>", lambda event: self.schedule_history())
+
+        self.summary_label = ttk.Label(selector_frame,
+                                       text="",
+                                       font=("Colibri", 12),
+                                       style="Custom.TLabel")
+        self.summary_label.pack(side="right", padx=20)
+
+        history_frame = ttk.Frame(screen,
+                                  style="Frameborder.TFrame")
+        history_frame.place(relx=0.5, rely=0.57, anchor="center", relwidth=0.8, relheight=0.65)
+
+        columns = ("Időszak", "Kcal", "Naplózott napok", "Átlag / nap", "Napi keret %")
+
+        self.history_table = ttk.Treeview(history_frame,
+                                          columns=columns,
+                                          show="headings",
+                                          style="Custom.Treeview")
+        for col in columns:
+            self.history_table.heading(col, text=col, anchor="center")
+            self.history_table.column(col, anchor="center", width=120)
+
+        self.history_table.pack(fill="both", expand=True, padx=2, pady=2)
+        self.history_table['selectmode'] = 'none'
+
+    def refresh_history_page(self):
+        """Az előzmények frissítése megjelenítéskor (a következő üresjáratban)."""
+        self.schedule_history()
+
+    def change_year(self, step):
+        """
+        Az előző vagy következő év megjelenítése.
+
+        Args:
+            step: -1 (előző év) vagy 1 (következő év)
+        """
+        self.year += step
+        self.year_label.configure(text=str(self.year))
+        self.schedule_history()
+
+    def schedule_history(self):
+        """A táblázat újratöltésének ütemezése (a sorozatos kérések egyesülnek)."""
+        self.app.scheduler.schedule("history", self.load_history)
+
+    def load_history(self):
+        """
+        A kiválasztott év összesítéseinek betöltése a táblázatba.
+
+        Az adatok a hónaponként gyorsítótárazott CalorieHistory-ból jönnek
+        (egy év egyetlen lekérdezés), a kiválasztott bontás szerint.
+        Az átlag a naplózott napokra vonatkozik, a százalék a napi
+        kalória kerethez (TDEE) viszonyít.
+        """
+        days = self.app.calorie_history.year(self.app.user_id, self.year)
+        tdee = int(self.app.tdee) if self.app.tdee else 0
+
+        rows = []
+        for period, kcal, logged_days in self.PERIODS[self.period_var.get()](days):
+            average = round(kcal / logged_days)
+            percent = f"{round(average / tdee * 100)}%" if tdee else "-"
+            rows.append((period, (period, f"{kcal} kcal", logged_days, f"{average} kcal", percent)))
+        sync_rows(self.history_table, rows)
+
+        total = sum(day.kcal for day in days)
+        self.summary_label.configure(text=f"Összesen: {total} kcal, {len(days)} naplózott nap")
+
+    def import_meals(self):
+        """
+        Étkezési napló importálása CSV vagy JSON lines fájlból (app.meal_import).
+
+        A fájl darabonként, egy-egy háttérszálas műveletben töltődik be,
+        minden darab után frissül a haladás, és közben a többi írás is lefut.
+        Egyszerre egy importálás futhat.
+        """
+        if self.import_job is not None:
+            return
+        path = filedialog.askopenfilename(title="Étkezési napló importálása",
+                                          filetypes=[("CSV vagy JSON lines", "*.csv *.json *.jsonl"),
+                                                     ("Minden fájl", "*.*")])
+        if not path:
+            return
+        job = MealImport(self.app.meals, food_lookup(self.app.food_catalog), self.app.user_id, path)
+        dialog = self.app.dialogs.get("import_meals", "Étkezések importálása", 520, 260, self.build_import_dialog)
+        dialog.show(job)
+
+    def build_import_dialog(self, dialog):
+        """
+        Az importálás ablak widgetjeinek létrehozása: állapot, haladásjelző,
+        megszakítás / bezárás gomb.
+
+        Args:
+            dialog: A DialogPool által létrehozott Dialog
+        """
+        popup = dialog.window
+
+        status_label = ttk.Label(popup,
+                                 text="",
+                                 font=("Colibri", 12),
+                                 style="Custom.TLabel",
+                                 wraplength=460)
+        status_label.pack(pady=(30, 10), padx=30)
+
+        progress_bar = ttk.Progressbar(popup,
+                                       bootstyle="warning",
+                                       maximum=100,
+                                       length=460)
+        progress_bar.pack(pady=10, padx=30)
+
+        def stop():
+            job = self.import_job
+            if job is not None:
+                self.import_job = None
+                self.app.db_worker.submit(job.close)
+                self.app.meals_imported()
+                self.schedule_history()
+            dialog.hide()
+
+        close_button = ttk.Button(popup,
+                                  text="Megszakítás",
+                                  style="darkbutton.TButton",
+                                  command=stop,
+                                  cursor="hand2",
+                                  takefocus=False)
+        close_button.pack(pady=20)
+
+        def finished(job, message):
+            self.import_job = None
+            self.app.meals_imported()
+            self.schedule_history()
+            errors = "\n".join(job.errors[:3])
+            status_label.configure(text=f"{message}: {job.imported} sor importálva, {job.skipped} sor kihagyva."
+                                        + (f"\n{errors}" if errors else ""))
+            close_button.configure(text="Bezárás")
+
+        def run_step(job):
+            def stepped(progress):
+                if job is not self.import_job:
+                    return
+                progress_bar.configure(value=progress.position * 100 // max(progress.size, 1))
+                status_label.configure(text=f"{progress.imported} sor importálva...")
+                if progress.done:
+                    finished(job, "Kész")
+                else:
+                    run_step(job)
+
+            def failed(error):
+                if job is not self.import_job:
+                    return
+                self.app.db_worker.submit(job.close)
+                finished(job, f"Hiba ({error})")
+
+            self.app.db_worker.submit(job.step, callback=stepped, error_callback=failed)
+
+        def reset(job):
+            self.import_job = job
+            status_label.configure(text="Importálás...")
+            progress_bar.configure(value=0)
+            close_button.configure(text="Megszakítás")
+            run_step(job)
+
+        dialog.on_reset = reset
@@ -0,0 +1,274 @@
+"""
+Étkezések importálása
+---------------------
+Más alkalmazásokból exportált étkezési napló betöltése CSV vagy JSON
+lines (soronként egy JSON objektum) fájlból. Egy bejegyzés mezői:
+
+    dátum (YYYY-MM-DD), étkezés, étel, mennyiség (g/ml), kcal (nem kötelező)
+
+A mezőnevek magyarul és angolul is megadhatók (pl. "datum" / "date",
+"etel" / "food"), a CSV elválasztója vessző, pontosvessző vagy tabulátor.
+Az étel a katalógusban név szerint (ékezet- és kisbetűfüggetlenül) keresődik,
+a kalória a katalógusból számolódik. A katalógusban nem szereplő étel
+egyéni ételként kerül be, ha a bejegyzésben van kcal, különben kimarad.
+
+A fájl folyamatosan olvasódik: egyszerre csak egy darab (CHUNK_SIZE sor)
+van a memóriában, ami egyetlen `executemany` hívással íródik ki. Minden
+darab külön tranzakció: a felületen egy-egy DatabaseWorker művelet (így a
+többi írás a darabok között lefuthat, és a haladás darabonként látszik),
+parancssorból darabonként egy commit:
+
+    python -m app.meal_import felhasznalo@example.com naplo.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import namedtuple
+from datetime import date as Date
+from app.catalog import food_calories
+from app.food_index import fold
+
+CHUNK_SIZE = 2000
+MAX_ERRORS = 20
+
+MEAL_TABLES = {"reggeli": "breakfast_table", "breakfast": "breakfast_table",
+               "ebed": "lunch_table", "lunch": "lunch_table",
+               "vacsora": "dinner_table", "dinner": "dinner_table",
+               "egyeb": "other_table", "other": "other_table", "snack": "other_table"}
+
+FIELDS = {"datum": "date", "date": "date", "nap": "date",
+          "etkezes": "meal", "meal": "meal",
+          "etel": "food", "food": "food", "nev": "food", "name": "food",
+          "mennyiseg": "amount", "amount": "amount", "g/ml": "amount", "gramm": "amount",
+          "kcal": "calories", "kaloria": "calories", "calories": "calories"}
+
+ImportProgress = namedtuple("ImportProgress", ["imported", "skipped", "position", "size", "done"])
+ImportProgress.__doc__ = "Az importálás állása: beírt és kihagyott sorok, beolvasott bájtok, fájlméret."
+
+
+def _fields(entry):
+    """A bejegyzés mezőnevei egységes (angol) alakra hozva, az ismeretlen mezők kimaradnak."""
+    fields = {}
+    for key, value in entry.items():
+        name = FIELDS.get(fold(str(key)).strip())
+        if name:
+            fields[name] = value
+    return fields
+
+
+def read_entries(file, path):
+    """
+    A fájl bejegyzéseinek folyamatos olvasása.
+
+    Args:
+        file: A megnyitott szöveges fájl
+        path: A fájl neve (a kiterjesztés dönti el a formátumot)
+
+    Yields:
+        (sor száma, {mező: érték}) vagy (sor száma, hibaüzenet) olvashatatlan sornál
+    """
+    if os.path.splitext(path)[1].lower() in (".json", ".jsonl", ".ndjson"):
+        for number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                yield number, "Hibás JSON sor"
+                continue
+            yield number, _fields(entry) if isinstance(entry, dict) else "Nem JSON objektum"
+        return
+
+    header = file.readline()
+    delimiter = max(",;\t", key=header.count)
+    names = next(csv.reader([header], delimiter=delimiter), [])
+    reader = csv.DictReader(file, fieldnames=names, delimiter=delimiter)
+    for entry in reader:
+        yield reader.line_num + 1, _fields(entry)
+
+
+def food_lookup(catalog):
+    """Returns: {összehasonlító név: Food} a teljes katalógusra (FoodCatalog)"""
+    return {fold(food.name): food
+            for category in catalog.categories()
+            for food in catalog.foods(category)}
+
+
+def meal_row(user_id, fields, foods):
+    """
+    Egy bejegyzés átalakítása users_meals sorrá.
+
+    Args:
+        fields: A bejegyzés mezői (_fields)
+        foods: food_lookup() eredménye
+
+    Returns:
+        (user_id, table_name, food_name, calories, amount, date, food_id)
+
+    Raises:
+        ValueError: Hiányzó vagy hibás mező, vagy ismeretlen étel kcal nélkül
+    """
+    try:
+        day = Date.fromisoformat(str(fields.get("date", "")).strip()[:10]).isoformat()
+    except ValueError:
+        raise ValueError("Hibás dátum") from None
+    table_name = MEAL_TABLES.get(fold(str(fields.get("meal", ""))).strip())
+    if table_name is None:
+        raise ValueError("Ismeretlen étkezés")
+    food_name = str(fields.get("food", "")).strip()
+    if not food_name:
+        raise ValueError("Hiányzó étel")
+    try:
+        amount = float(str(fields.get("amount") or 0).replace(",", "."))
+        calories = fields.get("calories")
+        calories = round(float(str(calories).replace(",", "."))) if calories not in (None, "") else None
+    except ValueError:
+        raise ValueError("Hibás szám") from None
+    if amount < 0 or (calories is not None and calories < 0):
+        raise ValueError("Negatív érték")
+
+    food = foods.get(fold(food_name))
+    if food is not None and amount > 0:
+        return (user_id, table_name, food.name, food_calories(food, amount), round(amount), day, food.id)
+    if calories is None:
+        raise ValueError("Ismeretlen étel kcal nélkül")
+    return (user_id, table_name, food_name, calories, 0, day, None)
+
+
+class MealImport:
+    """
+    Egy fájl importálása darabonként.
+
+    Minden `step()` hívás a következő legfeljebb `chunk_size` sort olvassa
+    be és írja ki (MealRepository.add_many). A `step()` nem commitol, a
+    tranzakciót a hívó zárja le (DatabaseWorker, illetve main()).
+    A fájl az első `step()` híváskor nyílik meg, a lépések ugyanazon a
+    szálon hívandók.
+    """
+
+    def __init__(self, meals, foods, user_id, path, chunk_size=CHUNK_SIZE):
+        """
+        Args:
+            meals: MealRepository példány
+            foods: food_lookup() eredménye
+            user_id: A felhasználó azonosítója
+            path: A CSV vagy JSON lines fájl
+        """
+        self.meals = meals
+        self.foods = foods
+        self.user_id = user_id
+        self.path = path
+        self.chunk_size = chunk_size
+        self.size = os.path.getsize(path)
+        self.file = None
+        self.entries = None
+        self.imported = 0
+        self.skipped = 0
+        self.errors = []
+        self.done = False
+
+    def step(self):
+        """
+        A következő darab beolvasása és kiírása.
+
+        Returns:
+            ImportProgress
+        """
+        if self.file is None and not self.done:
+            self.file = open(self.path, encoding="utf-8-sig", newline="")
+            self.entries = read_entries(self.file, self.path)
+
+        rows = []
+        while not self.done and len(rows) < self.chunk_size:
+            try:
+                number, fields = next(self.entries)
+            except StopIteration:
+                self.close()
+                break
+            try:
+                if isinstance(fields, str):
+                    raise ValueError(fields)
+                rows.append(meal_row(self.user_id, fields, self.foods))
+            except ValueError as error:
+                self.skipped += 1
+                if len(self.errors) < MAX_ERRORS:
+                    self.errors.append(f"{number}. sor: {error}")
+
+        if rows:
+            self.meals.add_many(rows)
+            self.imported += len(rows)
+        return self.progress()
+
+    def progress(self):
+        """Returns: ImportProgress (a pozíció a beolvasott bájtok száma)"""
+        position = self.size if self.file is None else min(self.file.buffer.tell(), self.size)
+        return ImportProgress(self.imported, self.skipped, position, self.size, self.done)
+
+    def close(self):
+        """A fájl lezárása (a végén automatikusan, megszakításkor a hívó hívja)."""
+        self.done = True
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            self.entries = None
+
+
+def main(argv=None):
+    """
+    Étkezési napló importálása parancssorból.
+
+    Args:
+        argv: Parancssori argumentumok (alapértelmezetten sys.argv[1:])
+
+    Returns:
+        0 ha az importálás lefutott, 1 ha nincs ilyen felhasználó
+    """
+    from app.catalog import FoodCatalog
+    from app.database import ConnectionManager
+    from app.migrations import migrate
+    from app.paths import resource_path
+    from app.repositories import UserRepository, MealRepository
+
+    parser = argparse.ArgumentParser(prog="python -m app.meal_import",
+                                     description="MyFitPlan étkezési napló importálása CSV vagy JSON lines fájlból")
+    parser.add_argument("email", help="A felhasználó e-mail címe")
+    parser.add_argument("path", help="A CSV vagy JSON lines fájl")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Tranzakciónként beírt sorok száma")
+    parser.add_argument("--db", default=resource_path("myfitplan.db"), help="Az adatbázis fájl")
+    args = parser.parse_args(argv)
+
+    db = ConnectionManager(args.db, prepare=migrate)
+    meals = MealRepository(db)
+    try:
+        user_id = UserRepository(db).find_id(args.email)
+        if user_id is None:
+            print("Nincs ilyen felhasználó.", file=sys.stderr)
+            return 1
+
+        job = MealImport(meals, food_lookup(FoodCatalog(meals)), user_id, args.path, args.chunk_size)
+        connection = db.connection()
+        try:
+            while not job.done:
+                progress = job.step()
+                connection.commit()
+                print(f"\r{progress.position * 100 // max(progress.size, 1)}% "
+                      f"({progress.imported} sor)", end="", file=sys.stderr, flush=True)
+        except BaseException:
+            connection.rollback()
+            job.close()
+            raise
+        print(file=sys.stderr)
+
+        for error in job.errors:
+            print(f"  {error}")
+        print(f"Importálva: {job.imported} sor, kihagyva: {job.skipped} sor")
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
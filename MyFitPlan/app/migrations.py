@@ -0,0 +1,519 @@
+"""
+Adatbázis migrációk
+-------------------
+Az adatbázis séma verzióját a `PRAGMA user_version` érték tárolja.
+Indításkor csak azok a migrációk futnak le, amelyek a tárolt verziónál
+újabbak, így a meglévő myfitplan.db fájlok helyben frissülnek.
+
+A `PRAGMA application_id` jelöli, hogy a fájl MyFitPlan adatbázis.
+A kettő együtt a séma ujjlenyomata: ha mindkettő a várt értékű, az
+ellenőrzés egyetlen olvasás, nem fut DDL és nem nyílik írási tranzakció.
+
+Új migráció hozzáadása: egy új függvény a MIGRATIONS lista végére.
+A már kiadott migrációkat módosítani nem szabad.
+"""
+
+import csv
+import os
+import sqlite3
+from app.paths import resource_path
+from app.repositories import MUSCLE_GROUPS
+
+APPLICATION_ID = 0x4D794650  # "MyFP"
+
+
+def _create_base_tables(cursor):
+    """
+    1. migráció: alap táblák létrehozása.
+
+    Létrehozott táblák:
+    - users: Felhasználói adatok tárolása
+    - users_meals: Felhasználók étkezéseinek naplózása
+    - training_days: Edzésnapok tárolása
+    - exercises: Felhasználók által összeállított edzéstervek gyakorlatai
+
+    Minden tábla csak akkor jön létre, ha még nem létezik, így a verziózás
+    előtti adatbázisokon is biztonságosan lefut.
+    """
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL UNIQUE,
+            vezeteknev TEXT NOT NULL,
+            keresztnev TEXT NOT NULL,
+            email TEXT NOT NULL UNIQUE,
+            jelszo TEXT NOT NULL,
+            eletkor INTEGER,
+            magassag INTEGER,
+            testsuly INTEGER,
+            nem TEXT,
+            aktivitas TEXT
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS users_meals (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            table_name TEXT NOT NULL,
+            food_name TEXT NOT NULL,
+            calories INTEGER NOT NULL,
+            amount REAL NOT NULL,
+            date TEXT NOT NULL,
+            FOREIGN KEY(user_id) REFERENCES users(id)
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS training_days (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            day_name TEXT NOT NULL,
+            FOREIGN KEY(user_id) REFERENCES users(id),
+            UNIQUE(user_id, day_name)
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS exercises (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            day_id INTEGER NOT NULL,
+            exercise_name TEXT NOT NULL,
+            sets INTEGER NOT NULL,
+            reps INTEGER NOT NULL,
+            weight REAL,
+            equipment TEXT,
+            difficulty TEXT,
+            description TEXT,
+            FOREIGN KEY(day_id) REFERENCES training_days(id)
+        )
+    ''')
+
+
+def _add_query_indexes(cursor):
+    """
+    2. migráció: indexek a leggyakoribb lekérdezésekhez.
+
+    - users_meals: (user_id, date) szerinti keresés az étrend oldalon.
+      Az index a lekérdezett oszlopokat is tartalmazza (covering index),
+      így a napi étkezések betöltése nem olvassa a táblát.
+    - exercises: day_id szerinti keresés az edzés oldalon.
+    """
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_users_meals_user_date
+        ON users_meals (user_id, date, table_name, calories, amount, food_name)
+    ''')
+
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_exercises_day
+        ON exercises (day_id)
+    ''')
+
+
+MEAL_TOTAL_COLUMNS = {"breakfast_table": "breakfast_kcal",
+                      "lunch_table": "lunch_kcal",
+                      "dinner_table": "dinner_kcal",
+                      "other_table": "other_kcal"}
+
+
+def _meal_totals_delta(row, sign):
+    """
+    A daily_totals UPDATE utasítás SET része egy users_meals sorhoz.
+
+    Args:
+        row: "NEW" vagy "OLD" (a trigger sorának neve)
+        sign: "+" vagy "-"
+    """
+    calories = f"CAST({row}.calories AS INTEGER)"
+    assignments = [f"kcal = kcal {sign} {calories}"]
+    for table_name, column in MEAL_TOTAL_COLUMNS.items():
+        if table_name == "other_table":
+            condition = f"{row}.table_name NOT IN ('breakfast_table', 'lunch_table', 'dinner_table')"
+        else:
+            condition = f"{row}.table_name = '{table_name}'"
+        assignments.append(f"{column} = {column} {sign} CASE WHEN {condition} THEN {calories} ELSE 0 END")
+    return ",\n                ".join(assignments)
+
+
+def _add_daily_totals(cursor):
+    """
+    3. migráció: napi kalória összesítő tábla.
+
+    A daily_totals tábla felhasználónként és naponként egy sort tartalmaz
+    a napi összes és az étkezésenkénti kalóriával. A tartalmát a users_meals
+    táblára tett triggerek tartják karban, így a kalória mérő egyetlen sort olvas.
+    A meglévő étkezésekből a migráció egyszer feltölti a táblát.
+    """
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS daily_totals (
+            user_id INTEGER NOT NULL,
+            date TEXT NOT NULL,
+            kcal INTEGER NOT NULL DEFAULT 0,
+            breakfast_kcal INTEGER NOT NULL DEFAULT 0,
+            lunch_kcal INTEGER NOT NULL DEFAULT 0,
+            dinner_kcal INTEGER NOT NULL DEFAULT 0,
+            other_kcal INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, date)
+        ) WITHOUT ROWID
+    ''')
+
+    add_new = f'''
+            INSERT OR IGNORE INTO daily_totals (user_id, date) VALUES (NEW.user_id, NEW.date);
+            UPDATE daily_totals SET
+                {_meal_totals_delta("NEW", "+")}
+            WHERE user_id = NEW.user_id AND date = NEW.date;'''
+
+    remove_old = f'''
+            UPDATE daily_totals SET
+                {_meal_totals_delta("OLD", "-")}
+            WHERE user_id = OLD.user_id AND date = OLD.date;
+            DELETE FROM daily_totals
+            WHERE user_id = OLD.user_id AND date = OLD.date
+              AND NOT EXISTS (SELECT 1 FROM users_meals
+                              WHERE user_id = OLD.user_id AND date = OLD.date);'''
+
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_users_meals_insert_totals
+        AFTER INSERT ON users_meals
+        BEGIN{add_new}
+        END
+    ''')
+
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_users_meals_delete_totals
+        AFTER DELETE ON users_meals
+        BEGIN{remove_old}
+        END
+    ''')
+
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_users_meals_update_totals
+        AFTER UPDATE OF user_id, table_name, calories, date ON users_meals
+        BEGIN{remove_old}{add_new}
+        END
+    ''')
+
+    cursor.execute('''
+        INSERT OR REPLACE INTO daily_totals
+            (user_id, date, kcal, breakfast_kcal, lunch_kcal, dinner_kcal, other_kcal)
+        SELECT user_id, date,
+               SUM(CAST(calories AS INTEGER)),
+               SUM(CASE WHEN table_name = 'breakfast_table' THEN CAST(calories AS INTEGER) ELSE 0 END),
+               SUM(CASE WHEN table_name = 'lunch_table' THEN CAST(calories AS INTEGER) ELSE 0 END),
+               SUM(CASE WHEN table_name = 'dinner_table' THEN CAST(calories AS INTEGER) ELSE 0 END),
+               SUM(CASE WHEN table_name NOT IN ('breakfast_table', 'lunch_table', 'dinner_table')
+                        THEN CAST(calories AS INTEGER) ELSE 0 END)
+        FROM users_meals
+        GROUP BY user_id, date
+    ''')
+
+
+FOOD_CATEGORIES = ['Alkoholos italok', 'Gabonafélék és hüvelyesek', 'Gyümölcsök',
+                   'Halfélék', 'Húsfélék', 'Italok', 'Olajok', 'Szénhidrátok',
+                   'Tejtermékek és tojások', 'Zöldségek']
+
+LIQUID_CATEGORIES = ['Italok', 'Alkoholos italok']
+
+FOOD_CSV_DIR = resource_path("meals")
+
+
+def _food_unit(category):
+    return "ml" if category in LIQUID_CATEGORIES else "g"
+
+
+def _read_food_csv(category):
+    """
+    Egy kategória ételeinek beolvasása a meals/<kategória>.csv fájlból.
+
+    Returns:
+        [(név, kcal/100), ...] (üres lista, ha a fájl nem létezik)
+    """
+    path = os.path.join(FOOD_CSV_DIR, f"{category}.csv")
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8-sig", newline="") as file:
+        rows = list(csv.reader(file, delimiter=";"))
+    return [(row[0].strip(), int(row[1])) for row in rows[1:] if len(row) >= 2 and row[0].strip()]
+
+
+def _add_food_catalog(cursor):
+    """
+    4. migráció: egységes étel katalógus.
+
+    A kategóriánkénti tíz tábla ("Húsfélék", "Italok", ...) helyett egyetlen
+    foods(id, category, name, kcal_per_100, unit) tábla. A név szerinti,
+    kategóriákon átívelő keresést a memóriában tartott FoodIndex szolgálja
+    ki (a katalógus egyetlen lekérdezéssel töltődik be), ezért a táblához
+    nem tartozik FTS5 index.
+
+    Az adatok a régi kategória táblákból kerülnek át (ezek utána törlődnek).
+    Ha egy kategória táblája hiányzik, a meals/<kategória>.csv fájlból töltődik.
+    """
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS foods (
+            id INTEGER PRIMARY KEY,
+            category TEXT NOT NULL,
+            name TEXT NOT NULL,
+            kcal_per_100 INTEGER NOT NULL,
+            unit TEXT NOT NULL DEFAULT 'g',
+            UNIQUE(category, name)
+        )
+    ''')
+
+    legacy_tables = {row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+
+    for category in FOOD_CATEGORIES:
+        if category in legacy_tables:
+            cursor.execute(f'''
+                INSERT OR IGNORE INTO foods (category, name, kcal_per_100, unit)
+                SELECT ?, "Név", CAST(COALESCE("Kalória", 0) AS INTEGER), ?
+                FROM "{category}"
+                WHERE "Név" IS NOT NULL
+                ORDER BY rowid
+            ''', (category, _food_unit(category)))
+            cursor.execute(f'DROP TABLE "{category}"')
+        else:
+            cursor.executemany('''
+                INSERT OR IGNORE INTO foods (category, name, kcal_per_100, unit)
+                VALUES (?, ?, ?, ?)
+            ''', [(category, name, kcal, _food_unit(category)) for name, kcal in _read_food_csv(category)])
+
+
+def _add_meal_food_id(cursor):
+    """
+    5. migráció: a naplózott étkezések hivatkoznak a katalógus ételre.
+
+    A users_meals.food_id a foods.id értékét tárolja (egyéni ételnél NULL),
+    így az összesítések egész szám azonosító szerint csoportosíthatnak.
+    A meglévő sorok a név alapján kapják meg az azonosítót.
+    """
+    cursor.execute('''
+        ALTER TABLE users_meals ADD COLUMN food_id INTEGER REFERENCES foods(id)
+    ''')
+
+    cursor.execute('''
+        UPDATE users_meals
+        SET food_id = (SELECT MIN(foods.id) FROM foods WHERE foods.name = users_meals.food_name)
+        WHERE amount > 0
+    ''')
+
+
+def _training_volume_delta(row, sign):
+    """
+    A training_volume UPDATE utasítás SET része egy exercises sorhoz.
+
+    A hiányzó (üres) sorozat, ismétlés és súly 0-nak számít.
+
+    Args:
+        row: "NEW" vagy "OLD" (a trigger sorának neve)
+        sign: "+" vagy "-"
+    """
+    sets = f"COALESCE(CAST({row}.sets AS INTEGER), 0)"
+    reps = f"COALESCE(CAST({row}.reps AS INTEGER), 0)"
+    weight = f"COALESCE(CAST({row}.weight AS REAL), 0)"
+    return (f"exercises = exercises {sign} 1, "
+            f"sets = sets {sign} {sets}, "
+            f"volume = volume {sign} {sets} * {reps} * {weight}")
+
+
+def _training_volume_key(row):
+    """A training_volume sor feltétele egy exercises sorhoz (a felhasználó az edzésnapból)."""
+    return (f"user_id = (SELECT user_id FROM training_days WHERE id = {row}.day_id) "
+            f"AND muscle_group = COALESCE({row}.muscle_group, '')")
+
+
+def _add_training_volume(cursor):
+    """
+    6. migráció: heti edzés volumen izomcsoportonként.
+
+    Az exercises tábla muscle_group oszlopa a gyakorlat izomcsoportját
+    tárolja. A training_volume tábla felhasználónként és izomcsoportonként
+    egy sort tartalmaz a heti terv (az összes edzésnap) gyakorlatainak,
+    sorozatainak és volumenének (sorozat × ismétlés × súly) összegével.
+    A tartalmát az exercises táblára tett triggerek tartják karban, így az
+    edzés oldal összesítése néhány sor olvasása.
+
+    A meglévő gyakorlatok izomcsoportja a gyakorlat katalógusból, név
+    alapján töltődik ki (ismeretlen gyakorlatnál üres), majd a migráció
+    egyszer feltölti az összesítő táblát.
+    """
+    cursor.execute('''
+        ALTER TABLE exercises ADD COLUMN muscle_group TEXT
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS training_volume (
+            user_id INTEGER NOT NULL,
+            muscle_group TEXT NOT NULL,
+            exercises INTEGER NOT NULL DEFAULT 0,
+            sets INTEGER NOT NULL DEFAULT 0,
+            volume REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id, muscle_group)
+        ) WITHOUT ROWID
+    ''')
+
+    add_new = f'''
+            INSERT OR IGNORE INTO training_volume (user_id, muscle_group)
+            VALUES ((SELECT user_id FROM training_days WHERE id = NEW.day_id), COALESCE(NEW.muscle_group, ''));
+            UPDATE training_volume SET
+                {_training_volume_delta("NEW", "+")}
+            WHERE {_training_volume_key("NEW")};'''
+
+    remove_old = f'''
+            UPDATE training_volume SET
+                {_training_volume_delta("OLD", "-")}
+            WHERE {_training_volume_key("OLD")};
+            DELETE FROM training_volume
+            WHERE {_training_volume_key("OLD")} AND exercises <= 0;'''
+
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_exercises_insert_volume
+        AFTER INSERT ON exercises
+        BEGIN{add_new}
+        END
+    ''')
+
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_exercises_delete_volume
+        AFTER DELETE ON exercises
+        BEGIN{remove_old}
+        END
+    ''')
+
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_exercises_update_volume
+        AFTER UPDATE OF day_id, sets, reps, weight, muscle_group ON exercises
+        BEGIN{remove_old}{add_new}
+        END
+    ''')
+
+    tables = {row[0] for row in cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    catalog = [f'''SELECT {position} AS position, '{group}' AS muscle_group, [Gyakorlat neve] AS name FROM "{group}"'''
+               for position, group in enumerate(MUSCLE_GROUPS) if group in tables]
+    if catalog:
+        cursor.execute(f'''
+            UPDATE exercises
+            SET muscle_group = (SELECT catalog.muscle_group
+                                FROM ({" UNION ALL ".join(catalog)}) AS catalog
+                                WHERE catalog.name = exercises.exercise_name
+                                ORDER BY catalog.position
+                                LIMIT 1)
+        ''')
+
+    cursor.execute('''
+        INSERT OR REPLACE INTO training_volume (user_id, muscle_group, exercises, sets, volume)
+        SELECT training_days.user_id,
+               COALESCE(exercises.muscle_group, ''),
+               COUNT(*),
+               SUM(COALESCE(CAST(exercises.sets AS INTEGER), 0)),
+               SUM(COALESCE(CAST(exercises.sets AS INTEGER), 0)
+                   * COALESCE(CAST(exercises.reps AS INTEGER), 0)
+                   * COALESCE(CAST(exercises.weight AS REAL), 0))
+        FROM exercises
+        JOIN training_days ON training_days.id = exercises.day_id
+        GROUP BY training_days.user_id, COALESCE(exercises.muscle_group, '')
+    ''')
+
+
+def _add_workout_sets(cursor):
+    """
+    7. migráció: elvégzett sorozatok naplója.
+
+    A workout_sets tábla minden elvégzett sorozatot egy sorként tárol
+    (felhasználó, gyakorlat, időpont, ismétlés, súly); a sorok csak
+    hozzáfűződnek. Az időpont Unix időbélyeg másodpercben (INTEGER), így
+    egy sor néhány bájt. A (user_id, exercise, ts) index a lekérdezett
+    oszlopokat is tartalmazza (covering index): egy gyakorlat utolsó
+    edzései a tábla olvasása nélkül, néhány indexkereséssel kérdezhetők le.
+    """
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS workout_sets (
+            id INTEGER PRIMARY KEY,
+            user_id INTEGER NOT NULL,
+            exercise TEXT NOT NULL,
+            ts INTEGER NOT NULL,
+            reps INTEGER NOT NULL,
+            weight REAL NOT NULL DEFAULT 0,
+            FOREIGN KEY(user_id) REFERENCES users(id)
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_workout_sets_user_exercise_ts
+        ON workout_sets (user_id, exercise, ts, reps, weight)
+    ''')
+
+
+MIGRATIONS = [
+    _create_base_tables,
+    _add_query_indexes,
+    _add_daily_totals,
+    _add_food_catalog,
+    _add_meal_food_id,
+    _add_training_volume,
+    _add_workout_sets,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def get_schema_version(connection):
+    """
+    Az adatbázis aktuális séma verziójának lekérdezése.
+
+    Returns:
+        int: A `PRAGMA user_version` értéke (0, ha még nem volt migráció)
+    """
+    return connection.execute("PRAGMA user_version").fetchone()[0]
+
+
+def get_schema_fingerprint(connection):
+    """
+    Az adatbázis azonosítója és séma verziója egyetlen lekérdezéssel.
+
+    Returns:
+        (application_id, user_version)
+    """
+    return connection.execute("SELECT * FROM pragma_application_id, pragma_user_version").fetchone()
+
+
+def migrate(connection):
+    """
+    Függőben lévő migrációk futtatása.
+
+    Minden migráció saját tranzakcióban fut, a verziószám növelésével
+    együtt, így hiba esetén az adatbázis az előző verzión marad.
+    Naprakész adatbázison csak az ujjlenyomat olvasása történik.
+
+    Args:
+        connection: sqlite3 kapcsolat
+
+    Returns:
+        int: A migrációk utáni séma verzió
+
+    Raises:
+        sqlite3.DatabaseError: Ha a fájl egy másik alkalmazás adatbázisa
+    """
+    application_id, version = get_schema_fingerprint(connection)
+    if application_id == APPLICATION_ID and version >= SCHEMA_VERSION:
+        return version
+    if application_id not in (0, APPLICATION_ID):
+        raise sqlite3.DatabaseError(f"Nem MyFitPlan adatbázis (application_id: {application_id})")
+
+    if version >= SCHEMA_VERSION:
+        connection.execute(f"PRAGMA application_id = {APPLICATION_ID}")
+        return version
+
+    for number in range(version, SCHEMA_VERSION):
+        cursor = connection.cursor()
+        cursor.execute("BEGIN")
+        try:
+            MIGRATIONS[number](cursor)
+            cursor.execute(f"PRAGMA user_version = {number + 1}")
+            cursor.execute(f"PRAGMA application_id = {APPLICATION_ID}")
+        except Exception:
+            connection.rollback()
+            raise
+        connection.commit()
+        version = number + 1
+
+    return version
@@ -0,0 +1,28 @@
+"""
+Fájl elérési utak
+-----------------
+Az alkalmazás mellé csomagolt fájlok (adatbázis, képek, CSV források)
+elérése fejlesztői futtatásnál és a PyInstaller-rel készült exe-ből is.
+"""
+
+import os
+import sys
+
+
+def resource_path(relative_path):
+    """ 
+    Fájlok elérési útjának kezelése.
+    
+    Args:
+        relative_path: A fájl relatív elérési útja
+        
+    Returns:
+        A fájl abszolút elérési útja
+    """
+    if getattr(sys, 'frozen', False):
+        base_path = os.path.dirname(sys.executable)
+    else:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+        if os.path.basename(base_path) == "app":
+            base_path = os.path.dirname(base_path)
+    return os.path.join(base_path, relative_path)
@@ -0,0 +1,329 @@
+"""
+Adatbázis repository osztályok
+------------------------------
+Minden tábla(csoport) lekérdezései egy-egy osztályban vannak:
+- UserRepository: felhasználók
+- MealRepository: naplózott étkezések és az étel katalógus
+- TrainingDayRepository: edzésnapok
+- ExerciseRepository: edzéstervek gyakorlatai, izomcsoportonkénti
+  összesítésük és a gyakorlat katalógus
+- WorkoutSetRepository: elvégzett sorozatok naplója
+
+A repository-k a hívó szál saját kapcsolatát használják (ConnectionManager),
+így ugyanaz a példány a felület szálán olvasásra, az adatbázis háttérszálán
+pedig írásra is használható. Az író metódusok nem commitolnak, a tranzakciót
+a hívó (az adatbázis háttérszál) zárja le.
+
+A `*_many` metódusok több sort egyetlen `executemany` hívással írnak,
+így egy felhasználói művelet (pl. több étel felvétele) egy tranzakció.
+
+Az ExerciseRepository.for_day_page azonosító szerinti kulcsos lapozással
+(keyset) olvas: `after_id` után vagy `before_id` előtt legfeljebb `limit`
+sort, mindig azonosító szerint növekvő sorrendben (lásd VirtualTable).
+Az étkezési táblák a memóriában tartott napi pillanatképből (DaySnapshot)
+lapoznak, ezért a MealRepository-nak nincs lapozó metódusa.
+"""
+
+MUSCLE_GROUPS = ['bicepsz', 'comb', 'has', 'hát', 'kardió', 'mell',
+                 'far', 'tricepsz', 'vádli', 'váll']
+
+
+class Repository:
+    """Közös alaposztály: a szálhoz tartozó kapcsolat elérése."""
+
+    def __init__(self, db):
+        """
+        Args:
+            db: ConnectionManager példány
+        """
+        self.db = db
+
+    def execute(self, sql, params=()):
+        return self.db.connection().execute(sql, params)
+
+
+class UserRepository(Repository):
+    """A users tábla lekérdezései."""
+
+    def email_exists(self, email):
+        return self.execute('SELECT email FROM users WHERE email = ?', (email,)).fetchone() is not None
+
+    def find_by_credentials(self, email, jelszo):
+        return self.execute('SELECT * FROM users WHERE email = ? AND jelszo = ?', (email, jelszo)).fetchone()
+
+    def find_id(self, email):
+        """Returns: A felhasználó azonosítója vagy None"""
+        row = self.execute('SELECT id FROM users WHERE email = ?', (email,)).fetchone()
+        return row[0] if row else None
+
+    def body_data(self, email):
+        """Returns: (eletkor, magassag, testsuly, nem, aktivitas) vagy None"""
+        return self.execute('SELECT eletkor, magassag, testsuly, nem, aktivitas FROM users WHERE email = ?',
+                            (email,)).fetchone()
+
+    def profile(self, email):
+        """Returns: (vezeteknev, keresztnev, email, eletkor, magassag, testsuly, nem, aktivitas) vagy None"""
+        return self.execute('SELECT vezeteknev, keresztnev, email, eletkor, magassag, testsuly, nem, aktivitas '
+                            'FROM users WHERE email = ?', (email,)).fetchone()
+
+    def add(self, vezeteknev, keresztnev, email, jelszo, eletkor, magassag, testsuly, nem, aktivitas):
+        return self.execute('''
+            INSERT INTO users (vezeteknev, keresztnev, email, jelszo, eletkor, magassag, testsuly, nem, aktivitas)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (vezeteknev, keresztnev, email, jelszo, eletkor, magassag, testsuly, nem, aktivitas)).lastrowid
+
+    def update_profile(self, email, vezeteknev, keresztnev, eletkor, magassag, testsuly, aktivitas):
+        self.execute("""
+            UPDATE users
+            SET vezeteknev = ?, keresztnev = ?, eletkor = ?,
+                magassag = ?, testsuly = ?, aktivitas = ?
+            WHERE email = ?
+        """, (vezeteknev, keresztnev, eletkor, magassag, testsuly, aktivitas, email))
+
+
+class MealRepository(Repository):
+    """A users_meals és daily_totals táblák, valamint az étel katalógus lekérdezései."""
+
+    def for_day(self, user_id, date):
+        """Returns: [(id, table_name, food_name, calories, amount), ...] felvétel sorrendjében"""
+        return self.execute("""SELECT id, table_name, food_name, calories, amount FROM users_meals WHERE user_id = ? AND date = ? ORDER BY id""",
+                            (user_id, date)).fetchall()
+
+    def for_days(self, user_id, dates):
+        """Returns: [(date, id, table_name, food_name, calories, amount), ...] több nap egy lekérdezéssel"""
+        dates = list(dates)
+        if not dates:
+            return []
+        placeholders = ", ".join("?" * len(dates))
+        return self.execute(f"""SELECT date, id, table_name, food_name, calories, amount FROM users_meals
+                                WHERE user_id = ? AND date IN ({placeholders}) ORDER BY id""",
+                            (user_id, *dates)).fetchall()
+
+    def daily_history(self, user_id, start, end):
+        """
+        Napi kalória összegek és azok heti / havi összesítései egy időszakra.
+
+        Egyetlen lekérdezés az idx_users_meals_user_date indexen: a napi
+        összegeket GROUP BY, a hetekre (hétfőtől) és hónapokra vett
+        összegeket és a naplózott napok számát ablakfüggvények adják.
+        A heti és havi értékek csak a megadott időszakon belüli napokat
+        tartalmazzák.
+
+        Returns:
+            [(date, kcal, week, week_kcal, week_days, month, month_kcal, month_days), ...]
+            dátum szerint növekvő sorrendben (week: a hét hétfője, month: "YYYY-MM")
+        """
+        return self.execute("""
+            WITH days AS (
+                SELECT date, SUM(calories) AS kcal
+                FROM users_meals
+                WHERE user_id = ? AND date BETWEEN ? AND ?
+                GROUP BY date
+            )
+            SELECT date, kcal,
+                   date(date, 'weekday 0', '-6 days') AS week,
+                   SUM(kcal) OVER week_window, COUNT(*) OVER week_window,
+                   substr(date, 1, 7) AS month,
+                   SUM(kcal) OVER month_window, COUNT(*) OVER month_window
+            FROM days
+            WINDOW week_window AS (PARTITION BY date(date, 'weekday 0', '-6 days')),
+                   month_window AS (PARTITION BY substr(date, 1, 7))
+            ORDER BY date
+        """, (user_id, start, end)).fetchall()
+
+    def daily_kcal(self, user_id):
+        """
+        A felhasználó összes naplózott napjának kalória összege a daily_totals
+        összesítő táblából (naponként egy sor, az elsődleges kulcson olvasva).
+
+        Returns:
+            [(date, kcal), ...] dátum szerint növekvő sorrendben
+        """
+        return self.execute("""SELECT date, kcal FROM daily_totals WHERE user_id = ? ORDER BY date""",
+                            (user_id,)).fetchall()
+
+    def add(self, user_id, table_name, food_name, calories, amount, date, food_id=None):
+        return self.execute("""
+            INSERT INTO users_meals (user_id, table_name, food_name, calories, amount, date, food_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (user_id, table_name, food_name, calories, amount, date, food_id)).lastrowid
+
+    def add_many(self, meals):
+        """
+        Args:
+            meals: [(user_id, table_name, food_name, calories, amount, date, food_id), ...]
+                   (food_id egyéni ételnél None)
+
+        Returns:
+            [id, ...] a beszúrt sorok azonosítói a meals sorrendjében. Az író
+            szál egyetlen írója a táblának, így egy executemany AUTOINCREMENT
+            azonosítói folytonosak, az utolsóból visszaszámolhatók.
+        """
+        meals = list(meals)
+        connection = self.db.connection()
+        connection.executemany("""
+            INSERT INTO users_meals (user_id, table_name, food_name, calories, amount, date, food_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, meals)
+        if not meals:
+            return []
+        last_id = connection.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last_id - len(meals) + 1, last_id + 1))
+
+    def all_foods(self):
+        """Returns: [(kategória, id, név, kcal/100, mértékegység), ...] a teljes katalógus (a FoodCatalog betöltéséhez)"""
+        return self.execute("""SELECT category, id, name, kcal_per_100, unit FROM foods ORDER BY id""").fetchall()
+
+
+class TrainingDayRepository(Repository):
+    """A training_days tábla lekérdezései."""
+
+    def names(self, user_id):
+        return [row[0] for row in self.execute("""SELECT day_name FROM training_days WHERE user_id = ? ORDER BY id""",
+                                               (user_id,)).fetchall()]
+
+    def find_id(self, user_id, day_name):
+        row = self.execute("""SELECT id FROM training_days WHERE user_id = ? AND day_name = ?""",
+                           (user_id, day_name)).fetchone()
+        return row[0] if row else None
+
+    def add(self, user_id, day_name):
+        return self.execute("""
+            INSERT INTO training_days (user_id, day_name)
+            VALUES (?, ?)
+        """, (user_id, day_name)).lastrowid
+
+    def delete(self, day_id):
+        """A nap és a hozzá tartozó összes gyakorlat törlése."""
+        self.execute("DELETE FROM exercises WHERE day_id = ?", (day_id,))
+        self.execute("DELETE FROM training_days WHERE id = ?", (day_id,))
+
+
+class ExerciseRepository(Repository):
+    """Az exercises tábla és a gyakorlat katalógus (izomcsoport táblák) lekérdezései."""
+
+    def for_day(self, day_id):
+        """Returns: [(id, exercise_name, sets, reps, weight, equipment, difficulty, description), ...]"""
+        return self.execute("""SELECT id, exercise_name, sets, reps, weight, equipment, difficulty, description FROM exercises WHERE day_id = ? ORDER BY id""",
+                            (day_id,)).fetchall()
+
+    def for_day_page(self, day_id, after_id=None, before_id=None, limit=50):
+        """Returns: [(id, exercise_name, sets, reps, weight, equipment, difficulty, description), ...] egy lap"""
+        if before_id is not None:
+            return self.execute("""SELECT id, exercise_name, sets, reps, weight, equipment, difficulty, description
+                                   FROM exercises WHERE day_id = ? AND id < ? ORDER BY id DESC LIMIT ?""",
+                                (day_id, before_id, limit)).fetchall()[::-1]
+        return self.execute("""SELECT id, exercise_name, sets, reps, weight, equipment, difficulty, description
+                               FROM exercises WHERE day_id = ? AND id > ? ORDER BY id LIMIT ?""",
+                            (day_id, after_id or 0, limit)).fetchall()
+
+    def add(self, day_id, exercise_name, sets, reps, weight, equipment, difficulty, description, muscle_group=None):
+        return self.execute("""
+            INSERT INTO exercises (
+                day_id, exercise_name, sets, reps, weight,
+                equipment, difficulty, description, muscle_group
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (day_id, exercise_name, sets, reps, weight, equipment, difficulty, description, muscle_group)).lastrowid
+
+    def add_many(self, exercises):
+        """
+        Args:
+            exercises: [(day_id, exercise_name, sets, reps, weight, equipment, difficulty, description, muscle_group), ...]
+        """
+        self.db.connection().executemany("""
+            INSERT INTO exercises (
+                day_id, exercise_name, sets, reps, weight,
+                equipment, difficulty, description, muscle_group
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, exercises)
+
+    def delete_many(self, exercise_ids):
+        """
+        Args:
+            exercise_ids: [id, ...] a törlendő gyakorlatok azonosítói (a táblázat sorainak iid-je)
+        """
+        self.db.connection().executemany("""DELETE FROM exercises WHERE id = ?""",
+                                         [(exercise_id,) for exercise_id in exercise_ids])
+
+    def volume_by_group(self, user_id):
+        """
+        A heti terv (az összes edzésnap) összesítése izomcsoportonként a
+        training_volume összesítő táblából (az elsődleges kulcson olvasva).
+
+        Returns:
+            [(muscle_group, exercises, sets, volume), ...] volumen szerint csökkenő
+            sorrendben (ismeretlen izomcsoportnál muscle_group üres)
+        """
+        return self.execute("""SELECT muscle_group, exercises, sets, volume FROM training_volume
+                               WHERE user_id = ? ORDER BY volume DESC, sets DESC, muscle_group""",
+                            (user_id,)).fetchall()
+
+    def catalog_entries(self):
+        """
+        A teljes gyakorlat katalógus egyetlen lekérdezéssel (az ExerciseCatalog betöltéséhez).
+
+        Returns:
+            [(izomcsoport, gyakorlat neve, szükséges eszközök, nehézségi szint, leírás), ...]
+        """
+        selects = [f'''SELECT '{group}', [Gyakorlat neve], [Szükséges eszközök], [Nehézségi szint], [Leírás]
+            FROM "{group}"''' for group in MUSCLE_GROUPS]
+        return self.execute("\nUNION ALL\n".join(selects)).fetchall()
+
+
+class WorkoutSetRepository(Repository):
+    """A workout_sets tábla (elvégzett sorozatok naplója) lekérdezései."""
+
+    def add(self, user_id, exercise, reps, weight, ts):
+        """
+        Egy elvégzett sorozat hozzáfűzése a naplóhoz (egyetlen INSERT).
+
+        Args:
+            ts: Az elvégzés időpontja (Unix időbélyeg, másodperc)
+        """
+        return self.execute("""
+            INSERT INTO workout_sets (user_id, exercise, ts, reps, weight)
+            VALUES (?, ?, ?, ?, ?)
+        """, (user_id, exercise, int(ts), reps, weight)).lastrowid
+
+    def last_set(self, user_id, exercise):
+        """Returns: (reps, weight) a gyakorlat legutóbb naplózott sorozata, vagy None"""
+        return self.execute("""SELECT reps, weight FROM workout_sets
+                               WHERE user_id = ? AND exercise = ? ORDER BY ts DESC LIMIT 1""",
+                            (user_id, exercise)).fetchone()
+
+    def recent_sessions(self, user_id, exercise, limit=10):
+        """
+        A gyakorlat utolsó `limit` edzése (edzés = naptári nap, helyi idő szerint).
+
+        A rekurzív CTE az indexen visszafelé lépked: minden lépés egy
+        indexkeresés (az előző nap előtti utolsó sorozat), így csak az
+        utolsó `limit` nap sorai kerülnek beolvasásra, a napló méretétől
+        függetlenül.
+
+        Returns:
+            [(nap, sorozatok, ismétlések, max. súly, volumen), ...] a legújabbal kezdve
+        """
+        return self.execute("""
+            WITH RECURSIVE sessions(day, number) AS (
+                SELECT date(MAX(ts), 'unixepoch', 'localtime'), 1
+                FROM workout_sets
+                WHERE user_id = :user_id AND exercise = :exercise
+                UNION ALL
+                SELECT (SELECT date(MAX(ts), 'unixepoch', 'localtime')
+                        FROM workout_sets
+                        WHERE user_id = :user_id AND exercise = :exercise
+                          AND ts < CAST(strftime('%s', sessions.day, 'utc') AS INTEGER)),
+                       number + 1
+                FROM sessions
+                WHERE sessions.day IS NOT NULL AND number < :limit
+            )
+            SELECT date(ts, 'unixepoch', 'localtime') AS day,
+                   COUNT(*), SUM(reps), MAX(weight), SUM(reps * weight)
+            FROM workout_sets
+            WHERE user_id = :user_id AND exercise = :exercise
+              AND ts >= (SELECT CAST(strftime('%s', MIN(day), 'utc') AS INTEGER) FROM sessions)
+            GROUP BY day
+            ORDER BY day DESC
+        """, {"user_id": user_id, "exercise": exercise, "limit": limit}).fetchall()
@@ -0,0 +1,118 @@
+"""
+Felület ütemező
+---------------
+Sűrűn érkező események (ablak átméretezés, egymás után visszaérkező
+adatbázis callbackek) összevonása: minden feladat névvel kerül az
+ütemezőbe, és a következő üresjáratban (egyetlen `after_idle`) egyszer
+fut le, a legutóbb megadott argumentumokkal. Így egy átméretezés vagy
+több étel / gyakorlat egymás utáni mentése egyetlen újrarajzolást okoz.
+
+A névvel ellátott eseménykötések (bind) ismételt megadáskor lecserélődnek,
+nem halmozódnak.
+"""
+
+import sys
+import tkinter
+
+
+class UiScheduler:
+    """
+    Névvel ellátott, üresjáratban futó feladatok és eseménykötések.
+    """
+
+    def __init__(self, root):
+        """
+        Args:
+            root: A Tk főablak (az after_idle ütemezéshez)
+        """
+        self.root = root
+        self.pending = {}
+        self.idle_id = None
+        self.bindings = {}
+
+    def schedule(self, name, callback, *args):
+        """
+        Feladat ütemezése a következő üresjáratra.
+
+        Ha azonos nevű feladat már vár, csak a függvény és az argumentumok
+        cserélődnek le, a feladat egyszer fut le.
+
+        Args:
+            name: A feladat neve (pl. "diet_day")
+            callback: callback(*args)
+        """
+        self.pending[name] = (callback, args)
+        if self.idle_id is None:
+            self.idle_id = self.root.after_idle(self._run_idle)
+
+    def flush(self):
+        """A várakozó feladatok azonnali lefuttatása."""
+        if self.idle_id is not None:
+            self.root.after_cancel(self.idle_id)
+            self.idle_id = None
+        self._run_pending()
+
+    def cancel(self, name):
+        """A névhez tartozó várakozó feladat és eseménykötés törlése."""
+        self.pending.pop(name, None)
+        self.unbind(name)
+
+    def cancel_all(self):
+        """Minden várakozó feladat és eseménykötés törlése (pl. képernyő törlésekor)."""
+        self.pending.clear()
+        if self.idle_id is not None:
+            self.root.after_cancel(self.idle_id)
+            self.idle_id = None
+        for name in list(self.bindings):
+            self.unbind(name)
+
+    def bind(self, name, widget, sequence, callback):
+        """
+        Névvel ellátott eseménykötés, ami a callbacket ütemezi.
+
+        Az azonos nevű korábbi kötés törlődik. Csak a widget saját eseményei
+        számítanak: a főablakra kötött eseményt (pl. <Configure>) minden
+        gyerek widget is kiváltja, ezek kimaradnak.
+
+        Args:
+            name: A kötés (és az ütemezett feladat) neve
+            widget: A widget, amire az esemény kötődik
+            sequence: Az esemény (pl. "<Configure>")
+            callback: callback(event), üresjáratban, a legutolsó eseménnyel
+        """
+        self.unbind(name)
+        widget_name = str(widget)
+
+        def handler(event):
+            if str(event.widget) == widget_name:
+                self.schedule(name, callback, event)
+
+        funcid = widget.bind(sequence, handler, add="+")
+        self.bindings[name] = (widget, sequence, funcid)
+
+    def unbind(self, name):
+        """
+        A névhez tartozó eseménykötés törlése, a widget többi kötése megmarad.
+        """
+        binding = self.bindings.pop(name, None)
+        if binding is None:
+            return
+        widget, sequence, funcid = binding
+        try:
+            script = widget.bind(sequence)
+            widget.bind(sequence, "\n".join(line for line in script.split("\n") if funcid not in line))
+            widget.deletecommand(funcid)
+        except tkinter.TclError:
+            pass
+
+    def _run_idle(self):
+        self.idle_id = None
+        self._run_pending()
+
+    def _run_pending(self):
+        pending, self.pending = self.pending, {}
+        for callback, args in pending.values():
+            try:
+                callback(*args)
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
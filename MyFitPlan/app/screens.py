@@ -0,0 +1,63 @@
+"""
+Képernyő kezelő
+---------------
+A bejelentkezés utáni oldalak (Profil, Étrend, Edzés) bejelentkezésenként
+egyszer épülnek fel, mindegyik a saját, az egész ablakot kitöltő keretében.
+Navigációkor a kért oldal kerete kerül felülre (tkraise), és csak az oldal
+adatokhoz kötött részei frissülnek, a widgetek nem jönnek létre újra.
+
+Kijelentkezéskor (clear_screen) a keretek megsemmisülnek, a következő
+bejelentkezés után az oldalak újra felépülnek.
+"""
+
+import ttkbootstrap as ttk
+
+
+class ScreenManager:
+    """
+    A felépített oldalak keretei név szerint.
+    """
+    def __init__(self, root):
+        """
+        Args:
+            root: A Tk főablak, ebbe kerülnek az oldalak keretei
+        """
+        self.root = root
+        self.screens = {}
+        self.current = None
+
+    def show(self, name, build, refresh=None):
+        """
+        Oldal megjelenítése.
+
+        Első megjelenítéskor létrehozza az oldal keretét és meghívja rá
+        a build függvényt, majd minden megjelenítéskor a refresh függvényt.
+
+        Args:
+            name: Az oldal neve (pl. "diet")
+            build: build(keret), az oldal widgetjeinek létrehozása
+            refresh: refresh(), az oldal adatainak frissítése
+
+        Returns:
+            Az oldal kerete
+        """
+        screen = self.screens.get(name)
+        if screen is None:
+            screen = ttk.Frame(self.root, style="Screen.TFrame")
+            screen.place(x=0, y=0, relwidth=1, relheight=1)
+            self.screens[name] = screen
+            build(screen)
+
+        screen.tkraise()
+        self.current = name
+        if refresh:
+            refresh()
+        return screen
+
+    def is_empty(self):
+        return not self.screens
+
+    def reset(self):
+        """A keretek elfelejtése (a widgeteket a hívó semmisíti meg)."""
+        self.screens = {}
+        self.current = None
@@ -0,0 +1,77 @@
+"""
+Indítási idő mérése
+-------------------
+Az indítás szakaszainak (importok, ablak, adatbázis, stílusok, bejelentkező
+képernyő, első kirajzolás) időmérése. A mérés mindig fut (két
+`perf_counter` hívás szakaszonként), a jelentés csak a `--profile-startup`
+kapcsolóval indítva készül el:
+
+    python main.py --profile-startup
+    MyFitPlan.exe --profile-startup
+
+A jelentés a hibakimenetre (stderr) kerül, konzol nélküli (PyInstaller
+windowed) futtatásnál az alkalmazás mellé, a PROFILE_FILE fájlba.
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from app.paths import resource_path
+
+PROFILE_FLAG = "--profile-startup"
+PROFILE_FILE = "startup_profile.txt"
+
+
+class StartupProfiler:
+    """
+    Az indítási szakaszok időtartamai és az első kirajzolás ideje.
+    """
+
+    def __init__(self, enabled=False, started=None):
+        """
+        Args:
+            enabled: Készüljön-e jelentés (report)
+            started: A folyamat indulásának ideje (perf_counter), alapértelmezetten most
+        """
+        self.enabled = enabled
+        self.started = time.perf_counter() if started is None else started
+        self.phases = []
+        self.first_frame = None
+
+    @classmethod
+    def from_argv(cls, argv, started=None):
+        """Profiler a parancssori kapcsoló alapján (a kapcsoló nélkül kikapcsolva)."""
+        return cls(PROFILE_FLAG in argv[1:], started)
+
+    @contextmanager
+    def phase(self, name):
+        """Egy szakasz időtartamának mérése: `with profiler.phase("ablak"): ...`"""
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - begin))
+
+    def mark_first_frame(self):
+        """Az első kirajzolás idejének rögzítése (az indulástól számítva)."""
+        if self.first_frame is None:
+            self.first_frame = time.perf_counter() - self.started
+
+    def lines(self):
+        """Returns: A jelentés sorai (ezredmásodpercben)"""
+        lines = [f"{name:<28}{seconds * 1000:9.1f} ms" for name, seconds in self.phases]
+        if self.first_frame is not None:
+            lines.append(f"{'első kirajzolás (összesen)':<28}{self.first_frame * 1000:9.1f} ms")
+        return lines
+
+    def report(self):
+        """A jelentés kiírása, ha a profilozás be van kapcsolva."""
+        if not self.enabled:
+            return
+        text = "MyFitPlan indítás\n" + "\n".join(self.lines()) + "\n"
+        if sys.stderr is not None:
+            sys.stderr.write(text)
+            sys.stderr.flush()
+        else:
+            with open(resource_path(PROFILE_FILE), "w", encoding="utf-8") as profile_file:
+                profile_file.write(text)
@@ -0,0 +1,77 @@
+"""
+Táblázat szinkronizálás
+-----------------------
+Treeview táblázatok frissítése törlés és teljes újratöltés helyett.
+
+A sorok azonosítója (iid) az adatbázis sor azonosítója, így frissítéskor
+csak a megváltozott sorokhoz kell nyúlni: az új sorok beszúródnak, a
+módosultak értéke frissül, a már nem létezők törlődnek. A változatlan
+sorok megmaradnak, ezért a kijelölés és a görgetési pozíció sem vész el.
+
+A táblázatba legutóbb beírt értékeket a modul tartja nyilván (a widget
+megszűnésével együtt törlődnek), így az összehasonlításhoz nem kell
+minden sort visszaolvasni a Tk-ból.
+
+A mentés visszaigazolása előtt (optimistán) beszúrt sorok ideiglenes
+azonosítót kapnak (pending_iid, pl. "pending-3"). Ezek nem adatbázis
+azonosítók, ezért törölni nem lehet őket az adatbázisból; a mentés
+utáni frissítés a valódi azonosítójú sorra cseréli őket.
+"""
+
+import itertools
+import weakref
+
+PENDING_PREFIX = "pending-"
+
+_synced_rows = weakref.WeakKeyDictionary()
+_pending_ids = itertools.count(1)
+
+
+def pending_iid():
+    """Returns: Ideiglenes iid egy még nem mentett sorhoz"""
+    return f"{PENDING_PREFIX}{next(_pending_ids)}"
+
+
+def is_pending(iid):
+    """Returns: True, ha a sor még nem mentett (ideiglenes azonosítójú)"""
+    return str(iid).startswith(PENDING_PREFIX)
+
+
+def sync_rows(table, rows):
+    """
+    Táblázat tartalmának összefésülése a kívánt sorokkal.
+
+    Args:
+        table: ttk.Treeview
+        rows: [(azonosító, (érték, ...)), ...] a megjelenítés sorrendjében
+
+    Returns:
+        (beszúrt, módosított, törölt) sorok száma
+    """
+    rows = [(str(iid), tuple(values)) for iid, values in rows]
+    wanted = dict(rows)
+    previous = _synced_rows.get(table, {})
+
+    children = table.get_children()
+    stale = [iid for iid in children if iid not in wanted]
+    if stale:
+        table.delete(*stale)
+
+    kept = [iid for iid in children if iid in wanted]
+    kept_set = set(kept)
+    ordered = [iid for iid, _ in rows if iid in kept_set]
+    if kept != ordered:
+        for iid in ordered:
+            table.move(iid, "", "end")
+
+    inserted = updated = 0
+    for index, (iid, values) in enumerate(rows):
+        if iid not in kept_set:
+            table.insert("", index, iid=iid, values=values)
+            inserted += 1
+        elif previous.get(iid) != values:
+            table.item(iid, values=values)
+            updated += 1
+
+    _synced_rows[table] = wanted
+    return inserted, updated, len(stale)
@@ -0,0 +1,113 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+import numpy as np
+from app.database import ConnectionManager
+from app.migrations import migrate
+from app.repositories import UserRepository, MealRepository
+from app.analytics import MealTrends, report_lines, main
+
+class TestMealTrends(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.trends = MealTrends(["2025-01-06", "2025-01-07", "2025-01-09", "2025-01-10"],
+                                 [2000, 1500, 3000, 1800])
+
+    def test_calendar(self):
+        """Folytonos naptár, a nem naplózott napok NaN értékkel"""
+        self.assertEqual(len(self.trends), 5)
+        self.assertEqual(self.trends.logged.tolist(), [True, True, False, True, True])
+        self.assertTrue(np.isnan(self.trends.kcal[2]))
+        self.assertEqual(len(MealTrends()), 0)
+
+    def test_rolling_average(self):
+        """A mozgó átlag csak a naplózott napokat átlagolja"""
+        np.testing.assert_allclose(self.trends.rolling_average(2), [2000, 1750, 1500, 3000, 2400])
+        np.testing.assert_allclose(self.trends.rolling_average(7), [2000, 1750, 1750, 2166.666667, 2075])
+        self.assertTrue(np.isnan(MealTrends(["2025-01-01", "2025-01-05"], [1, 1]).rolling_average(2)[2]))
+
+    def test_balance_and_streaks(self):
+        """Egyenleg és a keret alatti sorozatok"""
+        np.testing.assert_allclose(self.trends.balance(2000)[[0, 1, 3, 4]], [0, -500, 1000, -200])
+        self.assertEqual(self.trends.streaks(2000), (1, 2))
+        self.assertEqual(self.trends.streaks(1000), (0, 0))
+        self.assertEqual(self.trends.streaks(5000), (2, 2))
+        self.assertEqual(MealTrends().streaks(2000), (0, 0))
+
+    def test_weekday_averages(self):
+        """Átlag a hét napjai szerint, hétfőtől"""
+        trends = MealTrends(["2025-01-06", "2025-01-13", "2025-01-14"], [1000, 2000, 1500])
+        averages = trends.weekday_averages()
+
+        self.assertEqual(averages[:2].tolist(), [1500, 1500])
+        self.assertTrue(np.isnan(averages[2:]).all())
+
+    def test_summary(self):
+        """Összefoglaló a napi kerettel és nélküle"""
+        summary = self.trends.summary(2000)
+
+        self.assertEqual((summary.logged_days, summary.first, summary.last), (4, "2025-01-06", "2025-01-10"))
+        self.assertEqual((summary.average_7, summary.average_30, summary.balance_30), (2075, 2075, 75))
+        self.assertEqual((summary.current_streak, summary.longest_streak), (1, 2))
+        self.assertEqual(summary.weekdays, [2000, 1500, None, 3000, 1800, None, None])
+        self.assertIsNone(self.trends.summary().balance_30)
+        self.assertEqual(MealTrends().summary(2000).logged_days, 0)
+
+    def test_plot(self):
+        """A grafikon elemei képpontokban"""
+        geometry = self.trends.plot("2025-01-10", 300, 100, 2000, days=5)
+
+        self.assertEqual(len(geometry.bars), 4)
+        self.assertEqual(geometry.over, [False, False, True, False])
+        self.assertEqual(len(geometry.line), 10)
+        self.assertTrue(all(bar[3] == 92 for bar in geometry.bars))
+        self.assertEqual(min(bar[1] for bar in geometry.bars), 16)
+        self.assertEqual(geometry.target, 41)
+
+        empty = MealTrends().plot("2025-01-10", 300, 100)
+        self.assertEqual((empty.bars, empty.line, empty.target), ([], [], None))
+        with self.assertRaises(ValueError):
+            self.trends.plot("nem dátum", 300, 100)
+
+    def test_report(self):
+        """Szöveges jelentés"""
+        lines = report_lines(self.trends, 2000)
+
+        self.assertIn("Átlagos napi egyenleg (30 nap): +75 kcal", lines)
+        self.assertIn("  Szerda    -", lines)
+        self.assertEqual(report_lines(MealTrends()), ["Nincs naplózott nap."])
+
+class TestAnalyticsCommand(unittest.TestCase):
+
+    def test_main(self):
+        """Felület nélküli jelentés több felhasználóról"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "teszt.db")
+        db = ConnectionManager(path)
+        migrate(db.connection())
+        user_id = UserRepository(db).add("Teszt", "Elek", "teszt@example.com", "jelszo", 30, 180, 80, "Férfi", "Közepes")
+        MealRepository(db).add_many([(user_id, "lunch_table", "rizs", 1800, 100, "2025-01-01", None),
+                                     (user_id, "dinner_table", "hal", 400, 100, "2025-01-01", None)])
+        db.connection().commit()
+        db.close()
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            status = main(["teszt@example.com", "nincs@example.com", "--tdee", "2000", "--db", path])
+
+        self.assertEqual(status, 1)
+        self.assertIn("  7 napos átlag: 2200 kcal", output.getvalue())
+        self.assertIn("  Keret alatti napok sorozata: 0 nap (leghosszabb: 0 nap)", output.getvalue())
+        self.assertIn("nincs@example.com\n  Nincs ilyen felhasználó.", output.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_analytics.py
+     coverage run -m unittest app/tesztek/test_analytics.py
+     coverage report
+"""
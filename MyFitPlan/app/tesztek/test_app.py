@@ -1,6 +1,9 @@
 import unittest
 from unittest.mock import MagicMock, patch
 from app.app import MyFitPlan
+from app.assets import NAVIGATION_IMAGES
+from app.database import ConnectionManager
+from app.migrations import SCHEMA_VERSION, get_schema_version
 
 class TestMyFitPlan(unittest.TestCase):
     
@@ -8,19 +11,78 @@ class TestMyFitPlan(unittest.TestCase):
         """Teszt környezet előkészítése"""
         self.root = MagicMock()
         with patch('app.app.UserManager'), \
-             patch('app.app.DietManager'), \
-             patch('app.app.TrainingManager'), \
-             patch('app.app.sqlite3'):
+             patch('app.app.ConnectionManager'), \
+             patch('app.app.DatabaseWorker'):
             self.app = MyFitPlan(self.root)
 
+    def test_startup_defers_work(self):
+        """Az első kirajzolás előtt csak a bejelentkező képernyő készül el"""
+        self.app.user_manager.login_or_register.assert_called_once()
+        self.app.db.connection.assert_not_called()
+        self.assertFalse(self.app.styles_configured)
+        self.root.after_idle.assert_called_with(self.app.first_frame)
+
+        self.app.first_frame()
+        self.assertIsNotNone(self.app.profiler.first_frame)
+        self.root.after.assert_called_with(0, self.app.warm_up)
+
+        with patch('ttkbootstrap.PhotoImage') as mock_photo:
+            self.app.warm_up()
+        self.app.db.connection.assert_called_once()
+        self.assertEqual([name for name, _ in self.app.profiler.phases][-2:], ["séma ellenőrzés", "navigációs képek"])
+        self.assertEqual(mock_photo.call_count, len(NAVIGATION_IMAGES))
+
+    def test_lazy_managers(self):
+        """Az étrend, edzés és előzmények kezelő első használatkor jön létre"""
+        self.assertIsNone(self.app._meal_manager)
+        self.assertIsNone(self.app._training_manager)
+        self.assertIsNone(self.app._history_manager)
+
+        with patch('app.diet_manager.DietManager') as mock_diet, \
+             patch('app.training_manager.TrainingManager') as mock_training, \
+             patch('app.history_manager.HistoryManager') as mock_history:
+            self.assertIs(self.app.meal_manager, mock_diet.return_value)
+            self.assertIs(self.app.meal_manager, mock_diet.return_value)
+            self.assertIs(self.app.training_manager, mock_training.return_value)
+            self.assertIs(self.app.history_manager, mock_history.return_value)
+
+        mock_diet.assert_called_once_with(self.app)
+        mock_training.assert_called_once_with(self.app)
+        mock_history.assert_called_once_with(self.app)
+
     def test_clear_screen(self):
         """Képernyő tisztítás tesztelése"""
         mock_widget = MagicMock()
         self.root.winfo_children.return_value = [mock_widget]
+        pending = MagicMock()
+        self.app.scheduler.schedule("diet_day", pending)
         
         self.app.clear_screen()
+        self.app.scheduler.flush()
         
         mock_widget.destroy.assert_called_once()
+        pending.assert_not_called()
+        self.assertTrue(self.app.screens.is_empty())
+        self.assertIsNone(self.app.top_frame)
+
+    def test_show_screen(self):
+        """Az oldalak egyszer épülnek fel, utána csak frissülnek"""
+        build = MagicMock()
+        refresh = MagicMock()
+
+        with patch('ttkbootstrap.Frame', side_effect=lambda *args, **kwargs: MagicMock()), \
+             patch.object(self.app, 'load_navigation_bar') as mock_navigation, \
+             patch.object(self.app, 'clear_screen') as mock_clear:
+            self.app.show_screen("diet", build, refresh)
+            self.app.show_screen("training", MagicMock(), MagicMock())
+            self.app.show_screen("diet", build, refresh)
+
+        mock_clear.assert_called_once()
+        self.assertTrue(self.app.styles_configured)
+        build.assert_called_once()
+        self.assertEqual(refresh.call_count, 2)
+        self.assertEqual(mock_navigation.call_count, 3)
+        self.assertEqual(self.app.screens.current, "diet")
 
     def test_back(self):
         """Visszalépő funkció tesztelése"""
@@ -54,33 +116,52 @@ class TestMyFitPlan(unittest.TestCase):
             
             mock_canvas.assert_called_once()
             mock_frame.assert_called()
-            self.assertEqual(mock_button.call_count, 10)
+            self.assertEqual(mock_button.call_count, 12)
+            self.assertIsNone(self.app._meal_manager)
+            self.assertIsNone(self.app._training_manager)
+            self.assertIsNone(self.app._history_manager)
+
+            self.app.load_navigation_bar()
+
+            mock_canvas.assert_called_once()
+            self.assertEqual(mock_button.call_count, 12)
 
     def test_create_database(self):
         """Adatbázis létrehozás tesztelése"""
-        mock_cursor = MagicMock()
-        mock_connection = MagicMock()
-        
-        self.app.db_cursor = mock_cursor
-        self.app.db_connection = mock_connection
-        
+        self.app.db = ConnectionManager(":memory:")
+        self.app.food_catalog = MagicMock()
+        self.app.exercise_catalog = MagicMock()
+
         self.app.create_database()
-        
-        expected_tables = ['CREATE TABLE IF NOT EXISTS users',
-                           'CREATE TABLE IF NOT EXISTS users_meals',
-                           'CREATE TABLE IF NOT EXISTS training_days',
-                           'CREATE TABLE IF NOT EXISTS exercises',]
-        
-        calls = mock_cursor.execute.call_args_list
-        for expected_table in expected_tables:
-            found = False
-            for call in calls:
-                if expected_table in call[0][0]:
-                    found = True
-                    break
-            self.assertTrue(found, f"Hiányzó tábla létrehozás: {expected_table}")
-        
-        mock_connection.commit.assert_called_once()
+
+        self.app.food_catalog.invalidate.assert_called_once()
+        self.app.exercise_catalog.invalidate.assert_called_once()
+
+        tables = {row[0] for row in self.app.db.connection().execute(
+            "SELECT name FROM sqlite_master WHERE type='table'")}
+        for expected_table in ['users', 'users_meals', 'training_days', 'exercises']:
+            self.assertIn(expected_table, tables, f"Hiányzó tábla létrehozás: {expected_table}")
+
+        self.assertEqual(get_schema_version(self.app.db.connection()), SCHEMA_VERSION)
+
+    def test_meals_imported(self):
+        """Importálás után az étkezések gyorsítótárai ürülnek"""
+        self.app.calorie_history = MagicMock()
+        self.app.meals_imported()
+        self.app.calorie_history.clear.assert_called_once()
+
+        self.app._meal_manager = MagicMock()
+        self.app.meals_imported()
+        self.app._meal_manager.snapshots.clear.assert_called_once()
+        self.assertIsNone(self.app._meal_manager.snapshot)
+        self.assertIsNone(self.app._meal_manager.trends)
+
+    def test_quit(self):
+        """Kilépés előtt a függőben lévő írások mentése"""
+        self.app.quit()
+
+        self.app.db_worker.stop.assert_called_once()
+        self.root.quit.assert_called_once()
 
     def test_custom_messagebox(self):
         """Egyedi üzenetablak tesztelése"""
@@ -100,10 +181,58 @@ class TestMyFitPlan(unittest.TestCase):
             mock_popup.title.assert_called_with(test_title)
             mock_label.assert_called_once()
             mock_button.assert_called_once()
-            
-            self.app.custom_messagebox(test_title, test_message, login=True)
-            self.app.custom_messagebox(test_title, test_message, diet=True)
-            self.app.custom_messagebox(test_title, test_message, profile=True)
+
+            dialog = self.app.dialogs.get("message", test_title, 500, 200, MagicMock())
+            dialog.hide()
+            self.app.custom_messagebox("Siker", "Mentve", profile=True)
+
+            mock_toplevel.assert_called_once()
+            mock_label.assert_called_once()
+            mock_popup.title.assert_called_with("Siker")
+            mock_label.return_value.configure.assert_called_with(text="Mentve")
+
+    def test_messages_queued(self):
+        """Nyitott üzenet közben érkező üzenetek sorban, egymás után jelennek meg"""
+        with patch('ttkbootstrap.Toplevel'), \
+             patch('ttkbootstrap.Label') as mock_label, \
+             patch('ttkbootstrap.Button') as mock_button:
+            self.app.custom_messagebox("Hiba", "Első", login=True)
+            self.app.custom_messagebox("Hiba", "Második", diet=True)
+            self.app.custom_messagebox("Hiba", "Harmadik")
+
+        label = mock_label.return_value
+        label.configure.assert_called_once_with(text="Első")
+        self.assertEqual(len(self.app.pending_messages), 2)
+
+        self.app.user_manager.reset_mock()
+        mock_button.return_value.configure.call_args[1]['command']()
+        self.app.user_manager.login_page.assert_called_once()
+        label.configure.assert_called_once_with(text="Első")
+
+        show_next = self.root.after_idle.call_args[0][0]
+        show_next()
+        label.configure.assert_called_with(text="Második")
+        self.assertEqual(len(self.app.pending_messages), 1)
+
+        self.app.dialogs.hide_all()
+        self.root.after_idle.call_args[0][0]()
+        label.configure.assert_called_with(text="Harmadik")
+        self.assertEqual(len(self.app.pending_messages), 0)
+
+    def test_clear_screen_keeps_dialogs(self):
+        """A képernyő törlése a felugró ablakokat csak elrejti"""
+        with patch('ttkbootstrap.Toplevel') as mock_toplevel, \
+             patch('ttkbootstrap.Label'), \
+             patch('ttkbootstrap.Button'):
+            self.app.custom_messagebox("Hiba", "Hiba történt")
+        mock_widget = MagicMock()
+        self.root.winfo_children.return_value = [mock_toplevel.return_value, mock_widget]
+
+        self.app.clear_screen()
+
+        mock_widget.destroy.assert_called_once()
+        mock_toplevel.return_value.destroy.assert_not_called()
+        mock_toplevel.return_value.withdraw.assert_called()
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,67 @@
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+from app.assets import ImageAssets, NAVIGATION_IMAGES, scaled_image_path
+from app.paths import resource_path
+
+class TestImageAssets(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.root = MagicMock()
+        self.assets = ImageAssets(self.root)
+
+    def test_image_loaded_once(self):
+        """Ugyanaz a kép csak egyszer töltődik be"""
+        with patch('ttkbootstrap.PhotoImage') as mock_photo:
+            first = self.assets.image("backg1.png")
+            second = self.assets.image("backg1.png")
+
+        mock_photo.assert_called_once_with(master=self.root, file=resource_path("Képek/backg1.png"))
+        self.assertIs(first, second)
+        self.assertEqual(len(self.assets), 1)
+
+    def test_prescaled_image(self):
+        """A kicsinyített ikon az előre elkészített fájlból töltődik"""
+        with patch('ttkbootstrap.PhotoImage') as mock_photo:
+            icon = self.assets.image("profile.png", subsample=2)
+            self.assertIs(self.assets.image("profile.png", subsample=2), icon)
+
+        mock_photo.assert_called_once_with(master=self.root, file=resource_path("Képek/kicsi_2/profile.png"))
+        icon.subsample.assert_not_called()
+
+    def test_missing_scaled_variant(self):
+        """Hiányzó változat a teljes méretű képből készül"""
+        full_size = MagicMock()
+        with patch('ttkbootstrap.PhotoImage', return_value=full_size) as mock_photo, \
+             patch('os.path.exists', return_value=False):
+            icon = self.assets.image("profile.png", subsample=3)
+            self.assets.image("profile.png", subsample=3)
+
+        mock_photo.assert_called_once_with(master=self.root, file=resource_path("Képek/profile.png"))
+        full_size.subsample.assert_called_once_with(3)
+        self.assertIs(icon, full_size.subsample.return_value)
+        self.assertIs(self.assets.image("profile.png"), full_size)
+
+    def test_preload(self):
+        """A navigációs sáv képeinek előtöltése"""
+        with patch('ttkbootstrap.PhotoImage') as mock_photo:
+            self.assets.preload()
+
+        self.assertEqual(mock_photo.call_count, len(NAVIGATION_IMAGES))
+        self.assertEqual(len(self.assets), len(NAVIGATION_IMAGES))
+
+    def test_navigation_images_shipped(self):
+        """A navigációs sáv képei és kicsinyített változataik megvannak"""
+        for name, subsample in NAVIGATION_IMAGES:
+            self.assertTrue(os.path.exists(resource_path(f"Képek/{name}")), name)
+            if subsample > 1:
+                self.assertTrue(os.path.exists(resource_path(scaled_image_path(name, subsample))), name)
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_assets.py
+     coverage run -m unittest app/tesztek/test_assets.py
+     coverage report
+"""
@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import MagicMock
+from app.catalog import FoodCatalog, ExerciseCatalog, Food, food_label, food_calories
+
+class TestFoodCatalog(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.meals = MagicMock()
+        self.meals.all_foods.return_value = [("Gyümölcsök", 1, "alma", 52, "g"),
+                                             ("Italok", 2, "víz", 0, "ml"),
+                                             ("Gyümölcsök", 3, "banán", 89, "g")]
+        self.catalog = FoodCatalog(self.meals)
+
+    def test_food_label(self):
+        """Legördülő lista szövegének formátuma"""
+        self.assertEqual(food_label(Food(1, "alma", 52, "g")), "alma (52 kcal/100g)")
+        self.assertEqual(food_label(Food(2, "bacon (sertéshús)", 240, "g")), "bacon (sertéshús) (240 kcal/100g)")
+
+    def test_food_calories(self):
+        """Kalória számítás a rekord számértékeiből"""
+        self.assertEqual(food_calories(Food(1, "alma", 52, "g"), 150), 78)
+        self.assertEqual(food_calories(Food(2, "víz", 0, "ml"), 500), 0)
+
+    def test_lazy_loading(self):
+        """A katalógus csak az első használatkor töltődik be"""
+        self.meals.all_foods.assert_not_called()
+
+        self.assertEqual(self.catalog.categories(), ["Gyümölcsök", "Italok"])
+        self.assertEqual(self.catalog.foods("Gyümölcsök"), [Food(1, "alma", 52, "g"), Food(3, "banán", 89, "g")])
+        self.assertEqual(self.catalog.labels("Italok"), ["víz (0 kcal/100ml)"])
+        self.assertEqual(self.catalog.labels("Ismeretlen"), [])
+        self.assertEqual(self.catalog.index().search("ban"), [Food(3, "banán", 89, "g")])
+
+        self.meals.all_foods.assert_called_once()
+
+    def test_invalidate(self):
+        """Érvénytelenítés után újratöltés"""
+        self.catalog.categories()
+        self.meals.all_foods.return_value = [("Olajok", 4, "olívaolaj", 884, "g")]
+
+        self.catalog.invalidate()
+
+        self.assertEqual(self.catalog.categories(), ["Olajok"])
+        self.assertEqual(self.catalog.index().search("oliva"), [Food(4, "olívaolaj", 884, "g")])
+        self.assertEqual(self.meals.all_foods.call_count, 2)
+
+class TestExerciseCatalog(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.exercises = MagicMock()
+        self.exercises.catalog_entries.return_value = [
+            ("mell", "Fekvőtámasz", "Nincs", "Kezdő", "Alap gyakorlat"),
+            ("mell", "Tárogatás", "Kézi súlyzó", "Közepes", "Mellizom nyújtás"),
+            ("hát", "Húzódzkodás", "Húzódzkodó", "Haladó", "Saját testsúlyos gyakorlat")
+        ]
+        self.catalog = ExerciseCatalog(self.exercises)
+
+    def test_labels_and_info(self):
+        """Izomcsoport és név szerinti elérés a memóriából"""
+        self.assertEqual(self.catalog.labels("mell"), ["Fekvőtámasz | Nincs | Kezdő", "Tárogatás | Kézi súlyzó | Közepes"])
+        self.assertEqual(self.catalog.labels("váll"), [])
+        self.assertEqual(self.catalog.info("hát", "Húzódzkodás"), ("Húzódzkodó", "Haladó", "Saját testsúlyos gyakorlat"))
+        self.assertIsNone(self.catalog.info("mell", "Húzódzkodás"))
+
+        self.exercises.catalog_entries.assert_called_once()
+
+    def test_invalidate(self):
+        """Érvénytelenítés után újratöltés"""
+        self.catalog.labels("mell")
+        self.catalog.invalidate()
+        self.catalog.labels("mell")
+
+        self.assertEqual(self.exercises.catalog_entries.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_catalog.py
+     coverage run -m unittest app/tesztek/test_catalog.py
+     coverage report
+"""
@@ -0,0 +1,149 @@
+import unittest
+from unittest.mock import MagicMock
+from app.day_snapshot import DaySnapshot, SnapshotCache, neighbour_dates
+
+class TestDaySnapshot(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.rows = [(1, "breakfast_table", "zabkása", 300, 200),
+                     (2, "lunch_table", "leves", 200, 300),
+                     (4, "breakfast_table", "kakaó", "120", 250),
+                     (7, "breakfast_table", "kifli", 150, 60)]
+        self.snapshot = DaySnapshot(1, "2025-01-01", self.rows)
+
+    def test_load(self):
+        """Egyetlen lekérdezésből épül fel"""
+        meals = MagicMock()
+        meals.for_day.return_value = self.rows
+
+        snapshot = DaySnapshot.load(meals, 1, "2025-01-01")
+
+        meals.for_day.assert_called_once_with(1, "2025-01-01")
+        self.assertTrue(snapshot.matches(1, "2025-01-01"))
+        self.assertFalse(snapshot.matches(1, "2025-01-02"))
+        self.assertFalse(snapshot.matches(2, "2025-01-01"))
+
+    def test_totals(self):
+        """Étkezésenkénti és napi összegek"""
+        self.assertEqual(self.snapshot.totals, {"breakfast_table": 570, "lunch_table": 200,
+                                                "dinner_table": 0, "other_table": 0})
+        self.assertEqual(self.snapshot.total, 770)
+        self.assertEqual(DaySnapshot(1, "2025-01-01").total, 0)
+
+    def test_page(self):
+        """Kulcsos lapozás azonosító szerint"""
+        self.assertEqual(self.snapshot.page("breakfast_table"),
+                         [(1, "zabkása", 300, 200), (4, "kakaó", "120", 250), (7, "kifli", 150, 60)])
+        self.assertEqual(self.snapshot.page("breakfast_table", limit=2), [(1, "zabkása", 300, 200), (4, "kakaó", "120", 250)])
+        self.assertEqual(self.snapshot.page("breakfast_table", after_id=1, limit=1), [(4, "kakaó", "120", 250)])
+        self.assertEqual(self.snapshot.page("breakfast_table", after_id=2), [(4, "kakaó", "120", 250), (7, "kifli", 150, 60)])
+        self.assertEqual(self.snapshot.page("breakfast_table", before_id=7, limit=1), [(4, "kakaó", "120", 250)])
+        self.assertEqual(self.snapshot.page("breakfast_table", before_id=5), [(1, "zabkása", 300, 200), (4, "kakaó", "120", 250)])
+        self.assertEqual(self.snapshot.page("dinner_table"), [])
+
+    def test_add(self):
+        """Mentett sor hozzáadása a memóriában"""
+        self.snapshot.add(9, "lunch_table", "rizs", 130, 100)
+        self.snapshot.add(3, "breakfast_table", "tea", 0, 300)
+
+        self.assertEqual([row[0] for row in self.snapshot.page("breakfast_table")], [1, 3, 4, 7])
+        self.assertEqual(self.snapshot.page("lunch_table"), [(2, "leves", 200, 300), (9, "rizs", 130, 100)])
+        self.assertEqual(self.snapshot.totals["lunch_table"], 330)
+        self.assertEqual(self.snapshot.total, 900)
+
+        self.snapshot.add(9, "lunch_table", "rizs", 130, 100)
+        self.assertEqual(self.snapshot.total, 900)
+
+    def test_neighbour_dates(self):
+        """Előző, következő nap és a hét többi napja"""
+        self.assertEqual(neighbour_dates("2025-01-01"),
+                         ["2024-12-31", "2025-01-02", "2024-12-30", "2025-01-03", "2025-01-04", "2025-01-05"])
+        self.assertEqual(neighbour_dates("2025-01-06"),
+                         ["2025-01-05", "2025-01-07", "2025-01-08", "2025-01-09", "2025-01-10",
+                          "2025-01-11", "2025-01-12"])
+        self.assertEqual(neighbour_dates("nem dátum"), [])
+
+
+class TestSnapshotCache(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.meals = MagicMock()
+        self.meals.for_day.return_value = [(1, "lunch_table", "leves", 200, 300)]
+        self.worker = MagicMock()
+        self.cache = SnapshotCache(self.meals, self.worker, capacity=3)
+
+    def test_get_uses_cache(self):
+        """Ismételt lekérés lekérdezés nélkül"""
+        snapshot = self.cache.get(1, "2025-01-01")
+
+        self.assertIs(self.cache.get(1, "2025-01-01"), snapshot)
+        self.meals.for_day.assert_called_once_with(1, "2025-01-01")
+        self.cache.get(2, "2025-01-01")
+        self.assertEqual(self.meals.for_day.call_count, 2)
+
+    def test_lru_eviction(self):
+        """A legrégebben használt nap kerül ki"""
+        for date in ("2025-01-01", "2025-01-02", "2025-01-03"):
+            self.cache.get(1, date)
+        self.cache.get(1, "2025-01-01")
+        self.cache.get(1, "2025-01-04")
+
+        self.assertEqual(len(self.cache), 3)
+        self.meals.for_day.reset_mock()
+        self.cache.get(1, "2025-01-01")
+        self.meals.for_day.assert_not_called()
+        self.cache.get(1, "2025-01-02")
+        self.meals.for_day.assert_called_once_with(1, "2025-01-02")
+
+    def test_add_writes_through(self):
+        """Mentés után a gyorsítótárban lévő nap frissül"""
+        snapshot = self.cache.get(1, "2025-01-01")
+
+        self.cache.add(1, "2025-01-01", [(5, "lunch_table", "kenyér", 250, 100)])
+        self.cache.add(1, "2025-01-02", [(6, "lunch_table", "kenyér", 250, 100)])
+
+        self.assertEqual(snapshot.total, 450)
+        self.assertEqual(len(self.cache), 1)
+
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+    def test_prefetch(self):
+        """Szomszédos napok háttérbeli betöltése egy lekérdezéssel"""
+        self.cache = SnapshotCache(self.meals, self.worker)
+        self.cache.get(1, "2025-01-01")
+
+        self.cache.prefetch(1, "2025-01-01")
+
+        self.worker.submit.assert_called_once()
+        args, kwargs = self.worker.submit.call_args
+        dates = neighbour_dates("2025-01-01")
+        self.assertEqual(args, (self.meals.for_days, 1, dates))
+
+        #Töltés közben nem indul újabb lekérdezés ugyanazokra a napokra
+        self.cache.prefetch(1, "2025-01-01")
+        self.worker.submit.assert_called_once()
+
+        kwargs['callback']([("2025-01-02", 7, "dinner_table", "hal", 300, 200)])
+
+        self.meals.for_day.reset_mock()
+        self.assertEqual(self.cache.get(1, "2025-01-02").total, 300)
+        self.assertEqual(self.cache.get(1, "2024-12-31").total, 0)
+        self.meals.for_day.assert_not_called()
+        self.assertEqual(len(self.cache), 1 + len(dates))
+
+        #Hiba esetén a napok később újra kérhetők
+        self.cache.prefetch(1, "2025-01-08")
+        args, kwargs = self.worker.submit.call_args
+        kwargs['error_callback'](Exception("hiba"))
+        self.assertEqual(self.cache.loading, set())
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_day_snapshot.py
+     coverage run -m unittest app/tesztek/test_day_snapshot.py
+     coverage report
+"""
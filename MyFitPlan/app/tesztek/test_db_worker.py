@@ -0,0 +1,131 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock
+from app.database import ConnectionManager
+from app.db_worker import DatabaseWorker
+
+class TestDatabaseWorker(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = ConnectionManager(os.path.join(self.directory.name, "teszt.db"))
+        self.db.connection().execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+        self.db.connection().commit()
+
+        self.root = MagicMock()
+        self.error_handler = MagicMock()
+        self.worker = DatabaseWorker(self.root, self.db, error_handler=self.error_handler)
+
+    def tearDown(self):
+        self.worker.stop()
+        self.db.close()
+        self.directory.cleanup()
+
+    def add_item(self, name):
+        return self.db.connection().execute("INSERT INTO items (name) VALUES (?)", (name,)).lastrowid
+
+    def item_names(self):
+        return [row[0] for row in self.db.connection().execute("SELECT name FROM items ORDER BY id")]
+
+    def test_submit(self):
+        """Írás a háttérszálon, eredmény a callbacken keresztül"""
+        callback = MagicMock()
+        threads = []
+
+        def operation(name):
+            threads.append(threading.current_thread())
+            return self.add_item(name)
+
+        self.worker.submit(operation, "alma", callback=callback)
+
+        self.root.after.assert_called_once()
+        self.worker.flush()
+
+        callback.assert_called_once_with(1)
+        self.assertEqual(threads, [self.worker.thread])
+        self.assertEqual(self.item_names(), ["alma"])
+
+    def test_results_dispatched_by_after(self):
+        """A callback a root.after által ütemezett függvényből hívódik"""
+        callback = MagicMock()
+        self.worker.submit(self.add_item, "alma", callback=callback)
+        self.worker.tasks.join()
+
+        poll = self.root.after.call_args[0][1]
+        poll()
+
+        callback.assert_called_once_with(1)
+        self.assertEqual(self.worker.pending, 0)
+
+    def test_rollback_on_error(self):
+        """Hibás művelet visszagörgetése"""
+        error_callback = MagicMock()
+
+        def operation():
+            self.add_item("alma")
+            self.add_item(None)
+
+        self.worker.submit(operation, error_callback=error_callback)
+        self.worker.flush()
+
+        error_callback.assert_called_once()
+        self.assertIsInstance(error_callback.call_args[0][0], sqlite3.IntegrityError)
+        self.assertEqual(self.item_names(), [])
+
+    def test_default_error_handler(self):
+        """Alapértelmezett hibakezelő használata"""
+        self.worker.submit(lambda: self.db.connection().execute("INSERT INTO missing_table (name) VALUES ('alma')"))
+        self.worker.flush()
+
+        self.error_handler.assert_called_once()
+
+    def test_group_commit(self):
+        """A sorban várakozó műveletek egy tranzakcióban íródnak ki"""
+        started = threading.Event()
+        release = threading.Event()
+        visible = []
+        error_callback = MagicMock()
+
+        def blocking_operation():
+            started.set()
+            release.wait(5)
+
+        def count_committed():
+            reader = sqlite3.connect(self.db.db_path)
+            visible.append(reader.execute("SELECT COUNT(*) FROM items").fetchone()[0])
+            reader.close()
+
+        self.worker.submit(blocking_operation)
+        started.wait(5)
+        self.worker.submit(self.add_item, "alma")
+        self.worker.submit(self.add_item, None, error_callback=error_callback)
+        self.worker.submit(self.add_item, "körte")
+        self.worker.submit(count_committed)
+        release.set()
+        self.worker.flush()
+
+        self.assertEqual(visible, [0])
+        error_callback.assert_called_once()
+        self.assertEqual(self.item_names(), ["alma", "körte"])
+
+    def test_stop_flushes_pending_writes(self):
+        """Leállításkor minden függőben lévő írás lefut"""
+        for name in ["alma", "körte", "szilva"]:
+            self.worker.submit(self.add_item, name)
+
+        self.worker.stop()
+
+        self.assertFalse(self.worker.thread.is_alive())
+        self.assertEqual(self.item_names(), ["alma", "körte", "szilva"])
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_db_worker.py
+     coverage run -m unittest app/tesztek/test_db_worker.py
+     coverage report
+"""
@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from app.dialogs import DialogPool
+
+class TestDialogPool(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.root = MagicMock()
+        self.root.winfo_screenwidth.return_value = 1920
+        self.root.winfo_screenheight.return_value = 1080
+        self.dialogs = DialogPool(self.root)
+
+    def test_built_once(self):
+        """Az ablak egyszer épül fel, a pozíció a méretből számolódik"""
+        build = MagicMock()
+
+        with patch('ttkbootstrap.Toplevel') as mock_toplevel:
+            first = self.dialogs.get("add_day", "Új nap hozzáadása", 400, 200, build)
+            second = self.dialogs.get("add_day", "Új nap hozzáadása", 400, 200, build)
+
+        mock_toplevel.assert_called_once_with(self.root)
+        build.assert_called_once_with(first)
+        self.assertIs(first, second)
+        self.assertEqual(first.geometry, "400x200+760+440")
+        first.window.withdraw.assert_called_once()
+        first.window.update_idletasks.assert_not_called()
+        first.window.protocol.assert_called_once_with("WM_DELETE_WINDOW", first.hide)
+
+    def test_show_and_hide(self):
+        """Megnyitáskor alaphelyzetbe áll, bezáráskor elrejtődik"""
+        reset = MagicMock()
+
+        def build(dialog):
+            dialog.on_reset = reset
+
+        with patch('ttkbootstrap.Toplevel'):
+            dialog = self.dialogs.get("add_food", "Étel hozzáadása", 860, 420, build)
+
+        dialog.show("reggeli")
+        reset.assert_called_once_with("reggeli")
+        dialog.window.deiconify.assert_called_once()
+        dialog.window.grab_set.assert_not_called()
+
+        self.assertTrue(dialog.visible)
+
+        dialog.on_hide = MagicMock()
+        dialog.hide()
+        self.assertEqual(dialog.window.withdraw.call_count, 2)
+        dialog.window.destroy.assert_not_called()
+        self.assertFalse(dialog.visible)
+        dialog.on_hide.assert_called_once()
+
+        dialog.hide()
+        dialog.on_hide.assert_called_once()
+
+    def test_modal_grab(self):
+        """Modális ablak bezárás után visszaadja a grabot"""
+        with patch('ttkbootstrap.Toplevel', side_effect=lambda *args: MagicMock()):
+            confirm = self.dialogs.get("delete_day", "Megerősítés", 600, 200, MagicMock(), modal=True)
+            message = self.dialogs.get("message", "Hiba", 500, 200, MagicMock(), modal=True)
+
+        message.window.grab_current.return_value = confirm.window
+        message.show()
+        message.window.grab_set.assert_called_once()
+
+        message.hide()
+        message.window.grab_release.assert_called_once()
+        confirm.window.grab_set.assert_called_once()
+
+    def test_destroyed_dialog_rebuilt(self):
+        """Megsemmisült ablak helyett új épül"""
+        build = MagicMock()
+
+        with patch('ttkbootstrap.Toplevel', side_effect=lambda *args: MagicMock()):
+            first = self.dialogs.get("message", "Hiba", 500, 200, build)
+            first.window.winfo_exists.return_value = 0
+            second = self.dialogs.get("message", "Hiba", 500, 200, build)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(build.call_count, 2)
+
+    def test_owns_and_hide_all(self):
+        """A képernyő törlése a tárolt ablakokat csak elrejti"""
+        with patch('ttkbootstrap.Toplevel'):
+            dialog = self.dialogs.get("message", "Hiba", 500, 200, MagicMock())
+
+        self.assertTrue(self.dialogs.owns(dialog.window))
+        self.assertFalse(self.dialogs.owns(MagicMock()))
+
+        self.dialogs.hide_all()
+        self.assertEqual(dialog.window.withdraw.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_dialogs.py
+     coverage run -m unittest app/tesztek/test_dialogs.py
+     coverage report
+"""
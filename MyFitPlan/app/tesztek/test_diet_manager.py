@@ -1,12 +1,25 @@
 import unittest
 from unittest.mock import MagicMock, patch
 from app.diet_manager import DietManager
+from app.catalog import FoodCatalog
+from app.dialogs import DialogPool
+from app.day_snapshot import DaySnapshot
+from app.table_sync import is_pending
+from app.scheduler import UiScheduler
+from app.analytics import MealTrends
+from app.diet_manager import load_trends
 
 class TestDietManager(unittest.TestCase):
 
     def setUp(self):
         """Teszt környezet előkészítése"""
         self.mock_app = MagicMock()
+        self.mock_app.meals.for_day.return_value = []
+        self.mock_app.meals.all_foods.return_value = []
+        self.mock_app.food_catalog = FoodCatalog(self.mock_app.meals)
+        self.mock_app.dialogs = DialogPool(self.mock_app.root)
+        self.mock_app.scheduler = UiScheduler(self.mock_app.root)
+        self.mock_app.show_screen.side_effect = lambda name, build, refresh: (build(MagicMock()), refresh())
         self.diet_manager = DietManager(self.mock_app)
 
     def test_user_data_loading(self):
@@ -16,15 +29,7 @@ class TestDietManager(unittest.TestCase):
         self.mock_app.root = MagicMock()
         self.mock_app.activity_factors = {"Közepes": 1.55}
 
-        def mock_execute(query, *args):
-            if 'SELECT eletkor, magassag' in query:
-                self.mock_app.db_cursor.fetchone.return_value = ("25", "180", "75", "Férfi", "Közepes")
-
-            else:
-                self.mock_app.db_cursor.fetchone.return_value = None
-            return self.mock_app.db_cursor
-
-        self.mock_app.db_cursor.execute = MagicMock(side_effect=mock_execute)
+        self.mock_app.users.body_data.return_value = ("25", "180", "75", "Férfi", "Közepes")
         
         with patch('ttkbootstrap.Frame', return_value=MagicMock()) as mock_frame, \
              patch('ttkbootstrap.Meter', return_value=MagicMock()) as mock_meter, \
@@ -32,7 +37,8 @@ class TestDietManager(unittest.TestCase):
              patch('ttkbootstrap.Treeview', return_value=MagicMock()) as mock_treeview, \
              patch('ttkbootstrap.DateEntry', return_value=MagicMock()) as mock_dateentry, \
              patch('ttkbootstrap.Button', return_value=MagicMock()) as mock_button, \
-             patch('ttkbootstrap.PanedWindow', return_value=MagicMock()) as mock_panedwindow:
+             patch('ttkbootstrap.PanedWindow', return_value=MagicMock()) as mock_panedwindow, \
+             patch('ttkbootstrap.Canvas', return_value=MagicMock()) as mock_canvas:
             
             mock_date_entry = MagicMock()
             mock_date_entry.entry = MagicMock()
@@ -41,9 +47,7 @@ class TestDietManager(unittest.TestCase):
             
             self.diet_manager.diet_page()
             
-            self.mock_app.db_cursor.execute.assert_any_call(
-                'SELECT eletkor, magassag, testsuly, nem, aktivitas FROM users WHERE email = ?', 
-                (self.mock_app.logged_in_user,))
+            self.mock_app.users.body_data.assert_called_once_with(self.mock_app.logged_in_user)
             
             expected_bmr = 10 * 75 + 6.25 * 180 - 5 * 25 + 5
             expected_tdee = expected_bmr * 1.55
@@ -57,12 +61,13 @@ class TestDietManager(unittest.TestCase):
              patch('ttkbootstrap.Treeview') as mock_treeview, \
              patch('ttkbootstrap.DateEntry') as mock_dateentry, \
              patch('ttkbootstrap.Button') as mock_button, \
-             patch('ttkbootstrap.PanedWindow') as mock_panedwindow:
+             patch('ttkbootstrap.PanedWindow') as mock_panedwindow, \
+             patch('ttkbootstrap.Canvas') as mock_canvas:
 
             self.mock_app.root = MagicMock()
             self.mock_app.logged_in_user = "teszt@example.com"
             self.mock_app.tdee = 2000
-            self.mock_app.db_cursor.fetchone.return_value = ("25", "180", "75", "Férfi", "Közepes")
+            self.mock_app.users.body_data.return_value = ("25", "180", "75", "Férfi", "Közepes")
 
 
             mock_meter_instance = MagicMock()
@@ -70,20 +75,22 @@ class TestDietManager(unittest.TestCase):
             
             self.diet_manager.diet_page()
 
-            self.mock_app.clear_screen.assert_called_once()
-            self.mock_app.load_navigation_bar.assert_called_once()
+            self.mock_app.show_screen.assert_called_once_with(
+                "diet", self.diet_manager.build_diet_page, self.diet_manager.refresh_diet_page)
 
             mock_meter.assert_called_once()
             self.assertGreater(mock_frame.call_count, 0)
             self.assertGreater(mock_label.call_count, 0)
             self.assertEqual(mock_dateentry.call_count, 1)
             self.assertGreater(mock_button.call_count, 0)
+            mock_canvas.assert_called_once()
+            self.assertIs(self.diet_manager.trend_chart.canvas, mock_canvas.return_value)
 
     def test_table_creation(self):
         """Táblázatok létrehozásának tesztelése"""
         self.mock_app.root = MagicMock()
         self.mock_app.logged_in_user = "teszt@example.com"
-        self.mock_app.db_cursor.fetchone.return_value = ("25", "180", "75", "Férfi", "Közepes")
+        self.mock_app.users.body_data.return_value = ("25", "180", "75", "Férfi", "Közepes")
 
         
         with patch('ttkbootstrap.Frame', return_value=MagicMock()) as mock_frame, \
@@ -92,7 +99,8 @@ class TestDietManager(unittest.TestCase):
              patch('ttkbootstrap.Treeview', return_value=MagicMock()) as mock_treeview, \
              patch('ttkbootstrap.DateEntry', return_value=MagicMock()) as mock_dateentry, \
              patch('ttkbootstrap.Button', return_value=MagicMock()) as mock_button, \
-             patch('ttkbootstrap.PanedWindow', return_value=MagicMock()) as mock_panedwindow:
+             patch('ttkbootstrap.PanedWindow', return_value=MagicMock()) as mock_panedwindow, \
+             patch('ttkbootstrap.Canvas', return_value=MagicMock()) as mock_canvas:
             
             mock_box = MagicMock()
             self.mock_app.box1 = mock_box
@@ -111,6 +119,72 @@ class TestDietManager(unittest.TestCase):
                     ("Étel", "Kcal", "g/ml"))
                 self.assertEqual(call[1]['show'], "headings")
 
+    def test_refresh_diet_page(self):
+        """Ismételt megjelenítéskor csak az adatok frissülnek"""
+        self.mock_app.logged_in_user = "teszt@example.com"
+        self.mock_app.user_id = 1
+        self.mock_app.activity_factors = {"Közepes": 1.55}
+        self.mock_app.users.body_data.return_value = ("25", "180", "75", "Nő", "Közepes")
+        self.mock_app.meter = MagicMock()
+        self.mock_app.date_entry.entry.get.return_value = "2025-01-02"
+        self.mock_app.meals.for_day.return_value = [(1, "breakfast_table", "Zabkása", 300, 200),
+                                                    (2, "lunch_table", "Leves", 200, 300)]
+
+        with patch('ttkbootstrap.Meter') as mock_meter, \
+             patch('ttkbootstrap.Treeview') as mock_treeview:
+            self.diet_manager.refresh_diet_page()
+            self.diet_manager.refresh_diet_page()
+            self.mock_app.meals.for_day.assert_not_called()
+            self.mock_app.scheduler.flush()
+
+            mock_meter.assert_not_called()
+            mock_treeview.assert_not_called()
+
+        expected_tdee = (10 * 75 + 6.25 * 180 - 5 * 25 - 161) * 1.55
+        self.assertEqual(self.mock_app.tdee, expected_tdee)
+        self.mock_app.meter.configure.assert_any_call(subtext=f"Napi max kcal: {int(expected_tdee)} ",
+                                                      amounttotal=int(expected_tdee))
+        self.mock_app.meals.for_day.assert_called_once_with(1, "2025-01-02")
+        self.mock_app.meter.configure.assert_any_call(amountused=500)
+
+    def test_trend_chart(self):
+        """A trendek egyszer, a háttérszálon töltődnek be, mentés után újra"""
+        self.mock_app.user_id = 1
+        self.mock_app.tdee = 2000
+        self.mock_app.date_entry.entry.get.return_value = "2025-01-02"
+        self.diet_manager.trend_chart = MagicMock()
+
+        self.diet_manager.draw_trend_chart()
+        self.diet_manager.draw_trend_chart()
+
+        self.mock_app.db_worker.submit.assert_called_once()
+        submit_call = self.mock_app.db_worker.submit.call_args
+        self.assertEqual(submit_call[0], (load_trends, self.mock_app.meals, 1))
+        self.diet_manager.trend_chart.draw.assert_not_called()
+
+        trends = MealTrends(["2025-01-01"], [1500])
+        submit_call[1]['callback'](trends)
+        self.mock_app.scheduler.flush()
+        self.diet_manager.draw_trend_chart()
+
+        self.assertEqual(self.diet_manager.trend_chart.draw.call_count, 2)
+        self.diet_manager.trend_chart.draw.assert_called_with(trends, "2025-01-02", 2000)
+        self.mock_app.db_worker.submit.assert_called_once()
+
+        self.mock_app.user_id = 2
+        self.diet_manager.draw_trend_chart()
+        self.assertEqual(self.mock_app.db_worker.submit.call_count, 2)
+
+    def test_load_trends(self):
+        """A trendek a daily_totals napjaiból"""
+        self.mock_app.meals.daily_kcal.return_value = [("2025-01-01", 1500), ("2025-01-03", 2500)]
+
+        trends = load_trends(self.mock_app.meals, 1)
+
+        self.mock_app.meals.daily_kcal.assert_called_once_with(1)
+        self.assertEqual(len(trends), 3)
+        self.assertEqual(trends.summary().average_7, 2000)
+
     def test_load_user_meals(self):
         """Felhasználó étkezéseinek betöltése tesztelése"""
         self.mock_app.breakfast_table = MagicMock()
@@ -121,28 +195,46 @@ class TestDietManager(unittest.TestCase):
         self.mock_app.user_id = 1
         test_date = "2025-01-01"
         
-        test_meals = [("breakfast_table", "Tojásrántotta", 300, 200),
-                      ("lunch_table", "Csirkemell", 500, 300),
-                      ("dinner_table", "Tonhalsaláta", 400, 250),
-                      ("other_table", "Gyümölcs", 100, 150)]
-        self.mock_app.db_cursor.fetchall.return_value = test_meals
+        for table in (self.mock_app.breakfast_table, self.mock_app.lunch_table,
+                      self.mock_app.dinner_table, self.mock_app.other_table):
+            table.get_children.return_value = ("I001",)
+
+        test_meals = [(1, "breakfast_table", "Tojásrántotta", 300, 200),
+                      (2, "lunch_table", "Csirkemell", 500, 300),
+                      (3, "dinner_table", "Tonhalsaláta", 400, 250),
+                      (4, "other_table", "Gyümölcs", 100, 150)]
+        self.mock_app.meals.for_day.return_value = test_meals
         
         self.diet_manager.load_user_meals(test_date)
         
-        expected_query = "SELECT table_name, food_name, calories, amount FROM users_meals WHERE user_id = ? AND date = ?"
-        self.mock_app.db_cursor.execute.assert_called_with(
-            expected_query, 
-            (self.mock_app.user_id, test_date))
+        self.mock_app.meals.for_day.assert_called_once_with(self.mock_app.user_id, test_date)
+        self.assertEqual(self.diet_manager.snapshot.total, 1300)
+        prefetch_call = self.mock_app.db_worker.submit.call_args
+        self.assertEqual(prefetch_call[0][:2], (self.mock_app.meals.for_days, 1))
+        self.assertEqual(prefetch_call[0][2][:2], ["2024-12-31", "2025-01-02"])
         
-        self.mock_app.breakfast_table.delete.assert_called()
-        self.mock_app.lunch_table.delete.assert_called()
-        self.mock_app.dinner_table.delete.assert_called()
-        self.mock_app.other_table.delete.assert_called()
+        self.mock_app.breakfast_table.delete.assert_called_with("I001")
+        self.mock_app.lunch_table.delete.assert_called_with("I001")
+        self.mock_app.dinner_table.delete.assert_called_with("I001")
+        self.mock_app.other_table.delete.assert_called_with("I001")
         
-        self.mock_app.breakfast_table.insert.assert_called_with("", "end", values=("Tojásrántotta", "300 kcal", 200))
-        self.mock_app.lunch_table.insert.assert_called_with("", "end", values=("Csirkemell", "500 kcal", 300))
-        self.mock_app.dinner_table.insert.assert_called_with("", "end", values=("Tonhalsaláta", "400 kcal", 250))
-        self.mock_app.other_table.insert.assert_called_with("", "end", values=("Gyümölcs", "100 kcal", 150))
+        self.mock_app.breakfast_table.insert.assert_called_with("", 0, iid="1", values=("Tojásrántotta", "300 kcal", 200))
+        self.mock_app.lunch_table.insert.assert_called_with("", 0, iid="2", values=("Csirkemell", "500 kcal", 300))
+        self.mock_app.dinner_table.insert.assert_called_with("", 0, iid="3", values=("Tonhalsaláta", "400 kcal", 250))
+        self.mock_app.other_table.insert.assert_called_with("", 0, iid="4", values=("Gyümölcs", "100 kcal", 150))
+
+        #Új étkezés után csak az új sor kerül be
+        self.mock_app.breakfast_table.reset_mock()
+        self.mock_app.breakfast_table.get_children.return_value = ("1",)
+        self.diet_manager.snapshots.add(1, test_date, [(5, "breakfast_table", "Kenyér", 250, 100)])
+
+        self.diet_manager.load_user_meals(test_date)
+
+        self.mock_app.meals.for_day.assert_called_once()
+
+        self.mock_app.breakfast_table.delete.assert_not_called()
+        self.mock_app.breakfast_table.item.assert_not_called()
+        self.mock_app.breakfast_table.insert.assert_called_once_with("", 1, iid="5", values=("Kenyér", "250 kcal", 100))
 
     def test_update_meter(self):
         """Kalória mérő frissítésének tesztelése"""
@@ -153,34 +245,41 @@ class TestDietManager(unittest.TestCase):
         self.mock_app.user_id = 1
         self.mock_app.tdee = 2000
 
-        #1. Eset: Alacsony kalória bevitel (<75%)
-        test_meals_low = [(1, 350, "2025-01-01")]
-        self.mock_app.db_cursor.fetchall.return_value = test_meals_low
+        #1. Eset: Alacsony kalória bevitel (<75%), a pillanatkép még nincs betöltve
+        self.mock_app.meals.for_day.return_value = [(1, "lunch_table", "Leves", 350, 300)]
         
         self.diet_manager.update_meter()
         
+        self.mock_app.meals.for_day.assert_called_once_with(1, "2025-01-01")
         total_calories = 350
         self.mock_app.meter.configure.assert_any_call(amountused=total_calories)
         self.mock_app.meter.configure.assert_any_call(bootstyle="primary")
 
-        #2. Eset: Közepes kalória bevitel (75-100%)
-        test_meals_medium = [(1, 1500, "2025-01-01")]
-        self.mock_app.db_cursor.fetchall.return_value = test_meals_medium
+        #2. Eset: Közepes kalória bevitel (75-100%), új sor a memóriában
+        self.diet_manager.snapshot.add(2, "dinner_table", "Rántott hús", 1150, 250)
         
         self.diet_manager.update_meter()
         
+        self.mock_app.meals.for_day.assert_called_once()
         self.mock_app.meter.configure.assert_any_call(amountused=1500)
         self.mock_app.meter.configure.assert_any_call(bootstyle="warning")
 
         #3. Eset: Magas kalória bevitel (>100%)
-        test_meals_high = [(1, 2200, "2025-01-01")]  #Egy étkezés 2200 kalóriával
-        self.mock_app.db_cursor.fetchall.return_value = test_meals_high
+        self.diet_manager.snapshot = DaySnapshot(1, "2025-01-01", [(3, "other_table", "Torta", 2200, 400)])
         
         self.diet_manager.update_meter()
         
         self.mock_app.meter.configure.assert_any_call(amountused=2200)
         self.mock_app.meter.configure.assert_any_call(bootstyle="danger")
 
+        #4. Eset: Nincs még étkezés az adott napon (másik nap, újra betöltődik)
+        self.mock_app.date_entry.entry.get.return_value = "2025-01-02"
+        self.mock_app.meals.for_day.return_value = []
+
+        self.diet_manager.update_meter()
+
+        self.mock_app.meter.configure.assert_any_call(amountused=0)
+
     def test_add_food(self):
         """Étel hozzáadásának tesztelése"""
         mock_table = MagicMock()
@@ -195,13 +294,15 @@ class TestDietManager(unittest.TestCase):
             patch('ttkbootstrap.Entry') as mock_entry, \
             patch('ttkbootstrap.Button') as mock_button, \
             patch('ttkbootstrap.Combobox') as mock_combobox, \
-            patch('ttkbootstrap.Spinbox') as mock_spinbox:
+            patch('ttkbootstrap.Spinbox') as mock_spinbox, \
+            patch('ttkbootstrap.Treeview') as mock_treeview:
 
             popup_window = MagicMock()
             mock_toplevel.return_value = popup_window
             
-            test_tables = ["Reggeli", "Ebéd", "Vacsora", "Egyéb"]
-            self.mock_app.db_cursor.fetchall.return_value = [(table,) for table in test_tables]
+            test_tables = ["Italok", "Olajok"]
+            self.mock_app.meals.all_foods.return_value = [("Olajok", 1, "olívaolaj", 884, "g"),
+                                                          ("Italok", 2, "víz", 0, "ml")]
 
             self.diet_manager.add_food(mock_table)
 
@@ -214,7 +315,84 @@ class TestDietManager(unittest.TestCase):
             self.assertGreater(mock_button.call_count, 0)
             self.assertGreater(mock_spinbox.call_count, 0)
 
-            self.mock_app.db_cursor.execute.assert_called_with("SELECT name FROM sqlite_master WHERE type='table';")
+            self.mock_app.meals.all_foods.assert_called_once()
+            mock_combobox.return_value.__setitem__.assert_any_call('values', ["Keresés"] + test_tables + ["Egyéni"])
+
+            #Ismételt megnyitás: az ablak újrahasznosul
+            created_widgets = mock_label.call_count + mock_combobox.call_count + mock_button.call_count
+            popup_window.register.reset_mock()
+
+            self.diet_manager.add_food(mock_table)
+
+            mock_toplevel.assert_called_once()
+            self.assertEqual(mock_label.call_count + mock_combobox.call_count + mock_button.call_count, created_widgets)
+            popup_window.register.assert_not_called()
+            popup_window.withdraw.assert_called()
+            popup_window.deiconify.assert_called()
+            self.assertIs(self.diet_manager.target_table, mock_table)
+
+    def test_add_food_batch(self):
+        """Több étel mentése egyetlen művelettel"""
+        mock_table = MagicMock()
+        self.mock_app.user_id = 1
+        self.mock_app.date_entry.entry.get.return_value = "2025-01-01"
+        self.mock_app.lunch_table = mock_table
+        self.mock_app.meals.all_foods.return_value = [("Gyümölcsök", 7, "alma (jonatán)", 52, "g"),
+                                                      ("Gyümölcsök", 8, "banán", 89, "g")]
+
+        meal_type_var = MagicMock()
+        meal_type_var.get.return_value = "Gyümölcsök"
+        food_var = MagicMock()
+
+        with patch('ttkbootstrap.Toplevel'), \
+            patch('ttkbootstrap.Label'), \
+            patch('ttkbootstrap.Entry'), \
+            patch('ttkbootstrap.Combobox') as mock_combobox, \
+            patch('ttkbootstrap.StringVar', side_effect=[meal_type_var, food_var]), \
+            patch('ttkbootstrap.Spinbox') as mock_spinbox, \
+            patch('ttkbootstrap.Treeview') as mock_treeview, \
+            patch('ttkbootstrap.Button') as mock_button:
+
+            self.diet_manager.add_food(mock_table)
+            self.diet_manager.load_food_options(None, meal_type_var)
+            commands = {call[1]['text']: call[1]['command'] for call in mock_button.call_args_list}
+
+            food_var.get.return_value = "alma (jonatán) (52 kcal/100g)"
+            mock_combobox.return_value.current.return_value = 0
+            mock_spinbox.return_value.get.return_value = "200"
+            commands["Listához"]()
+            mock_treeview.return_value.insert.assert_called_with("", "end", values=("alma (jonatán)", "104 kcal", 200))
+            self.mock_app.db_worker.submit.assert_not_called()
+
+            food_var.get.return_value = "banán (89 kcal/100g)"
+            mock_combobox.return_value.current.return_value = 1
+            mock_spinbox.return_value.get.return_value = "100"
+            commands["Hozzáadás"]()
+
+        self.mock_app.db_worker.submit.assert_called_once()
+        submit_call = self.mock_app.db_worker.submit.call_args
+        self.assertEqual(submit_call[0], (self.mock_app.meals.add_many,
+                                          [(1, "lunch_table", "alma (jonatán)", 104, 200, "2025-01-01", 7),
+                                           (1, "lunch_table", "banán", 89, 100, "2025-01-01", 8)]))
+        self.assertEqual(mock_table.insert.call_count, 2)
+        self.assertTrue(all(is_pending(call[1]['iid']) for call in mock_table.insert.call_args_list))
+
+        #Mentés után a pillanatkép a beszúrt sorokból frissül, lekérdezés nélkül
+        self.mock_app.meter = MagicMock()
+        self.mock_app.tdee = 2000
+        self.diet_manager.snapshot = DaySnapshot(1, "2025-01-01", [(3, "lunch_table", "Leves", 200, 300)])
+        self.mock_app.meals.for_day.reset_mock()
+
+        submit_call[1]['callback']([10, 11])
+        self.mock_app.meter.configure.assert_not_called()
+        self.mock_app.scheduler.flush()
+
+        self.assertEqual(self.diet_manager.snapshot.page("lunch_table"),
+                         [(3, "Leves", 200, 300), (10, "alma (jonatán)", 104, 200), (11, "banán", 89, 100)])
+        self.mock_app.meals.for_day.assert_not_called()
+        self.mock_app.meter.configure.assert_any_call(amountused=393)
+        self.mock_app.calorie_history.invalidate.assert_called_once_with(1, "2025-01-01")
+        self.assertIsNone(self.diet_manager.trends)
 
     def test_load_food_options(self):
         """Étel opciók betöltésének tesztelése"""
@@ -244,8 +422,8 @@ class TestDietManager(unittest.TestCase):
 
         #2. Eset: Előre definiált ital kiválasztása
         mock_meal_type_var.get.return_value = "Italok"
-        test_drinks = [("Víz", 0), ("Üdítő", 40)]
-        self.mock_app.db_cursor.fetchall.return_value = test_drinks
+        self.mock_app.meals.all_foods.return_value = [("Italok", 1, "Víz", 0, "ml"), ("Italok", 2, "Üdítő", 40, "ml"),
+                                                      ("Húsok", 3, "Csirkemell", 165, "g"), ("Húsok", 4, "Marha hús", 250, "g")]
         
         self.diet_manager.load_food_options(mock_event, mock_meal_type_var)
         
@@ -262,8 +440,6 @@ class TestDietManager(unittest.TestCase):
 
         #3. Eset: Előre definiált étel kiválasztása
         mock_meal_type_var.get.return_value = "Húsok"
-        test_foods = [("Csirkemell", 165), ("Marha hús", 250)]
-        self.mock_app.db_cursor.fetchall.return_value = test_foods
         
         self.diet_manager.load_food_options(mock_event, mock_meal_type_var)
         
@@ -274,8 +450,52 @@ class TestDietManager(unittest.TestCase):
             'values', 
             ["Csirkemell (165 kcal/100g)", "Marha hús (250 kcal/100g)"])
         
-        self.mock_app.db_cursor.execute.assert_any_call('SELECT Név, Kalória FROM "Italok";')
-        self.mock_app.db_cursor.execute.assert_any_call('SELECT Név, Kalória FROM "Húsok";')
+        #A katalógus egyszer töltődik be, a kategória váltás nem futtat lekérdezést
+        self.mock_app.meals.all_foods.assert_called_once()
+
+    def test_search_food_options(self):
+        """Keresés az összes étel kategóriában"""
+        self.diet_manager.food_input = MagicMock()
+        self.diet_manager.custom_food_entry = MagicMock()
+        self.diet_manager.amount_label = MagicMock()
+        mock_meal_type_var = MagicMock()
+        mock_meal_type_var.get.return_value = "Keresés"
+
+        self.diet_manager.load_food_options(None, mock_meal_type_var)
+
+        self.diet_manager.food_input.configure.assert_called_with(state="normal")
+
+        self.diet_manager.food_input.get.return_value = "baran"
+        self.diet_manager.food_input.current.return_value = -1
+        self.mock_app.meals.all_foods.return_value = [("Húsfélék", 1, "bárány", 122, "g"),
+                                                      ("Szénhidrátok", 2, "barna rizs", 111, "g"),
+                                                      ("Húsfélék", 3, "sertés", 242, "g")]
+
+        self.diet_manager.search_food_options(None, mock_meal_type_var)
+
+        self.diet_manager.food_input.__setitem__.assert_called_with('values', ["bárány (122 kcal/100g)"])
+
+        #Minden leütés szűkít, az index csak egyszer épül fel
+        self.diet_manager.food_input.get.return_value = "bar"
+        self.diet_manager.search_food_options(None, mock_meal_type_var)
+
+        self.diet_manager.food_input.__setitem__.assert_called_with(
+            'values',
+            ["bárány (122 kcal/100g)", "barna rizs (111 kcal/100g)"])
+        self.mock_app.meals.all_foods.assert_called_once()
+
+        #Kiválasztott találat: a kijelölt étel rekordja, a lista nem változik
+        self.diet_manager.food_input.current.return_value = 1
+        self.diet_manager.food_input.reset_mock(return_value=False)
+        self.diet_manager.search_food_options(None, mock_meal_type_var)
+        self.diet_manager.food_input.__setitem__.assert_not_called()
+        self.assertEqual(self.diet_manager.selected_food().id, 2)
+
+        #Más típusnál a gépelés nem keres
+        mock_meal_type_var.get.return_value = "Italok"
+        self.diet_manager.food_input.reset_mock()
+        self.diet_manager.search_food_options(None, mock_meal_type_var)
+        self.diet_manager.food_input.__setitem__.assert_not_called()
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,60 @@
+import time
+import unittest
+from app.catalog import Food
+from app.food_index import FoodIndex, fold
+
+class TestFoodIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.index = FoodIndex([Food(1, "bárány", 122, "g"),
+                                Food(2, "barna rizs", 111, "g"),
+                                Food(3, "bacon (sertéshús)", 240, "g"),
+                                Food(4, "őszibarack", 41, "g"),
+                                Food(5, "almalé (100%)", 49, "ml")])
+
+    def names(self, text):
+        return [food.name for food in self.index.search(text)]
+
+    def test_fold(self):
+        """Kisbetűsítés és ékezetek eltávolítása"""
+        self.assertEqual(fold("Árvíztűrő TÜKÖRFÚRÓGÉP"), "arvizturo tukorfurogep")
+
+    def test_prefix_search(self):
+        """Szó eleji, ékezetfüggetlen keresés"""
+        self.assertEqual(self.names("bar"), ["bárány", "barna rizs"])
+        self.assertEqual(self.names("BÁRÁ"), ["bárány"])
+        self.assertEqual(self.names("osz"), ["őszibarack"])
+        self.assertEqual(self.names("serteshus"), ["bacon (sertéshús)"])
+        self.assertEqual(self.names("100"), ["almalé (100%)"])
+        self.assertEqual(self.names("rack"), [])
+        self.assertEqual(self.names("  "), [])
+
+    def test_multiple_words(self):
+        """Több szó esetén mindegyiknek egyeznie kell"""
+        self.assertEqual(self.names("riz bar"), ["barna rizs"])
+        self.assertEqual(self.names("b s"), ["bacon (sertéshús)"])
+        self.assertEqual(self.names("rizs alma"), [])
+
+    def test_limit(self):
+        """A találatok száma korlátozható"""
+        self.assertEqual(len(self.index.search("b", limit=2)), 2)
+
+    def test_large_catalog_speed(self):
+        """Leütésenkénti szűrés nagy katalógusnál is néhány ezredmásodperc"""
+        foods = [Food(number, f"étel{number} bárány{number % 97} tészta{number % 13}", 100, "g") for number in range(20000)]
+        index = FoodIndex(foods)
+        self.assertEqual(len(index), 20000)
+
+        start = time.perf_counter()
+        for text in ["e", "é", "etel1", "baran", "baran5 tesz"]:
+            index.search(text)
+        self.assertLess(time.perf_counter() - start, 0.05)
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_food_index.py
+     coverage run -m unittest app/tesztek/test_food_index.py
+     coverage report
+"""
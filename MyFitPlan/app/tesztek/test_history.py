@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from app.database import ConnectionManager
+from app.migrations import migrate
+from app.repositories import MealRepository
+from app.history import CalorieHistory, HistoryDay, months_between, daily_rows, weekly_rows, monthly_rows
+
+class TestCalorieHistory(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.meals = MagicMock()
+        self.meals.daily_history.return_value = [
+            ("2024-12-31", 300, "2024-12-30", 300, 1, "2024-12", 300, 1),
+            ("2025-01-01", 500, "2024-12-30", 800, 2, "2025-01", 900, 2),
+            ("2025-02-03", 400, "2025-02-03", 400, 1, "2025-02", 400, 1)]
+        self.history = CalorieHistory(self.meals)
+
+    def test_months_between(self):
+        """Hónapok felsorolása évhatáron át"""
+        self.assertEqual(months_between("2024-11", "2025-02"), ["2024-11", "2024-12", "2025-01", "2025-02"])
+        self.assertEqual(months_between("2025-03", "2025-03"), ["2025-03"])
+        self.assertEqual(months_between("2025-03", "2025-02"), [])
+
+    def test_year_single_query(self):
+        """Egy év egy lekérdezés, teljes hetekre kiterjesztve, majd gyorsítótárból"""
+        days = self.history.year(1, 2025)
+
+        self.meals.daily_history.assert_called_once_with(1, "2024-12-30", "2026-01-04")
+        self.assertEqual([day.date for day in days], ["2025-01-01", "2025-02-03"])
+        self.assertEqual(days[0].week_kcal, 800)
+
+        self.history.year(1, 2025)
+        self.history.between(1, "2025-02", "2025-03")
+        self.meals.daily_history.assert_called_once()
+
+    def test_invalidate(self):
+        """A nap hónapja és a hete által érintett hónapok újratöltődnek"""
+        self.history.year(1, 2025)
+        self.history.between(1, "2024-12", "2024-12")
+        self.meals.daily_history.reset_mock()
+
+        self.history.invalidate(1, "2025-01-01")
+        self.history.invalidate(1, "nem dátum")
+
+        self.assertNotIn((1, "2025-01"), self.history.months)
+        self.assertNotIn((1, "2024-12"), self.history.months)
+        self.assertIn((1, "2025-02"), self.history.months)
+
+        self.history.between(1, "2024-12", "2025-02")
+        self.meals.daily_history.assert_called_once_with(1, "2024-11-25", "2025-02-02")
+
+        self.history.clear()
+        self.assertEqual(self.history.months, {})
+
+    def test_rollups(self):
+        """Napi, heti és havi sorok"""
+        days = [HistoryDay(*row) for row in self.meals.daily_history.return_value]
+
+        self.assertEqual(daily_rows(days), [("2024-12-31", 300, 1), ("2025-01-01", 500, 1), ("2025-02-03", 400, 1)])
+        self.assertEqual(weekly_rows(days), [("2024-12-30", 800, 2), ("2025-02-03", 400, 1)])
+        self.assertEqual(monthly_rows(days), [("2024-12", 300, 1), ("2025-01", 900, 2), ("2025-02", 400, 1)])
+
+    def test_repository(self):
+        """A hónap eleji hét összege az előző hónap napjait is tartalmazza"""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        db = ConnectionManager(os.path.join(directory.name, "teszt.db"))
+        self.addCleanup(db.close)
+        migrate(db.connection())
+        meals = MealRepository(db)
+        meals.add_many([(1, "lunch_table", "kenyér", 250, 100, "2025-02-28", None),
+                        (1, "lunch_table", "rizs", 400, 100, "2025-03-02", None)])
+
+        days = CalorieHistory(meals).between(1, "2025-03", "2025-03")
+
+        self.assertEqual(days, [HistoryDay("2025-03-02", 400, "2025-02-24", 650, 2, "2025-03", 400, 1)])
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_history.py
+     coverage run -m unittest app/tesztek/test_history.py
+     coverage report
+"""
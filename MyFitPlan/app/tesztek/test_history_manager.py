@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from app.history_manager import HistoryManager
+from app.history import HistoryDay
+from app.meal_import import ImportProgress
+from app.scheduler import UiScheduler
+
+class TestHistoryManager(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.mock_app = MagicMock()
+        self.mock_app.user_id = 1
+        self.mock_app.tdee = 2000
+        self.mock_app.scheduler = UiScheduler(self.mock_app.root)
+        self.mock_app.calorie_history.year.return_value = [
+            HistoryDay("2025-01-01", 1800, "2024-12-30", 1800, 1, "2025-01", 4200, 2),
+            HistoryDay("2025-01-07", 2400, "2025-01-06", 2400, 1, "2025-01", 4200, 2)]
+        self.mock_app.show_screen.side_effect = lambda name, build, refresh: (build(MagicMock()), refresh())
+        self.history_manager = HistoryManager(self.mock_app)
+
+    def open_page(self):
+        with patch('ttkbootstrap.Frame'), \
+             patch('ttkbootstrap.Label'), \
+             patch('ttkbootstrap.Button'), \
+             patch('ttkbootstrap.Combobox'), \
+             patch('ttkbootstrap.StringVar') as mock_var, \
+             patch('ttkbootstrap.Treeview') as mock_treeview:
+            mock_var.return_value.get.return_value = "Napi"
+            mock_treeview.return_value.get_children.return_value = ()
+            self.history_manager.history_page()
+        return mock_var.return_value, mock_treeview.return_value
+
+    def test_history_page(self):
+        """Az oldal üresjáratban, egyszer töltődik be"""
+        _, table = self.open_page()
+        self.history_manager.refresh_history_page()
+        self.mock_app.calorie_history.year.assert_not_called()
+
+        self.mock_app.scheduler.flush()
+
+        self.mock_app.calorie_history.year.assert_called_once_with(1, self.history_manager.year)
+        self.assertEqual([call[1]['values'] for call in table.insert.call_args_list],
+                         [("2025-01-01", "1800 kcal", 1, "1800 kcal", "90%"),
+                          ("2025-01-07", "2400 kcal", 1, "2400 kcal", "120%")])
+        self.history_manager.summary_label.configure.assert_called_with(text="Összesen: 4200 kcal, 2 naplózott nap")
+
+    def test_periods_and_year(self):
+        """Havi bontás és évváltás"""
+        period_var, table = self.open_page()
+        self.mock_app.scheduler.flush()
+        table.get_children.return_value = ("2025-01-01", "2025-01-07")
+        table.reset_mock()
+        self.mock_app.tdee = None
+        period_var.get.return_value = "Havi"
+        year = self.history_manager.year
+
+        self.history_manager.change_year(-1)
+        self.mock_app.scheduler.flush()
+
+        self.mock_app.calorie_history.year.assert_called_with(1, year - 1)
+        self.history_manager.year_label.configure.assert_any_call(text=str(year - 1))
+        table.delete.assert_called_once_with("2025-01-01", "2025-01-07")
+        table.insert.assert_called_once()
+        self.assertEqual(table.insert.call_args[1]['values'], ("2025-01", "4200 kcal", 2, "2100 kcal", "-"))
+
+    def test_import_meals(self):
+        """Importálás darabonként, a végén a gyorsítótárak ürülnek"""
+        self.open_page()
+        dialog = MagicMock()
+        self.mock_app.dialogs.get.side_effect = lambda name, title, width, height, build: (build(dialog), dialog)[1]
+        dialog.show.side_effect = lambda *args: dialog.on_reset(*args)
+        self.mock_app.db_worker.submit.side_effect = \
+            lambda operation, *args, callback=None, error_callback=None: callback and callback(operation(*args))
+        job = MagicMock()
+        job.errors = []
+        job.imported, job.skipped = 3, 1
+        job.step.side_effect = [ImportProgress(2, 0, 50, 100, False), ImportProgress(3, 1, 100, 100, True)]
+
+        with patch('app.history_manager.filedialog.askopenfilename', return_value="naplo.csv"), \
+             patch('app.history_manager.MealImport', return_value=job) as mock_import, \
+             patch('app.history_manager.food_lookup') as mock_lookup, \
+             patch('ttkbootstrap.Label') as mock_label, \
+             patch('ttkbootstrap.Progressbar') as mock_progress, \
+             patch('ttkbootstrap.Button'):
+            self.history_manager.import_meals()
+
+        mock_import.assert_called_once_with(self.mock_app.meals, mock_lookup.return_value, 1, "naplo.csv")
+        self.assertEqual(job.step.call_count, 2)
+        mock_progress.return_value.configure.assert_called_with(value=100)
+        mock_label.return_value.configure.assert_called_with(text="Kész: 3 sor importálva, 1 sor kihagyva.")
+        self.mock_app.meals_imported.assert_called_once()
+        self.assertIsNone(self.history_manager.import_job)
+
+        with patch('app.history_manager.filedialog.askopenfilename', return_value=""), \
+             patch('app.history_manager.MealImport') as mock_import:
+            self.history_manager.import_meals()
+        mock_import.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_history_manager.py
+     coverage run -m unittest app/tesztek/test_history_manager.py
+     coverage report
+"""
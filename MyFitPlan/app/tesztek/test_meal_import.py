@@ -0,0 +1,109 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from app.catalog import Food, FoodCatalog
+from app.database import ConnectionManager
+from app.meal_import import MealImport, food_lookup, meal_row, read_entries, main
+from app.migrations import migrate
+from app.repositories import UserRepository, MealRepository
+
+class TestMealImport(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.directory.name, "teszt.db")
+        self.db = ConnectionManager(self.db_path)
+        migrate(self.db.connection())
+        self.meals = MealRepository(self.db)
+        UserRepository(self.db).add("Teszt", "Elek", "teszt@example.com", "jelszo", 30, 180, 80, "Férfi", "Közepes")
+        self.db.connection().commit()
+        self.user_id = UserRepository(self.db).find_id("teszt@example.com")
+        self.foods = {"alma": Food(7, "alma", 37, "g")}
+
+    def tearDown(self):
+        self.db.close()
+        self.directory.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text)
+        return path
+
+    def test_meal_row(self):
+        """Katalógus étel, egyéni étel és hibás bejegyzések"""
+        self.assertEqual(meal_row(1, {"date": "2025-01-05", "meal": "Reggeli", "food": "Alma", "amount": "200"}, self.foods),
+                         (1, "breakfast_table", "alma", 74, 200, "2025-01-05", 7))
+        self.assertEqual(meal_row(1, {"date": "2025-01-05T12:30:00", "meal": "ebéd", "food": "Pörkölt", "calories": "812,4"}, self.foods),
+                         (1, "lunch_table", "Pörkölt", 812, 0, "2025-01-05", None))
+
+        for fields in ({"date": "2025-13-01", "meal": "Reggeli", "food": "alma", "amount": 1},
+                       {"date": "2025-01-05", "meal": "uzsonna", "food": "alma", "amount": 1},
+                       {"date": "2025-01-05", "meal": "Reggeli", "food": "", "amount": 1},
+                       {"date": "2025-01-05", "meal": "Reggeli", "food": "alma", "amount": "sok"},
+                       {"date": "2025-01-05", "meal": "Reggeli", "food": "Pörkölt", "amount": 300}):
+            with self.assertRaises(ValueError):
+                meal_row(1, fields, self.foods)
+
+    def test_read_entries(self):
+        """CSV fejléc elválasztója és a mezőnevek, JSON lines hibás sorral"""
+        with open(self.write("naplo.csv", "Dátum;Étkezés;Étel;Mennyiség;Megjegyzés\n2025-01-05;Vacsora;alma;100;-\n")) as file:
+            self.assertEqual(list(read_entries(file, "naplo.csv")),
+                             [(2, {"date": "2025-01-05", "meal": "Vacsora", "food": "alma", "amount": "100"})])
+
+        text = '{"date": "2025-01-05", "meal": "snack", "food": "alma", "amount": 50}\n\n[1]\nhibás\n'
+        with open(self.write("naplo.jsonl", text)) as file:
+            self.assertEqual(list(read_entries(file, "naplo.jsonl")),
+                             [(1, {"date": "2025-01-05", "meal": "snack", "food": "alma", "amount": 50}),
+                              (3, "Nem JSON objektum"),
+                              (4, "Hibás JSON sor")])
+
+    def test_import_in_chunks(self):
+        """Darabonkénti beírás, a naplózott napok összesítései is frissülnek"""
+        lines = ["date,meal,food,amount,kcal"]
+        lines += [f"2025-01-{day:02d},breakfast,alma,100," for day in range(1, 6)]
+        lines += ["2025-01-01,dinner,Pizza,,900", "2025-01-02,dinner,Pizza,,"]
+        path = self.write("naplo.csv", "\n".join(lines) + "\n")
+        job = MealImport(self.meals, self.foods, self.user_id, path, chunk_size=2)
+
+        progress = [job.step() for _ in range(4)]
+
+        self.assertEqual([step.imported for step in progress], [2, 4, 6, 6])
+        self.assertEqual([step.done for step in progress], [False, False, False, True])
+        self.assertEqual(progress[-1].position, progress[-1].size)
+        self.assertEqual(job.skipped, 1)
+        self.assertEqual(job.errors, ["8. sor: Ismeretlen étel kcal nélkül"])
+        self.assertIsNone(job.file)
+        self.assertEqual(self.meals.daily_kcal(self.user_id),
+                         [("2025-01-01", 937), ("2025-01-02", 37), ("2025-01-03", 37),
+                          ("2025-01-04", 37), ("2025-01-05", 37)])
+
+    def test_food_lookup(self):
+        """A katalógus nevei ékezet- és kisbetűfüggetlenül"""
+        foods = food_lookup(FoodCatalog(self.meals))
+        self.assertEqual(foods["alma"].name, "alma")
+        self.assertTrue(all(key == key.casefold() for key in foods))
+
+    def test_main(self):
+        """Parancssori importálás darabonkénti committal"""
+        path = self.write("naplo.jsonl", '{"datum": "2025-02-01", "etkezes": "Ebéd", "etel": "Alma", "mennyiseg": 100}\n' * 3)
+        output = io.StringIO()
+        with redirect_stdout(output), redirect_stderr(io.StringIO()):
+            status = main(["teszt@example.com", path, "--db", self.db_path, "--chunk-size", "2"])
+            missing = main(["nincs@example.com", path, "--db", self.db_path])
+
+        self.assertEqual(status, 0)
+        self.assertEqual(missing, 1)
+        self.assertIn("Importálva: 3 sor, kihagyva: 0 sor", output.getvalue())
+        self.assertEqual(self.meals.daily_kcal(self.user_id), [("2025-02-01", 111)])
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_meal_import.py
+     coverage run -m unittest app/tesztek/test_meal_import.py
+     coverage report
+"""
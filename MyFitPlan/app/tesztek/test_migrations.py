@@ -0,0 +1,237 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from app.migrations import (migrate, get_schema_version, get_schema_fingerprint, MIGRATIONS,
+                            SCHEMA_VERSION, APPLICATION_ID)
+
+class TestMigrations(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.connection = sqlite3.connect(":memory:")
+
+    def tearDown(self):
+        self.connection.close()
+
+    def index_names(self):
+        return {row[0] for row in self.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type='index'")}
+
+    def test_fresh_database(self):
+        """Üres adatbázis teljes migrálásának tesztelése"""
+        version = migrate(self.connection)
+
+        self.assertEqual(version, SCHEMA_VERSION)
+        self.assertEqual(get_schema_version(self.connection), SCHEMA_VERSION)
+
+        tables = {row[0] for row in self.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type='table'")}
+        for expected_table in ['users', 'users_meals', 'training_days', 'exercises', 'foods', 'training_volume',
+                               'workout_sets']:
+            self.assertIn(expected_table, tables)
+        self.assertNotIn('foods_fts', tables)
+
+        self.assertIn('idx_users_meals_user_date', self.index_names())
+        self.assertIn('idx_exercises_day', self.index_names())
+        self.assertIn('idx_workout_sets_user_exercise_ts', self.index_names())
+
+    def test_legacy_database_upgrade(self):
+        """Verziózás előtti adatbázis helyben frissítésének tesztelése"""
+        self.connection.execute("""
+            CREATE TABLE users_meals (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                table_name TEXT NOT NULL,
+                food_name TEXT NOT NULL,
+                calories INTEGER NOT NULL,
+                amount INTEGER NOT NULL,
+                date TEXT NOT NULL)""")
+        self.connection.execute("""
+            INSERT INTO users_meals (user_id, table_name, food_name, calories, amount, date)
+            VALUES (1, 'breakfast_table', 'avokádó', 458, 342, '2025-02-28')""")
+        self.connection.commit()
+
+        migrate(self.connection)
+
+        self.assertEqual(get_schema_version(self.connection), SCHEMA_VERSION)
+        self.assertEqual(self.connection.execute("SELECT COUNT(*) FROM users_meals").fetchone()[0], 1)
+        self.assertIn('idx_users_meals_user_date', self.index_names())
+
+    def test_migrate_is_idempotent(self):
+        """Ismételt futtatás tesztelése"""
+        migrate(self.connection)
+        changes = self.connection.total_changes
+
+        self.assertEqual(migrate(self.connection), SCHEMA_VERSION)
+        self.assertEqual(self.connection.total_changes, changes)
+
+    def test_schema_fingerprint(self):
+        """Az adatbázis azonosító a migrációval együtt kerül be"""
+        self.assertEqual(get_schema_fingerprint(self.connection), (0, 0))
+
+        migrate(self.connection)
+
+        self.assertEqual(get_schema_fingerprint(self.connection), (APPLICATION_ID, SCHEMA_VERSION))
+
+    def test_fingerprint_added_to_current_database(self):
+        """Az azonosító nélküli, de naprakész adatbázis csak az azonosítót kapja meg"""
+        migrate(self.connection)
+        self.connection.execute("PRAGMA application_id = 0")
+
+        self.assertEqual(migrate(self.connection), SCHEMA_VERSION)
+        self.assertEqual(get_schema_fingerprint(self.connection), (APPLICATION_ID, SCHEMA_VERSION))
+
+    def test_current_database_is_not_written(self):
+        """Naprakész adatbázison a migrálás csak olvas (írásvédett kapcsolattal is lefut)"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "teszt.db")
+            connection = sqlite3.connect(path)
+            migrate(connection)
+            connection.close()
+
+            read_only = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            try:
+                self.assertEqual(migrate(read_only), SCHEMA_VERSION)
+                self.assertFalse(read_only.in_transaction)
+            finally:
+                read_only.close()
+
+    def test_foreign_database_rejected(self):
+        """Más alkalmazás adatbázisát nem migrálja"""
+        self.connection.execute("PRAGMA application_id = 42")
+
+        with self.assertRaises(sqlite3.DatabaseError):
+            migrate(self.connection)
+        self.assertEqual(get_schema_version(self.connection), 0)
+
+    def test_query_plans_use_indexes(self):
+        """A gyakori lekérdezések indexet használnak"""
+        migrate(self.connection)
+
+        meals_plan = self.connection.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT table_name, food_name, calories, amount FROM users_meals WHERE user_id = ? AND date = ?""",
+            (1, "2025-01-01")).fetchall()
+        self.assertIn("COVERING INDEX idx_users_meals_user_date", " ".join(row[-1] for row in meals_plan))
+
+        exercises_plan = self.connection.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT exercise_name, sets, reps FROM exercises WHERE day_id = ?""", (1,)).fetchall()
+        self.assertIn("idx_exercises_day", " ".join(row[-1] for row in exercises_plan))
+
+    def add_meal(self, user_id, table_name, calories, date):
+        cursor = self.connection.execute("""
+            INSERT INTO users_meals (user_id, table_name, food_name, calories, amount, date)
+            VALUES (?, ?, 'teszt', ?, 100, ?)""", (user_id, table_name, calories, date))
+        return cursor.lastrowid
+
+    def daily_total(self, user_id, date):
+        return self.connection.execute("""
+            SELECT kcal, breakfast_kcal, lunch_kcal, dinner_kcal, other_kcal
+            FROM daily_totals WHERE user_id = ? AND date = ?""", (user_id, date)).fetchone()
+
+    def test_daily_totals_triggers(self):
+        """A napi összesítő karbantartása triggerekkel"""
+        migrate(self.connection)
+
+        breakfast_id = self.add_meal(1, "breakfast_table", 300, "2025-01-01")
+        self.add_meal(1, "lunch_table", 500, "2025-01-01")
+        other_id = self.add_meal(1, "other_table", 100, "2025-01-01")
+        self.add_meal(2, "dinner_table", 700, "2025-01-01")
+
+        self.assertEqual(self.daily_total(1, "2025-01-01"), (900, 300, 500, 0, 100))
+        self.assertEqual(self.daily_total(2, "2025-01-01"), (700, 0, 0, 700, 0))
+
+        self.connection.execute("UPDATE users_meals SET calories = 250, table_name = 'dinner_table' WHERE id = ?",
+                                (other_id,))
+        self.assertEqual(self.daily_total(1, "2025-01-01"), (1050, 300, 500, 250, 0))
+
+        self.connection.execute("UPDATE users_meals SET date = '2025-01-02' WHERE id = ?", (breakfast_id,))
+        self.assertEqual(self.daily_total(1, "2025-01-01"), (750, 0, 500, 250, 0))
+        self.assertEqual(self.daily_total(1, "2025-01-02"), (300, 300, 0, 0, 0))
+
+        self.connection.execute("DELETE FROM users_meals WHERE id = ?", (breakfast_id,))
+        self.assertIsNone(self.daily_total(1, "2025-01-02"))
+
+    def test_daily_totals_backfill(self):
+        """Meglévő étkezések összesítése a migráció során"""
+        for migration in MIGRATIONS[:2]:
+            migration(self.connection.cursor())
+        self.connection.execute("PRAGMA user_version = 2")
+        self.add_meal(1, "breakfast_table", 300, "2025-01-01")
+        self.add_meal(1, "breakfast_table", "120", "2025-01-01")
+        self.add_meal(1, "other_table", 80, "2025-01-02")
+        self.connection.commit()
+
+        migrate(self.connection)
+
+        self.assertEqual(self.daily_total(1, "2025-01-01"), (420, 420, 0, 0, 0))
+        self.assertEqual(self.daily_total(1, "2025-01-02"), (80, 0, 0, 0, 80))
+
+    def test_meal_food_id_backfill(self):
+        """A meglévő étkezések a név alapján kapják meg a katalógus azonosítót"""
+        for migration in MIGRATIONS[:4]:
+            migration(self.connection.cursor())
+        self.connection.execute("PRAGMA user_version = 4")
+        self.add_meal(1, "lunch_table", 122, "2025-01-01")
+        self.connection.execute("""
+            INSERT INTO users_meals (user_id, table_name, food_name, calories, amount, date)
+            VALUES (1, 'lunch_table', 'bárány', 244, 200, '2025-01-01')""")
+        self.connection.commit()
+
+        migrate(self.connection)
+
+        lamb_id = self.connection.execute("SELECT id FROM foods WHERE name = 'bárány'").fetchone()[0]
+        self.assertEqual(self.connection.execute("SELECT food_id FROM users_meals ORDER BY id").fetchall(),
+                         [(None,), (lamb_id,)])
+
+    def test_training_volume_backfill(self):
+        """A meglévő gyakorlatok izomcsoportja a katalógusból, az összesítés a migráció során"""
+        for migration in MIGRATIONS[:5]:
+            migration(self.connection.cursor())
+        self.connection.execute("PRAGMA user_version = 5")
+        self.connection.execute('''CREATE TABLE "mell" ("Gyakorlat neve" TEXT, "Szükséges eszközök" TEXT,
+                                   "Nehézségi szint" TEXT, "Leírás" TEXT)''')
+        self.connection.execute('''INSERT INTO "mell" VALUES ('Fekvenyomás', 'Rúd', 'Közepes', 'Leírás')''')
+        self.connection.execute("INSERT INTO training_days (id, user_id, day_name) VALUES (1, 7, 'Push')")
+        self.connection.executemany("""
+            INSERT INTO exercises (day_id, exercise_name, sets, reps, weight, equipment, difficulty, description)
+            VALUES (1, ?, ?, ?, ?, '', '', '')""", [("Fekvenyomás", 4, 10, 60.0), ("Fekvenyomás", 3, 8, 70.0),
+                                                    ("Saját gyakorlat", 3, "", "")])
+        self.connection.commit()
+
+        migrate(self.connection)
+
+        self.assertEqual(self.connection.execute("SELECT muscle_group FROM exercises ORDER BY id").fetchall(),
+                         [("mell",), ("mell",), (None,)])
+        self.assertEqual(self.connection.execute(
+            "SELECT muscle_group, exercises, sets, volume FROM training_volume WHERE user_id = 7 ORDER BY muscle_group").fetchall(),
+            [("", 1, 3, 0.0), ("mell", 2, 7, 4080.0)])
+
+    def test_food_catalog_from_legacy_tables(self):
+        """A kategóriánkénti étel táblák átmásolása a foods táblába"""
+        for migration in MIGRATIONS[:3]:
+            migration(self.connection.cursor())
+        self.connection.execute("PRAGMA user_version = 3")
+        self.connection.execute('CREATE TABLE "Italok" ("Név" TEXT, "Kalória" INTEGER)')
+        self.connection.executemany('INSERT INTO "Italok" VALUES (?, ?)', [("víz", 0), ("kakaó", 65)])
+        self.connection.commit()
+
+        migrate(self.connection)
+
+        self.assertEqual(self.connection.execute(
+            "SELECT name, kcal_per_100, unit FROM foods WHERE category = 'Italok' ORDER BY id").fetchall(),
+            [("víz", 0, "ml"), ("kakaó", 65, "ml")])
+        tables = {row[0] for row in self.connection.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        self.assertNotIn("Italok", tables)
+        self.assertGreater(self.connection.execute(
+            "SELECT COUNT(*) FROM foods WHERE category = 'Húsfélék'").fetchone()[0], 0)
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_migrations.py
+     coverage run -m unittest app/tesztek/test_migrations.py
+     coverage report
+"""
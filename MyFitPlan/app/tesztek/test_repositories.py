@@ -0,0 +1,232 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from app.database import ConnectionManager
+from app.migrations import migrate
+from app.repositories import (UserRepository, MealRepository, TrainingDayRepository,
+                              ExerciseRepository, WorkoutSetRepository, MUSCLE_GROUPS)
+
+class TestRepositories(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = ConnectionManager(os.path.join(self.directory.name, "teszt.db"))
+        migrate(self.db.connection())
+        self.users = UserRepository(self.db)
+        self.meals = MealRepository(self.db)
+        self.training_days = TrainingDayRepository(self.db)
+        self.exercises = ExerciseRepository(self.db)
+
+    def tearDown(self):
+        self.db.close()
+        self.directory.cleanup()
+
+    def test_connection_settings(self):
+        """WAL mód és szálankénti kapcsolat"""
+        connection = self.db.connection()
+        self.assertIs(self.db.connection(), connection)
+        self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertEqual(connection.execute("PRAGMA busy_timeout").fetchone()[0], ConnectionManager.BUSY_TIMEOUT_MS)
+
+        other = []
+        thread = threading.Thread(target=lambda: (other.append(self.db.connection()), self.db.close()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], connection)
+
+    def test_prepare_runs_once(self):
+        """Az előkészítés (migráció) az első kapcsolattal egyszer fut le"""
+        prepared = []
+        db = ConnectionManager(os.path.join(self.directory.name, "uj.db"), prepare=prepared.append)
+
+        threads = [threading.Thread(target=lambda: (db.connection(), db.close())) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        db.connection()
+        db.close()
+
+        self.assertEqual(len(prepared), 1)
+
+    def test_users(self):
+        """Felhasználó mentése, keresése és módosítása"""
+        user_id = self.users.add("Teszt", "Elek", "teszt@example.com", "jelszo", 25, 180, 75, "Férfi", "Közepes")
+
+        self.assertTrue(self.users.email_exists("teszt@example.com"))
+        self.assertFalse(self.users.email_exists("mas@example.com"))
+        self.assertEqual(self.users.find_by_credentials("teszt@example.com", "jelszo")[0], user_id)
+        self.assertIsNone(self.users.find_by_credentials("teszt@example.com", "rossz"))
+
+        self.users.update_profile("teszt@example.com", "Új", "Név", 30, 185, 80, "Átlagon felüli")
+
+        self.assertEqual(self.users.profile("teszt@example.com"),
+                         ("Új", "Név", "teszt@example.com", 30, 185, 80, "Férfi", "Átlagon felüli"))
+        self.assertEqual(self.users.body_data("teszt@example.com"), (30, 185, 80, "Férfi", "Átlagon felüli"))
+
+    def test_meals(self):
+        """Étkezések mentése és napi összesítés"""
+        oatmeal_id = self.meals.add(1, "breakfast_table", "zabpehely", 370, 100, "2025-01-01")
+        chicken_id = self.meals.add(1, "lunch_table", "csirkemell", 330, 200, "2025-01-01")
+        self.meals.add(1, "lunch_table", "rizs", 130, 100, "2025-01-02")
+
+        self.assertEqual(self.meals.for_day(1, "2025-01-01"),
+                         [(oatmeal_id, "breakfast_table", "zabpehely", 370, 100),
+                          (chicken_id, "lunch_table", "csirkemell", 330, 200)])
+        self.assertEqual(self.meals.daily_kcal(1), [("2025-01-01", 700), ("2025-01-02", 130)])
+
+    def test_meal_food_id(self):
+        """A katalógusból választott étel azonosítójának mentése"""
+        food_id = self.meals.all_foods()[0][1]
+        self.meals.add(1, "breakfast_table", "alma", 52, 100, "2025-01-01", food_id)
+        self.meals.add(1, "breakfast_table", "saját étel", 300, 0, "2025-01-01")
+
+        self.assertEqual(self.db.connection().execute("SELECT food_id FROM users_meals ORDER BY id").fetchall(),
+                         [(food_id,), (None,)])
+
+    def test_add_many_meals(self):
+        """Több étkezés mentése egy executemany hívással"""
+        self.meals.add(1, "lunch_table", "kenyér", 250, 100, "2025-01-01")
+        ids = self.meals.add_many([(1, "dinner_table", "alma", 52, 100, "2025-01-01", None),
+                                   (1, "dinner_table", "banán", 89, 100, "2025-01-01", None)])
+
+        self.assertEqual(ids, [row[0] for row in self.meals.for_day(1, "2025-01-01") if row[1] == "dinner_table"])
+        self.assertEqual(self.meals.daily_kcal(1), [("2025-01-01", 391)])
+        self.assertEqual(self.meals.add_many([]), [])
+
+        self.meals.add(1, "other_table", "alma", 52, 100, "2025-01-02")
+        self.assertEqual([(row[0], row[3]) for row in self.meals.for_days(1, ["2025-01-01", "2025-01-02"])],
+                         [("2025-01-01", "kenyér"), ("2025-01-01", "alma"), ("2025-01-01", "banán"), ("2025-01-02", "alma")])
+        self.assertEqual(self.meals.for_days(1, []), [])
+
+    def test_daily_history(self):
+        """Napi összegek heti és havi összesítéssel egy lekérdezésben"""
+        self.meals.add_many([(1, "lunch_table", "kenyér", 250, 100, "2025-01-31", None),
+                             (1, "dinner_table", "alma", 50, 100, "2025-01-31", None),
+                             (1, "lunch_table", "rizs", 400, 100, "2025-02-02", None),
+                             (1, "lunch_table", "tészta", 500, 100, "2025-02-03", None),
+                             (2, "lunch_table", "tészta", 999, 100, "2025-02-03", None)])
+
+        self.assertEqual(self.meals.daily_history(1, "2025-01-27", "2025-02-09"),
+                         [("2025-01-31", 300, "2025-01-27", 700, 2, "2025-01", 300, 1),
+                          ("2025-02-02", 400, "2025-01-27", 700, 2, "2025-02", 900, 2),
+                          ("2025-02-03", 500, "2025-02-03", 500, 1, "2025-02", 900, 2)])
+        self.assertEqual(self.meals.daily_history(1, "2025-03-01", "2025-03-31"), [])
+        self.assertEqual(self.meals.daily_kcal(1), [("2025-01-31", 300), ("2025-02-02", 400), ("2025-02-03", 500)])
+
+        plan = " ".join(row[-1] for row in self.db.connection().execute(
+            "EXPLAIN QUERY PLAN SELECT date, SUM(calories) FROM users_meals WHERE user_id = ? AND date BETWEEN ? AND ? GROUP BY date",
+            (1, "2025-01-01", "2025-12-31")))
+        self.assertIn("COVERING INDEX idx_users_meals_user_date", plan)
+
+    def test_food_catalog(self):
+        """Étel katalógus elérése a foods táblából"""
+        foods = self.meals.all_foods()
+        self.assertEqual(len({row[0] for row in foods}), 10)
+
+        drinks = [row[2:] for row in foods if row[0] == "Italok"]
+        self.assertIn(("almalé (100%)", 49, "ml"), drinks)
+        self.assertTrue(all(unit == "ml" for _, _, unit in drinks))
+
+    def test_training_days_and_exercises(self):
+        """Edzésnapok és gyakorlatok kezelése"""
+        day_id = self.training_days.add(1, "Push")
+        self.training_days.add(1, "Pull")
+
+        self.assertEqual(self.training_days.names(1), ["Push", "Pull"])
+        self.assertEqual(self.training_days.find_id(1, "Push"), day_id)
+        self.assertIsNone(self.training_days.find_id(2, "Push"))
+
+        self.exercises.add(day_id, "Fekvenyomás", 3, 10, 60.0, "Rúd", "Közepes", "Leírás")
+        self.exercises.add(day_id, "Tárogatás", 3, 12, 10.0, "Kézi súlyzó", "Kezdő", "Leírás")
+        self.assertEqual(len(self.exercises.for_day(day_id)), 2)
+
+        self.exercises.delete_many([str(self.exercises.for_day(day_id)[1][0])])
+        self.assertEqual([row[1] for row in self.exercises.for_day(day_id)], ["Fekvenyomás"])
+
+        self.exercises.add_many([(day_id, "Guggolás", 4, 8, 80.0, "Rúd", "Haladó", "Leírás", "comb"),
+                                 (day_id, "Guggolás", 4, 8, 80.0, "Rúd", "Haladó", "Leírás", "comb"),
+                                 (day_id, "Plank", 3, "", None, "", "", "", None)])
+        rows = self.exercises.for_day(day_id)
+        self.exercises.delete_many([rows[1][0], rows[3][0]])
+        self.assertEqual([row[1] for row in self.exercises.for_day(day_id)], ["Fekvenyomás", "Guggolás"])
+
+        self.exercises.add_many([(day_id, f"Gyakorlat {number}", 3, 10, 0, "", "", "", None) for number in range(4)])
+        ids = [row[0] for row in self.exercises.for_day(day_id)]
+        self.assertEqual([row[0] for row in self.exercises.for_day_page(day_id, limit=2)], ids[:2])
+        self.assertEqual([row[0] for row in self.exercises.for_day_page(day_id, after_id=ids[1], limit=2)], ids[2:4])
+        self.assertEqual([row[0] for row in self.exercises.for_day_page(day_id, before_id=ids[-1], limit=2)], ids[-3:-1])
+
+        self.training_days.delete(day_id)
+        self.assertEqual(self.training_days.names(1), ["Pull"])
+        self.assertEqual(self.exercises.for_day(day_id), [])
+
+    def test_volume_by_group(self):
+        """Izomcsoportonkénti heti összesítés a triggerekkel karbantartott táblából"""
+        push = self.training_days.add(1, "Push")
+        legs = self.training_days.add(1, "Láb")
+        other_user = self.training_days.add(2, "Push")
+        self.exercises.add(push, "Fekvenyomás", 4, 10, 60.0, "Rúd", "Közepes", "Leírás", "mell")
+        self.exercises.add_many([(push, "Tárogatás", 3, 12, 10.0, "Kézi súlyzó", "Kezdő", "Leírás", "mell"),
+                                 (legs, "Guggolás", 5, 5, 100.0, "Rúd", "Haladó", "Leírás", "comb"),
+                                 (legs, "Plank", 3, "", "", "", "", "", None),
+                                 (other_user, "Fekvenyomás", 1, 1, 1.0, "Rúd", "Közepes", "Leírás", "mell")])
+
+        self.assertEqual(self.exercises.volume_by_group(1),
+                         [("mell", 2, 7, 2760.0), ("comb", 1, 5, 2500.0), ("", 1, 3, 0.0)])
+
+        self.exercises.delete_many([row[0] for row in self.exercises.for_day(push) if row[1] == "Tárogatás"])
+        self.db.connection().execute("UPDATE exercises SET weight = 110.0 WHERE exercise_name = 'Guggolás'")
+        self.assertEqual(self.exercises.volume_by_group(1),
+                         [("comb", 1, 5, 2750.0), ("mell", 1, 4, 2400.0), ("", 1, 3, 0.0)])
+
+        self.training_days.delete(legs)
+        self.assertEqual(self.exercises.volume_by_group(1), [("mell", 1, 4, 2400.0)])
+        self.assertEqual(self.exercises.volume_by_group(2), [("mell", 1, 1, 1.0)])
+
+    def test_workout_sets(self):
+        """Sorozat napló: utolsó edzések indexkeresésekkel"""
+        workout_sets = WorkoutSetRepository(self.db)
+        start = int(time.mktime((2025, 1, 1, 18, 0, 0, 0, 0, -1)))
+        for day in range(12):
+            for number in range(3):
+                workout_sets.add(1, "Fekvenyomás", 10 - number, 50 + day, start + day * 86400 + number * 120)
+        workout_sets.add(1, "Guggolás", 5, 100, start)
+        workout_sets.add(2, "Fekvenyomás", 1, 200, start + 20 * 86400)
+
+        sessions = workout_sets.recent_sessions(1, "Fekvenyomás")
+
+        self.assertEqual(len(sessions), 10)
+        self.assertEqual(sessions[0], ("2025-01-12", 3, 27, 61.0, 27 * 61.0))
+        self.assertEqual(sessions[-1][0], "2025-01-03")
+        self.assertEqual([row[0] for row in workout_sets.recent_sessions(1, "Fekvenyomás", limit=2)],
+                         ["2025-01-12", "2025-01-11"])
+        self.assertEqual(workout_sets.recent_sessions(1, "Guggolás"), [("2025-01-01", 1, 5, 100.0, 500.0)])
+        self.assertEqual(workout_sets.recent_sessions(1, "Evezés"), [])
+        self.assertEqual(workout_sets.last_set(1, "Fekvenyomás"), (8, 61.0))
+        self.assertIsNone(workout_sets.last_set(3, "Fekvenyomás"))
+
+        plan = " ".join(row[-1] for row in self.db.connection().execute(
+            "EXPLAIN QUERY PLAN SELECT MAX(ts) FROM workout_sets WHERE user_id = ? AND exercise = ? AND ts < ?",
+            (1, "Fekvenyomás", start)))
+        self.assertIn("COVERING INDEX idx_workout_sets_user_exercise_ts", plan)
+
+    def test_exercise_catalog_entries(self):
+        """A teljes gyakorlat katalógus egy lekérdezéssel"""
+        for group in MUSCLE_GROUPS:
+            self.db.connection().execute(f'''CREATE TABLE "{group}" ("Gyakorlat neve" TEXT, "Szükséges eszközök" TEXT,
+                                         "Nehézségi szint" TEXT, "Leírás" TEXT)''')
+        self.db.connection().execute('''INSERT INTO "mell" VALUES ('Fekvőtámasz', 'Nincs', 'Kezdő', 'Leírás')''')
+
+        self.assertEqual(self.exercises.catalog_entries(), [("mell", "Fekvőtámasz", "Nincs", "Kezdő", "Leírás")])
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_repositories.py
+     coverage run -m unittest app/tesztek/test_repositories.py
+     coverage report
+"""
@@ -0,0 +1,145 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from app.scheduler import UiScheduler
+
+class FakeWidget:
+    """A Tk bind / unbind viselkedése: a kötések egy szkriptben, soronként."""
+
+    def __init__(self, name):
+        self.name = name
+        self.scripts = {}
+        self.commands = {}
+
+    def __str__(self):
+        return self.name
+
+    def bind(self, sequence, func=None, add=None):
+        if func is None:
+            return self.scripts.get(sequence, "")
+        if isinstance(func, str):
+            self.scripts[sequence] = func
+            return None
+        funcid = f"{len(self.commands) + 1}handler"
+        self.commands[funcid] = func
+        line = f'if {{"[{funcid} %W]" == "break"}} break'
+        script = self.scripts.get(sequence, "") if add else ""
+        self.scripts[sequence] = f"{script}\n{line}" if script else line
+        return funcid
+
+    def deletecommand(self, funcid):
+        del self.commands[funcid]
+
+    def fire(self, sequence, widget_name):
+        event = SimpleNamespace(widget=widget_name)
+        for funcid, func in list(self.commands.items()):
+            if funcid in self.scripts.get(sequence, ""):
+                func(event)
+
+class TestUiScheduler(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.root = MagicMock()
+        self.scheduler = UiScheduler(self.root)
+
+    def run_idle(self):
+        callback = self.root.after_idle.call_args[0][0]
+        callback()
+
+    def test_schedule_coalesces(self):
+        """Azonos nevű feladatok egyszer, a legutolsó argumentumokkal futnak"""
+        callback = MagicMock()
+        other = MagicMock()
+
+        for number in range(100):
+            self.scheduler.schedule("resize", callback, number)
+        self.scheduler.schedule("meter", other)
+
+        self.root.after_idle.assert_called_once()
+        callback.assert_not_called()
+
+        self.run_idle()
+
+        callback.assert_called_once_with(99)
+        other.assert_called_once_with()
+        self.assertEqual(self.scheduler.pending, {})
+
+        self.scheduler.schedule("resize", callback, 100)
+        self.assertEqual(self.root.after_idle.call_count, 2)
+
+    def test_flush_and_cancel(self):
+        """Azonnali futtatás és törlés"""
+        callback = MagicMock()
+        cancelled = MagicMock()
+        self.scheduler.schedule("diet_day", callback)
+        self.scheduler.schedule("training_plan", cancelled)
+        self.scheduler.cancel("training_plan")
+
+        self.scheduler.flush()
+
+        callback.assert_called_once()
+        cancelled.assert_not_called()
+        self.root.after_cancel.assert_called_once()
+
+        self.scheduler.schedule("diet_day", callback)
+        self.scheduler.cancel_all()
+        self.scheduler.flush()
+        callback.assert_called_once()
+
+    def test_failing_callback(self):
+        """Egy hibás feladat nem akadályozza a többit"""
+        callback = MagicMock()
+        self.scheduler.schedule("hibas", MagicMock(side_effect=ValueError()))
+        self.scheduler.schedule("jo", callback)
+
+        self.scheduler.flush()
+
+        callback.assert_called_once()
+        self.root.report_callback_exception.assert_called_once()
+
+    def test_bind_filters_child_events(self):
+        """A főablak kötése csak a saját eseményeire ütemez, egyszer"""
+        root = FakeWidget(".")
+        callback = MagicMock()
+
+        self.scheduler.bind("navigation_background", root, "<Configure>", callback)
+        for _ in range(50):
+            root.fire("<Configure>", ".!frame.!button")
+        self.root.after_idle.assert_not_called()
+
+        for _ in range(50):
+            root.fire("<Configure>", ".")
+        self.run_idle()
+
+        callback.assert_called_once()
+
+    def test_bind_replaces(self):
+        """Azonos nevű kötés lecserélődik, a widget többi kötése megmarad"""
+        root = FakeWidget(".")
+        other = MagicMock()
+        root.bind("<Configure>", other, add="+")
+        first = MagicMock()
+        second = MagicMock()
+
+        self.scheduler.bind("navigation_background", root, "<Configure>", first)
+        self.scheduler.bind("navigation_background", root, "<Configure>", second)
+        root.fire("<Configure>", ".")
+        self.scheduler.flush()
+
+        first.assert_not_called()
+        second.assert_called_once()
+        self.assertEqual(other.call_count, 1)
+        self.assertEqual(len(root.commands), 2)
+
+        self.scheduler.cancel_all()
+        self.assertEqual(len(root.commands), 1)
+        self.assertEqual(self.scheduler.bindings, {})
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_scheduler.py
+     coverage run -m unittest app/tesztek/test_scheduler.py
+     coverage report
+"""
@@ -0,0 +1,62 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from app.screens import ScreenManager
+
+class TestScreenManager(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.root = MagicMock()
+        self.screens = ScreenManager(self.root)
+
+    def test_build_once(self):
+        """Az oldal csak első megjelenítéskor épül fel, utána csak frissül"""
+        build = MagicMock()
+        refresh = MagicMock()
+
+        with patch('ttkbootstrap.Frame') as mock_frame:
+            first = self.screens.show("diet", build, refresh)
+            second = self.screens.show("diet", build, refresh)
+
+        mock_frame.assert_called_once_with(self.root, style="Screen.TFrame")
+        build.assert_called_once_with(first)
+        self.assertIs(first, second)
+        self.assertEqual(refresh.call_count, 2)
+        self.assertEqual(first.tkraise.call_count, 2)
+        self.assertEqual(self.screens.current, "diet")
+
+    def test_switch_screens(self):
+        """Oldalak közötti váltás a keretek előre hozásával"""
+        with patch('ttkbootstrap.Frame', side_effect=lambda *args, **kwargs: MagicMock()):
+            diet = self.screens.show("diet", MagicMock())
+            training = self.screens.show("training", MagicMock())
+            self.assertIs(self.screens.show("diet", MagicMock()), diet)
+
+        self.assertIsNot(diet, training)
+        self.assertEqual(diet.tkraise.call_count, 2)
+        training.tkraise.assert_called_once()
+        self.assertEqual(self.screens.current, "diet")
+
+    def test_reset(self):
+        """Kijelentkezés után az oldalak újraépülnek"""
+        build = MagicMock()
+
+        with patch('ttkbootstrap.Frame', side_effect=lambda *args, **kwargs: MagicMock()):
+            self.screens.show("profile", build)
+            self.assertFalse(self.screens.is_empty())
+
+            self.screens.reset()
+            self.assertTrue(self.screens.is_empty())
+            self.assertIsNone(self.screens.current)
+
+            self.screens.show("profile", build)
+
+        self.assertEqual(build.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_screens.py
+     coverage run -m unittest app/tesztek/test_screens.py
+     coverage report
+"""
@@ -0,0 +1,65 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from app.startup import StartupProfiler, PROFILE_FLAG, PROFILE_FILE
+
+class TestStartupProfiler(unittest.TestCase):
+
+    def test_from_argv(self):
+        """A profilozás csak a kapcsolóval kapcsol be"""
+        self.assertTrue(StartupProfiler.from_argv(["main.py", PROFILE_FLAG]).enabled)
+        self.assertFalse(StartupProfiler.from_argv(["main.py"]).enabled)
+        self.assertFalse(StartupProfiler.from_argv([PROFILE_FLAG]).enabled)
+
+    def test_phases(self):
+        """Szakaszok és az első kirajzolás mérése"""
+        profiler = StartupProfiler(started=0.0)
+
+        with profiler.phase("ablak"):
+            pass
+        with self.assertRaises(ValueError):
+            with profiler.phase("hibás"):
+                raise ValueError()
+        with patch('time.perf_counter', return_value=0.25):
+            profiler.mark_first_frame()
+        profiler.mark_first_frame()
+
+        self.assertEqual([name for name, _ in profiler.phases], ["ablak", "hibás"])
+        self.assertEqual(profiler.first_frame, 0.25)
+        self.assertIn("250.0 ms", profiler.lines()[-1])
+
+    def test_report(self):
+        """Jelentés a hibakimenetre, csak bekapcsolva"""
+        stream = io.StringIO()
+        with patch('sys.stderr', stream):
+            StartupProfiler().report()
+            self.assertEqual(stream.getvalue(), "")
+
+            profiler = StartupProfiler(enabled=True)
+            with profiler.phase("ablak"):
+                pass
+            profiler.report()
+
+        self.assertIn("ablak", stream.getvalue())
+
+    def test_report_without_console(self):
+        """Konzol nélkül (PyInstaller windowed) fájlba készül a jelentés"""
+        with tempfile.TemporaryDirectory() as directory, \
+             patch('sys.stderr', None), \
+             patch('app.startup.resource_path', side_effect=lambda name: os.path.join(directory, name)):
+            profiler = StartupProfiler(enabled=True)
+            profiler.mark_first_frame()
+            profiler.report()
+
+            with open(os.path.join(directory, PROFILE_FILE), encoding="utf-8") as profile_file:
+                self.assertIn("első kirajzolás", profile_file.read())
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_startup.py
+     coverage run -m unittest app/tesztek/test_startup.py
+     coverage report
+"""
@@ -0,0 +1,101 @@
+import unittest
+from unittest.mock import MagicMock
+from app.table_sync import sync_rows, pending_iid, is_pending
+
+class FakeTreeview:
+    """A Treeview sorainak egyszerű utánzata (sorrend, értékek, hívások)"""
+
+    def __init__(self):
+        self.items = []
+        self.values = {}
+        self.calls = MagicMock()
+
+    def get_children(self):
+        return tuple(self.items)
+
+    def insert(self, parent, index, iid, values):
+        self.calls.insert(iid)
+        self.items.insert(index, iid)
+        self.values[iid] = values
+
+    def item(self, iid, values):
+        self.calls.item(iid)
+        self.values[iid] = values
+
+    def delete(self, *iids):
+        self.calls.delete(*iids)
+        for iid in iids:
+            self.items.remove(iid)
+            self.values.pop(iid, None)
+
+    def move(self, iid, parent, index):
+        self.calls.move(iid)
+        self.items.remove(iid)
+        self.items.append(iid)
+
+class TestSyncRows(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.table = FakeTreeview()
+        sync_rows(self.table, [(1, ("alma", 52)), (2, ("banán", 89)), (3, ("kenyér", 250))])
+        self.table.calls.reset_mock()
+
+    def test_first_load(self):
+        """Üres táblázat feltöltése"""
+        self.assertEqual(self.table.items, ["1", "2", "3"])
+        self.assertEqual(self.table.values["2"], ("banán", 89))
+
+    def test_unchanged(self):
+        """Változatlan adatoknál a táblázathoz nem nyúl"""
+        self.assertEqual(sync_rows(self.table, [(1, ("alma", 52)), (2, ("banán", 89)), (3, ("kenyér", 250))]),
+                         (0, 0, 0))
+        self.assertEqual(self.table.calls.mock_calls, [])
+
+    def test_only_changed_rows(self):
+        """Csak a beszúrt, módosult és törölt sorok íródnak át"""
+        result = sync_rows(self.table, [(1, ("alma", 52)), (3, ("kenyér", 260)), (4, ("tej", 64))])
+
+        self.assertEqual(result, (1, 1, 1))
+        self.table.calls.delete.assert_called_once_with("2")
+        self.table.calls.item.assert_called_once_with("3")
+        self.table.calls.insert.assert_called_once_with("4")
+        self.table.calls.move.assert_not_called()
+        self.assertEqual(self.table.items, ["1", "3", "4"])
+        self.assertEqual(self.table.values["3"], ("kenyér", 260))
+
+    def test_foreign_rows_removed(self):
+        """Az adatbázis azonosító nélküli (pl. előre beszúrt) sorok törlődnek"""
+        self.table.items.append("I001")
+
+        sync_rows(self.table, [(1, ("alma", 52)), (2, ("banán", 89)), (3, ("kenyér", 250)), (4, ("tej", 64))])
+
+        self.table.calls.delete.assert_called_once_with("I001")
+        self.assertEqual(self.table.items, ["1", "2", "3", "4"])
+
+    def test_pending_rows(self):
+        """Az ideiglenes azonosítójú sorokat a mentés utáni frissítés cseréli le"""
+        iid = pending_iid()
+        self.assertTrue(is_pending(iid))
+        self.assertNotEqual(pending_iid(), iid)
+        self.assertFalse(is_pending("4"))
+        self.table.insert("", len(self.table.items), iid, ("tej", 64))
+
+        sync_rows(self.table, [(1, ("alma", 52)), (2, ("banán", 89)), (3, ("kenyér", 250)), (4, ("tej", 64))])
+
+        self.assertEqual(self.table.items, ["1", "2", "3", "4"])
+
+    def test_reorder(self):
+        """Megváltozott sorrend helyreállítása"""
+        sync_rows(self.table, [(3, ("kenyér", 250)), (1, ("alma", 52)), (5, ("sajt", 350)), (2, ("banán", 89))])
+
+        self.assertEqual(self.table.items, ["3", "1", "5", "2"])
+        self.table.calls.item.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_table_sync.py
+     coverage run -m unittest app/tesztek/test_table_sync.py
+     coverage report
+"""
@@ -1,12 +1,20 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, patch, ANY
 from app.training_manager import TrainingManager
+from app.catalog import ExerciseCatalog
+from app.dialogs import DialogPool
+from app.scheduler import UiScheduler
 
 class TestTrainingManager(unittest.TestCase):
 
     def setUp(self):
         """Teszt környezet előkészítése"""
         self.mock_app = MagicMock()
+        self.mock_app.exercises.catalog_entries.return_value = []
+        self.mock_app.exercise_catalog = ExerciseCatalog(self.mock_app.exercises)
+        self.mock_app.dialogs = DialogPool(self.mock_app.root)
+        self.mock_app.scheduler = UiScheduler(self.mock_app.root)
+        self.mock_app.show_screen.side_effect = lambda name, build, refresh: (build(MagicMock()), refresh())
         self.training_manager = TrainingManager(self.mock_app)
 
     def test_training_page(self):
@@ -18,32 +26,24 @@ class TestTrainingManager(unittest.TestCase):
             self.mock_app.user_id = 1
             self.mock_app.root = MagicMock()
 
-            def mock_execute(query, *args):
-                if 'SELECT day_name' in query:
-                    self.mock_app.db_cursor.fetchall.return_value = [("Hétfő",), ("Szerda",), ("Péntek",)]
-                else:
-                    self.mock_app.db_cursor.fetchall.return_value = []
-                return self.mock_app.db_cursor
-
-            self.mock_app.db_cursor.execute = MagicMock(side_effect=mock_execute)
+            self.mock_app.training_days.names.side_effect = lambda user_id: ["Hétfő", "Szerda", "Péntek"]
+            self.mock_app.exercises.for_day_page.return_value = []
 
             mock_table = MagicMock()
             mock_treeview.return_value = mock_table
 
             self.training_manager.training_page()
 
-            self.mock_app.clear_screen.assert_called_once()
-            self.mock_app.load_navigation_bar.assert_called_once()
+            self.mock_app.show_screen.assert_called_once_with(
+                "training", self.training_manager.build_training_page, self.training_manager.refresh_training_page)
 
-            expected_query = """SELECT day_name FROM training_days WHERE user_id = ?"""
-            self.mock_app.db_cursor.execute.assert_any_call(
-                expected_query,
-                (self.mock_app.user_id,)
-            )
+            self.mock_app.training_days.names.assert_any_call(self.mock_app.user_id)
 
             self.assertGreater(mock_frame.call_count, 0)
             self.assertGreater(mock_button.call_count, 0)
-            mock_treeview.assert_called_once()
+            self.assertEqual(mock_treeview.call_count, 2)
+            self.assertEqual(mock_treeview.call_args_list[1][1]['columns'],
+                             ("Izomcsoport", "Gyakorlat", "Sorozat", "Heti volumen (kg)"))
 
             expected_button_count = 4
             self.assertEqual(len(self.training_manager.day_buttons), expected_button_count)
@@ -64,6 +64,40 @@ class TestTrainingManager(unittest.TestCase):
                 mock_table.heading.assert_any_call(col, text=col, anchor="center")
                 mock_table.column.assert_any_call(col, anchor="center", width=expected_widths[col])
 
+    def test_refresh_training_page(self):
+        """Ismételt megjelenítéskor a kiválasztott nap megmarad"""
+        self.mock_app.user_id = 1
+        self.training_manager.training_table = MagicMock()
+        self.mock_app.exercises.for_day_page.return_value = []
+
+        with patch('ttkbootstrap.Button', side_effect=lambda *args, **kwargs: MagicMock()) as mock_button:
+            self.mock_app.training_days.names.return_value = ["Hétfő", "Szerda"]
+            self.training_manager.current_day = "Szerda"
+            self.training_manager.refresh_training_page()
+
+            self.assertEqual(self.training_manager.current_day, "Szerda")
+            self.assertEqual(len(self.training_manager.day_buttons), 3)
+            styles = {call[1]['text']: call[1]['style'] for call in mock_button.call_args_list}
+            self.assertEqual(styles, {"Hétfő": "words.TButton",
+                                      "Szerda": "selected.TButton",
+                                      "+ Új nap": "darkbutton.TButton"})
+
+            old_buttons = list(self.training_manager.day_buttons)
+            self.mock_app.training_days.names.return_value = ["Hétfő"]
+            self.training_manager.refresh_training_page()
+
+            self.assertEqual(self.training_manager.current_day, "Hétfő")
+            for btn in old_buttons:
+                btn.destroy.assert_called_once()
+            self.assertEqual(len(self.training_manager.day_buttons), 2)
+
+            self.training_manager.training_table.get_children.return_value = ("1",)
+            self.mock_app.training_days.names.return_value = []
+            self.training_manager.refresh_training_page()
+
+            self.assertIsNone(self.training_manager.current_day)
+            self.training_manager.training_table.delete.assert_called()
+
     def test_select_training_day(self):
         """Edzésnap kiválasztásának tesztelése"""
         with patch('ttkbootstrap.Frame') as mock_frame, \
@@ -89,20 +123,10 @@ class TestTrainingManager(unittest.TestCase):
             mock_treeview.return_value = mock_table
             self.training_manager.training_table = mock_table
 
-            self.mock_app.db_cursor.fetchone = MagicMock(return_value=(1,))
-            self.mock_app.db_cursor.fetchall = MagicMock(return_value=[
-                ("Fekvőtámasz", 3, 12, 0, "Nincs", "Kezdő", "Alapgyakorlat")
-            ])
-
-            def mock_execute(query, params=None):
-                normalized_query = ' '.join(query.split())
-                if 'SELECT id FROM training_days WHERE user_id = ? AND day_name = ?' in normalized_query:
-                    return self.mock_app.db_cursor
-                elif 'SELECT exercise_name, sets, reps, weight, equipment, difficulty, description FROM exercises WHERE day_id = ?' in normalized_query:
-                    return self.mock_app.db_cursor
-                return self.mock_app.db_cursor
-
-            self.mock_app.db_cursor.execute = MagicMock(side_effect=mock_execute)
+            self.mock_app.training_days.find_id.return_value = 1
+            self.mock_app.exercises.for_day_page.return_value = [
+                (7, "Fekvőtámasz", 3, 12, 0, "Nincs", "Kezdő", "Alapgyakorlat")
+            ]
 
             #1. Eset: "+ Új nap" kiválasztása
             self.training_manager.add_new_day = MagicMock()
@@ -120,23 +144,11 @@ class TestTrainingManager(unittest.TestCase):
 
             self.assertEqual(self.training_manager.current_day, "Hétfő")
 
-            calls = self.mock_app.db_cursor.execute.call_args_list
-            expected_calls = [
-                unittest.mock.call(
-                    "SELECT id FROM training_days WHERE user_id = ? AND day_name = ?",
-                    (self.mock_app.user_id, "Hétfő")
-                ),
-                unittest.mock.call(
-                    "SELECT exercise_name, sets, reps, weight, equipment, difficulty, description FROM exercises WHERE day_id = ?",
-                    (1,)
-                )
-            ]
-
-            for expected_call in expected_calls:
-                self.assertIn(expected_call, calls)
+            self.mock_app.training_days.find_id.assert_called_with(self.mock_app.user_id, "Hétfő")
+            self.mock_app.exercises.for_day_page.assert_called_with(1, None, None, 51)
 
             mock_table.get_children.assert_called()
-            mock_table.insert.assert_called_with("", "end", values=(
+            mock_table.insert.assert_called_with("", 0, iid="7", values=(
                 "Fekvőtámasz", 3, 12, 0, "Nincs", "Kezdő", "Alapgyakorlat"
             ))
 
@@ -190,6 +202,7 @@ class TestTrainingManager(unittest.TestCase):
                     break
             
             self.assertIsNotNone(save_button)
+            popup.register.assert_called_once()
             save_button()
             
             self.mock_app.custom_messagebox.assert_called_with(
@@ -202,7 +215,7 @@ class TestTrainingManager(unittest.TestCase):
             
             #3. Eset: Sikeres hozzáadás
             mock_entry_instance.get.return_value = "Kedd"
-            self.mock_app.db_cursor.fetchone.return_value = None
+            self.mock_app.training_days.find_id.return_value = None
             
             self.training_manager.add_new_day()
             
@@ -213,23 +226,26 @@ class TestTrainingManager(unittest.TestCase):
                     break
             
             self.assertIsNotNone(save_button)
+            mock_toplevel.assert_not_called()
+            popup.register.assert_not_called()
+            mock_entry_instance.delete.assert_called_with(0, "end")
             save_button()
             
-            self.mock_app.db_cursor.execute.assert_any_call(
-                """SELECT day_name FROM training_days WHERE user_id = ? AND day_name = ?""", (self.mock_app.user_id, "Kedd"))
-            
-            self.mock_app.db_cursor.execute.assert_any_call(
-                """
-                    INSERT INTO training_days (user_id, day_name)
-                    VALUES (?, ?)
-                """, (self.mock_app.user_id, "Kedd"))
+            self.mock_app.training_days.find_id.assert_any_call(self.mock_app.user_id, "Kedd")
+            popup.withdraw.assert_called()
             
-            self.mock_app.db_connection.commit.assert_called()
+            insert_call = self.mock_app.db_worker.submit.call_args
+            self.assertEqual(insert_call[0], (self.mock_app.training_days.add, self.mock_app.user_id, "Kedd"))
+            self.mock_app.training_days.add.assert_not_called()
+
+            self.training_manager.show_new_day = MagicMock()
+            insert_call[1]['callback'](1)
+            self.training_manager.show_new_day.assert_called_once_with("Kedd")
             
             self.mock_app.custom_messagebox.reset_mock()
             
             #4. Eset: Létező nap hozzáadása
-            self.mock_app.db_cursor.fetchone.return_value = ("Kedd",)
+            self.mock_app.training_days.find_id.return_value = 2
             save_button()
             
             self.mock_app.custom_messagebox.assert_called_with(
@@ -248,8 +264,7 @@ class TestTrainingManager(unittest.TestCase):
             self.mock_app.user_id = 1
             self.mock_app.root = MagicMock()
             
-            self.mock_app.db_cursor.fetchone.return_value = (1,)
-            self.mock_app.db_cursor.execute = MagicMock()
+            self.mock_app.training_days.find_id.return_value = 1
 
             mock_table = MagicMock()
             mock_table.get_children.return_value = []
@@ -286,26 +301,8 @@ class TestTrainingManager(unittest.TestCase):
             self.assertIsNotNone(confirm_button)
             confirm_button()
 
-            def normalize_query(query):
-                return ' '.join(query.split())
-
-            calls = self.mock_app.db_cursor.execute.call_args_list
-            select_call_found = False
-            delete_exercises_found = False
-            delete_day_found = False
-
-            expected_select = "SELECT id FROM training_days WHERE user_id = ? AND day_name = ?"
-            expected_delete_exercises = "DELETE FROM exercises WHERE day_id = ?"
-            expected_delete_day = "DELETE FROM training_days WHERE id = ?"
-
-            for call in calls:
-                query = normalize_query(call[0][0])
-                if query == expected_select and call[0][1] == (self.mock_app.user_id, "Hétfő"):
-                    select_call_found = True
-                elif query == expected_delete_exercises and call[0][1] == (1,):
-                    delete_exercises_found = True
-                elif query == expected_delete_day and call[0][1] == (1,):
-                    delete_day_found = True
+            self.mock_app.training_days.find_id.assert_called_with(self.mock_app.user_id, "Hétfő")
+            self.mock_app.db_worker.submit.assert_called_once_with(self.mock_app.training_days.delete, 1, callback=ANY)
 
             mock_day_button.destroy.assert_called_once()
             mock_table.get_children.assert_called()
@@ -325,44 +322,20 @@ class TestTrainingManager(unittest.TestCase):
         self.mock_app.user_id = 1
 
         test_exercises = [
-            ("Fekvőtámasz", 3, 12, 20, "Nincs", "Kezdő", "Leírás 1"),
-            ("Húzódzkodás", 4, 8, 0, "Húzódzkodó", "Haladó", "Leírás 2")
+            (1, "Fekvőtámasz", 3, 12, 20, "Nincs", "Kezdő", "Leírás 1"),
+            (2, "Húzódzkodás", 4, 8, 0, "Húzódzkodó", "Haladó", "Leírás 2")
         ]
 
-        def mock_execute(query, *args):
-            if "SELECT id FROM training_days" in query:
-                self.mock_app.db_cursor.fetchone.return_value = (1,)
-            elif "SELECT exercise_name" in query:
-                self.mock_app.db_cursor.fetchall.return_value = test_exercises
-            return self.mock_app.db_cursor
-
-        self.mock_app.db_cursor.execute = MagicMock(side_effect=mock_execute)
+        self.mock_app.training_days.find_id.return_value = 1
+        self.mock_app.exercises.for_day_page.return_value = test_exercises
 
         self.training_manager.load_training_plan("Hétfő")
 
         mock_table.get_children.assert_called()
-        for item in items:
-            mock_table.delete.assert_any_call(item)
-
-        def normalize_query(query):
-            return ' '.join(query.split())
-
-        calls = self.mock_app.db_cursor.execute.call_args_list
-        select_day_found = False
-        select_exercises_found = False
+        mock_table.delete.assert_called_once_with(*items)
 
-        expected_select_day = "SELECT id FROM training_days WHERE user_id = ? AND day_name = ?"
-        expected_select_exercises = "SELECT exercise_name, sets, reps, weight, equipment, difficulty, description FROM exercises WHERE day_id = ?"
-
-        for call in calls:
-            query = normalize_query(call[0][0])
-            if query == expected_select_day and call[0][1] == (self.mock_app.user_id, "Hétfő"):
-                select_day_found = True
-            elif query == expected_select_exercises and call[0][1] == (1,):
-                select_exercises_found = True
-
-        self.assertTrue(select_day_found, "SELECT training_days lekérdezés nem található")
-        self.assertTrue(select_exercises_found, "SELECT exercises lekérdezés nem található")
+        self.mock_app.training_days.find_id.assert_called_with(self.mock_app.user_id, "Hétfő")
+        self.mock_app.exercises.for_day_page.assert_called_with(1, None, None, 51)
 
         insert_calls = mock_table.insert.call_args_list
         self.assertEqual(len(insert_calls), len(test_exercises))
@@ -370,60 +343,158 @@ class TestTrainingManager(unittest.TestCase):
         for i, exercise in enumerate(test_exercises):
             self.assertEqual(
                 insert_calls[i],
-                unittest.mock.call("", "end", values=exercise)
+                unittest.mock.call("", i, iid=str(exercise[0]), values=exercise[1:])
             )
 
+        #Újratöltéskor csak a megváltozott sor íródik át
+        mock_table.reset_mock()
+        mock_table.get_children.return_value = ("1", "2")
+        self.mock_app.exercises.for_day_page.return_value = [
+            test_exercises[0],
+            (2, "Húzódzkodás", 5, 8, 0, "Húzódzkodó", "Haladó", "Leírás 2")
+        ]
+
+        self.training_manager.load_training_plan("Hétfő")
+
+        mock_table.delete.assert_not_called()
+        mock_table.insert.assert_not_called()
+        mock_table.item.assert_called_once_with("2", values=("Húzódzkodás", 5, 8, 0, "Húzódzkodó", "Haladó", "Leírás 2"))
+
     def test_delete_exercise(self):
         """Kiválasztott gyakorlat törlésének tesztelése"""
         self.training_manager.training_table = MagicMock()
         self.mock_app.user_id = 1
         self.training_manager.current_day = "Hétfő"
-        self.mock_app.db_cursor = MagicMock()
 
         #1. Eset: Nincs kiválasztott gyakorlat
         self.training_manager.training_table.selection.return_value = []
         self.training_manager.delete_exercise()
         self.mock_app.custom_messagebox.assert_called_with("Hiba", "Kérlek, válassz ki egy gyakorlatot a törléshez!")
 
-        #2. Eset: Kiválasztott gyakorlat törlése
-        selected_item = ["item1"]
-        self.training_manager.training_table.selection.return_value = selected_item
-        self.training_manager.training_table.item.return_value = {
-            'values': ("Fekvőtámasz", 3, 12, 20)
-        }
-        self.mock_app.db_cursor.fetchone.return_value = (1,)
-
-        def mock_execute(query, *args):
-            normalized_query = ' '.join(query.split())
-            expected_select = "SELECT id FROM training_days WHERE user_id = ? AND day_name = ?"
-            expected_delete = "DELETE FROM exercises WHERE day_id = ? AND exercise_name = ? AND sets = ? AND reps = ? AND weight = ?"
-            
-            if normalized_query == expected_select or normalized_query == expected_delete:
-                return self.mock_app.db_cursor
-            return self.mock_app.db_cursor
+        #2. Eset: Kiválasztott gyakorlat törlése azonosító szerint
+        self.training_manager.training_table.selection.return_value = ("7",)
 
-        self.mock_app.db_cursor.execute = MagicMock(side_effect=mock_execute)
+        self.training_manager.delete_exercise()
+
+        submit_call = self.mock_app.db_worker.submit.call_args
+        self.assertEqual(submit_call[0], (self.mock_app.exercises.delete_many, ["7"]))
+        self.mock_app.exercises.delete_many.assert_not_called()
+        self.mock_app.training_days.find_id.assert_not_called()
+        self.training_manager.training_table.delete.assert_called_with("7")
+
+        #3. Eset: Több kijelölt gyakorlat törlése egyetlen művelettel
+        self.mock_app.db_worker.submit.reset_mock()
+        self.training_manager.training_table.selection.return_value = ("7", "9")
+
+        self.training_manager.delete_exercise()
+
+        self.mock_app.db_worker.submit.assert_called_once()
+        self.assertEqual(self.mock_app.db_worker.submit.call_args[0][1], ["7", "9"])
+        self.training_manager.training_table.delete.assert_called_with("7", "9")
+
+        #4. Eset: Több sikertelen művelet után egyetlen újratöltés
+        self.training_manager.load_training_plan = MagicMock()
+        error_callback = self.mock_app.db_worker.submit.call_args[1]['error_callback']
+        error_callback(Exception("hiba"))
+        error_callback(Exception("hiba"))
+        self.training_manager.load_training_plan.assert_not_called()
+
+        self.mock_app.scheduler.flush()
+
+        self.training_manager.load_training_plan.assert_called_once_with("Hétfő")
 
+        #5. Eset: Még mentés alatt álló (ideiglenes azonosítójú) sor nem törölhető
+        self.mock_app.db_worker.submit.reset_mock()
+        self.training_manager.training_table.delete.reset_mock()
+        self.training_manager.training_table.selection.return_value = ("7", "pending-1")
+
+        self.training_manager.delete_exercise()
+
+        self.mock_app.custom_messagebox.assert_called_with("Hiba", "A gyakorlat mentése még folyamatban van, kérlek, próbáld újra!")
+        self.mock_app.db_worker.submit.assert_not_called()
+        self.training_manager.training_table.delete.assert_not_called()
+
+    def test_volume_summary(self):
+        """Izomcsoportonkénti összesítés az összesítő táblából, mentések után egyszer"""
+        self.mock_app.user_id = 1
+        self.training_manager.volume_table = MagicMock()
+        self.training_manager.volume_table.get_children.return_value = ()
+        self.mock_app.exercises.volume_by_group.return_value = [("mell", 2, 8, 4800.0), ("", 1, 3, 0.0)]
+        self.training_manager.training_table = MagicMock()
+        self.training_manager.training_table.selection.return_value = ["item1"]
+        self.training_manager.training_table.item.return_value = {'values': ("Fekvőtámasz", 3, 12, 20)}
+        self.mock_app.training_days.find_id.return_value = 1
+
+        self.training_manager.delete_exercise()
         self.training_manager.delete_exercise()
+        for call in self.mock_app.db_worker.submit.call_args_list:
+            call[1]['callback'](None)
+        self.mock_app.exercises.volume_by_group.assert_not_called()
 
-        normalized_select_query = "SELECT id FROM training_days WHERE user_id = ? AND day_name = ?"
-        normalized_delete_query = "DELETE FROM exercises WHERE day_id = ? AND exercise_name = ? AND sets = ? AND reps = ? AND weight = ?"
+        self.mock_app.scheduler.flush()
 
-        select_call_found = False
-        delete_call_found = False
+        self.mock_app.exercises.volume_by_group.assert_called_once_with(1)
+        self.assertEqual([call[1]['values'] for call in self.training_manager.volume_table.insert.call_args_list],
+                         [("mell", 2, 8, "4 800"), ("egyéb", 1, 3, "0")])
 
-        for call in self.mock_app.db_cursor.execute.call_args_list:
-            normalized_call_query = ' '.join(call[0][0].split())
-            if normalized_call_query == normalized_select_query and call[0][1] == (self.mock_app.user_id, self.training_manager.current_day):
-                select_call_found = True
-            elif normalized_call_query == normalized_delete_query and call[0][1] == (1, "Fekvőtámasz", 3, 12, 20):
-                delete_call_found = True
+    def test_log_set(self):
+        """Elvégzett sorozat naplózása a háttérszálon, az ablak nyitva marad"""
+        self.mock_app.user_id = 1
+        self.training_manager.training_table = MagicMock()
+
+        #1. Eset: Nincs kijelölt gyakorlat
+        self.training_manager.training_table.selection.return_value = ()
+        self.training_manager.log_set()
+        self.mock_app.custom_messagebox.assert_called_with("Hiba", "Kérlek, válassz ki egy gyakorlatot a naplózáshoz!")
 
-        self.assertTrue(select_call_found, "SELECT lekérdezés nem található a megfelelő paraméterekkel")
-        self.assertTrue(delete_call_found, "DELETE lekérdezés nem található a megfelelő paraméterekkel")
+        #2. Eset: Naplózás a legutóbbi sorozat értékeivel
+        self.training_manager.training_table.selection.return_value = ("item1",)
+        self.training_manager.training_table.item.return_value = {'values': ("Fekvenyomás", 4, 10, "60.0")}
+        self.mock_app.workout_sets.last_set.return_value = (8, 62.5)
+        self.mock_app.workout_sets.recent_sessions.return_value = [("2025-01-02", 4, 32, 62.5, 2000.0)]
 
-        self.mock_app.db_connection.commit.assert_called_once()
-        self.training_manager.training_table.delete.assert_called_with(selected_item[0])
+        with patch('ttkbootstrap.Toplevel') as mock_toplevel, \
+             patch('ttkbootstrap.Frame'), \
+             patch('ttkbootstrap.Label'), \
+             patch('ttkbootstrap.Entry') as mock_entry, \
+             patch('ttkbootstrap.Button') as mock_button, \
+             patch('ttkbootstrap.Spinbox') as mock_spinbox, \
+             patch('ttkbootstrap.Treeview') as mock_treeview, \
+             patch('app.training_manager.time.time', return_value=1735800000.5):
+            mock_treeview.return_value.get_children.return_value = ()
+
+            self.training_manager.log_set()
+
+            self.mock_app.workout_sets.last_set.assert_called_once_with(1, "Fekvenyomás")
+            mock_spinbox.return_value.insert.assert_called_with(0, "8")
+            mock_entry.return_value.insert.assert_called_with(0, "62.5")
+            mock_treeview.return_value.insert.assert_called_once_with(
+                "", 0, iid="2025-01-02", values=("2025-01-02", 4, 32, "62.5", "2 000"))
+
+            mock_spinbox.return_value.get.return_value = "8"
+            mock_entry.return_value.get.return_value = "62.5"
+            save_button = next(call[1]['command'] for call in mock_button.call_args_list
+                               if call[1].get('text') == "Sorozat mentése")
+            save_button()
+            save_button()
+
+            self.assertEqual(self.mock_app.db_worker.submit.call_count, 2)
+            submit_call = self.mock_app.db_worker.submit.call_args
+            self.assertEqual(submit_call[0], (self.mock_app.workout_sets.add, 1, "Fekvenyomás", 8, 62.5, 1735800000.5))
+            self.mock_app.workout_sets.add.assert_not_called()
+            mock_toplevel.return_value.withdraw.assert_called_once()
+
+            self.mock_app.workout_sets.recent_sessions.reset_mock()
+            for call in self.mock_app.db_worker.submit.call_args_list:
+                call[1]['callback'](1)
+            self.mock_app.scheduler.flush()
+            self.mock_app.workout_sets.recent_sessions.assert_called_once_with(1, "Fekvenyomás")
+
+            #3. Eset: Érvénytelen ismétlésszám
+            mock_spinbox.return_value.get.return_value = ""
+            save_button()
+            self.assertEqual(self.mock_app.db_worker.submit.call_count, 2)
+            self.mock_app.custom_messagebox.assert_called_with("Hiányzó adatok", "Kérlek, adj meg egy érvényes ismétlésszámot!")
 
     def test_add_exercise(self):
         """Új gyakorlat hozzáadásának tesztelése"""
@@ -458,11 +529,10 @@ class TestTrainingManager(unittest.TestCase):
             popup.winfo_height.return_value = 500
             mock_toplevel.return_value = popup
 
-            test_exercises = [
-                ("Fekvőtámasz", "Nincs", "Kezdő"),
-                ("Húzódzkodás", "Húzódzkodó", "Haladó")
+            self.mock_app.exercises.catalog_entries.return_value = [
+                ("mell", "Fekvőtámasz", "Nincs", "Kezdő", "Alap gyakorlat"),
+                ("hát", "Húzódzkodás", "Húzódzkodó", "Haladó", "Saját testsúlyos gyakorlat")
             ]
-            self.mock_app.db_cursor.fetchall.return_value = test_exercises
 
             mock_muscle_group_var = MagicMock()
             mock_exercise_var = MagicMock()
@@ -485,6 +555,23 @@ class TestTrainingManager(unittest.TestCase):
             
             self.assertIsNotNone(muscle_group_combobox_call, "Izomcsoport Combobox nem megfelelő értékekkel lett létrehozva")
 
+            #3. Eset: Izomcsoport és gyakorlat választás a memóriában tartott katalógusból
+            muscle_group_combo = mock_combobox.return_value
+            bindings = {call[0][0]: call[0][1] for call in muscle_group_combo.bind.call_args_list}
+            update_exercises = muscle_group_combo.bind.call_args_list[0][0][1]
+            update_info = muscle_group_combo.bind.call_args_list[1][0][1]
+            self.assertIn('<<ComboboxSelected>>', bindings)
+
+            mock_muscle_group_var.get.return_value = "mell"
+            update_exercises()
+            muscle_group_combo.__setitem__.assert_called_with('values', ["Fekvőtámasz | Nincs | Kezdő"])
+
+            mock_exercise_var.get.return_value = "Fekvőtámasz | Nincs | Kezdő"
+            update_info()
+            mock_label.return_value.config.assert_any_call(text="Leírás: Alap gyakorlat")
+
+            self.mock_app.exercises.catalog_entries.assert_called_once()
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,48 @@
+import unittest
+from unittest.mock import MagicMock
+from app.analytics import MealTrends
+from app.trend_chart import TrendChart, summary_text, OVER_COLOR, BAR_COLOR
+
+class TestTrendChart(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.canvas = MagicMock()
+        self.canvas.winfo_width.return_value = 300
+        self.canvas.winfo_height.return_value = 100
+        self.label = MagicMock()
+        self.chart = TrendChart(self.canvas, self.label)
+        self.trends = MealTrends(["2025-01-09", "2025-01-10"], [3000, 1800])
+
+    def test_draw(self):
+        """Oszlopok, átlag vonal és keret vonal"""
+        self.chart.draw(self.trends, "2025-01-10", 2000)
+
+        self.canvas.delete.assert_called_once_with("all")
+        fills = [call[1]['fill'] for call in self.canvas.create_rectangle.call_args_list]
+        self.assertEqual(fills, [OVER_COLOR, BAR_COLOR])
+        self.assertEqual(self.canvas.create_line.call_count, 2)
+        self.label.configure.assert_called_once_with(
+            text="7 napos átlag: 2400 kcal | egyenleg (30 nap): +400 kcal/nap | keret alatt: 1 nap (max. 1)")
+
+    def test_draw_without_size_or_date(self):
+        """Méret nélkül vagy érvénytelen dátumnál üres grafikon"""
+        self.chart.draw(self.trends, "nem dátum", 2000)
+        self.canvas.winfo_width.return_value = 1
+        self.chart.draw(self.trends, "2025-01-10")
+
+        self.canvas.create_rectangle.assert_not_called()
+        self.assertEqual(self.label.configure.call_count, 2)
+
+    def test_summary_text(self):
+        """Összefoglaló szöveg"""
+        self.assertEqual(summary_text(MealTrends().summary()), "Még nincs naplózott nap.")
+        self.assertEqual(summary_text(self.trends.summary()), "7 napos átlag: 2400 kcal")
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_trend_chart.py
+     coverage run -m unittest app/tesztek/test_trend_chart.py
+     coverage report
+"""
@@ -10,6 +10,7 @@ class TestUserManager(unittest.TestCase):
         self.mock_app.screen_stack = MagicMock()
         self.mock_app.clear_screen = MagicMock()
         self.mock_app.root = MagicMock()
+        self.mock_app.show_screen.side_effect = lambda name, build, refresh: (build(MagicMock()), refresh())
         self.user_manager = UserManager(self.mock_app)
 
     def test_login_or_register(self):
@@ -31,7 +32,7 @@ class TestUserManager(unittest.TestCase):
             
             self.assertIn(self.user_manager.login_page, commands)
             self.assertIn(self.user_manager.register_data_1, commands)
-            self.assertIn(self.mock_app.root.quit, commands)
+            self.assertIn(self.mock_app.quit, commands)
 
     def test_label_box(self):
         test_text = "Test Label"
@@ -131,13 +132,14 @@ class TestUserManager(unittest.TestCase):
 
         #3. Eset: Létező email
         self.user_manager.jelszo_megerosites_input.get.return_value = "password123"
-        self.mock_app.db_cursor.fetchone.return_value = ["teszt@example.com"]
+        self.mock_app.users.email_exists.return_value = True
         
         self.user_manager.registration_1()
+        self.mock_app.users.email_exists.assert_called_with("teszt@example.com")
         self.mock_app.custom_messagebox.assert_called_with("Hiba", "Ez az email cím már regisztrálva van!")
 
         #4. Eset: Sikeres regisztráció
-        self.mock_app.db_cursor.fetchone.return_value = None
+        self.mock_app.users.email_exists.return_value = False
         
         self.user_manager.registration_1()
         
@@ -176,17 +178,17 @@ class TestUserManager(unittest.TestCase):
         
         self.user_manager.registration_2()
         
-        self.mock_app.db_cursor.execute.assert_called_with('''
-                INSERT INTO users (vezeteknev, keresztnev, email, jelszo, eletkor, magassag, testsuly, nem, aktivitas)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', ("Teszt", "Elek", "teszt@example.com", "password123", "25", "180", "75", "Férfi", "Közepes"))
+        insert_call = self.mock_app.db_worker.submit.call_args
+        self.assertEqual(insert_call[0],
+                         (self.mock_app.users.add,
+                          "Teszt", "Elek", "teszt@example.com", "password123", "25", "180", "75", "Férfi", "Közepes"))
         
-        self.mock_app.db_connection.commit.assert_called_once()
+        self.mock_app.users.add.assert_not_called()
+        insert_call[1]['callback'](1)
         self.mock_app.custom_messagebox.assert_called_with("Sikeres regisztráció", "A regisztráció sikeres volt!", login=True)
 
         #3. Eset: Adatbázis hiba
-        self.mock_app.db_cursor.execute.side_effect = Exception("DB Error")
-        self.user_manager.registration_2()
+        insert_call[1]['error_callback'](Exception("DB Error"))
         self.mock_app.custom_messagebox.assert_called_with("Hiba", "Hiba történt: DB Error")
 
     def test_login_page(self):
@@ -224,17 +226,16 @@ class TestUserManager(unittest.TestCase):
         #1. Eset: Sikertelen bejelentkezés
         self.user_manager.email_input_login.get.return_value = "teszt@example.com"
         self.user_manager.jelszo_input_login.get.return_value = "password123"
-        self.mock_app.db_cursor.fetchone.return_value = None
+        self.mock_app.users.find_by_credentials.return_value = None
         
         self.user_manager.login_check()
         
-        self.mock_app.db_cursor.execute.assert_called_with('SELECT * FROM users WHERE email = ? AND jelszo = ?',
-                                                           ("teszt@example.com", "password123") )
+        self.mock_app.users.find_by_credentials.assert_called_with("teszt@example.com", "password123")
         self.mock_app.custom_messagebox.assert_called_with("Hibás bejelentkezés", "Az email cím vagy jelszó nem helyes!")
         
         #2. Eset: Sikeres bejelentkezés
         test_user = [1, "Teszt", "Elek", "teszt@example.com", "password123"]
-        self.mock_app.db_cursor.fetchone.return_value = test_user
+        self.mock_app.users.find_by_credentials.return_value = test_user
         
         self.user_manager.login_check()
         
@@ -255,7 +256,7 @@ class TestUserManager(unittest.TestCase):
             self.mock_app.logged_in_user = "teszt@example.com"
             
             initial_data = ["Teszt", "Elek", "teszt@example.com", "25", "180", "75", "Férfi", "Közepes"]
-            self.mock_app.db_cursor.fetchone.return_value = initial_data
+            self.mock_app.users.profile.return_value = initial_data
             
             mock_var = MagicMock()
             mock_stringvar.return_value = mock_var
@@ -265,12 +266,10 @@ class TestUserManager(unittest.TestCase):
             self.user_manager.profile_page()
             
             #1. Betöltés tesztelése
-            self.mock_app.clear_screen.assert_called_once()
-            self.mock_app.load_navigation_bar.assert_called_once()
+            self.mock_app.show_screen.assert_called_once_with(
+                "profile", self.user_manager.build_profile_page, self.user_manager.refresh_profile_page)
             
-            self.mock_app.db_cursor.execute.assert_called_with(
-                'SELECT vezeteknev, keresztnev, email, eletkor, magassag, testsuly, nem, aktivitas FROM users WHERE email = ?',
-                ("teszt@example.com",))
+            self.mock_app.users.profile.assert_called_with("teszt@example.com")
             
             mock_labelframe.assert_called()
             self.assertGreater(mock_label.call_count, 0)
@@ -299,21 +298,17 @@ class TestUserManager(unittest.TestCase):
                     save_function()
                     break
             
-            expected_sql = """UPDATE users 
-                SET vezeteknev = ?, keresztnev = ?, eletkor = ?, magassag = ?, testsuly = ?, aktivitas = ? WHERE email = ?"""
-            expected_params = ("Új", "Név", "30", "185", "80", "Átlagon felüli", "teszt@example.com")
-            
-            calls = self.mock_app.db_cursor.execute.call_args_list
-            found = False
-            for call in calls:
-                normalized_sql = ' '.join(call[0][0].split())
-                normalized_expected = ' '.join(expected_sql.split())
-                if normalized_sql == normalized_expected and call[0][1] == expected_params:
-                    found = True
+            expected_args = (self.mock_app.users.update_profile,
+                             "teszt@example.com", "Új", "Név", "30", "185", "80", "Átlagon felüli")
+            
+            found = None
+            for call in self.mock_app.db_worker.submit.call_args_list:
+                if call[0] == expected_args:
+                    found = call
                     break
             
-            self.assertTrue(found, "A várt SQL művelet nem található a hívások között")
-            self.mock_app.db_connection.commit.assert_called()
+            self.assertIsNotNone(found, "A várt adatbázis művelet nem található a hívások között")
+            found[1]['callback'](None)
             self.mock_app.custom_messagebox.assert_called_with("Siker", "Az adatok sikeresen frissültek!", profile=True)
 
     def test_logout(self):
@@ -0,0 +1,152 @@
+import unittest
+from unittest.mock import MagicMock
+from app.virtual_table import VirtualTable, virtual_table
+
+class FakeTreeview:
+    """Treeview utánzat: sorok sorrendje és a görgetési pozíció"""
+
+    def __init__(self):
+        self.items = []
+        self.first = 0.0
+        self.yscrollcommand = None
+        self.idle = []
+
+    def configure(self, yscrollcommand):
+        self.yscrollcommand = yscrollcommand
+
+    def get_children(self):
+        return tuple(self.items)
+
+    def insert(self, parent, index, iid, values):
+        self.items.insert(index, iid)
+
+    def item(self, iid, values):
+        pass
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.items.remove(iid)
+
+    def move(self, iid, parent, index):
+        self.items.remove(iid)
+        self.items.append(iid)
+
+    def yview(self):
+        return self.first, 1.0
+
+    def yview_moveto(self, fraction):
+        self.first = fraction
+
+    def after_idle(self, function, *args):
+        self.idle.append((function, args))
+        return len(self.idle)
+
+    def run_idle(self):
+        while self.idle:
+            function, args = self.idle.pop(0)
+            function(*args)
+
+def make_source(count):
+    """fetch_page függvény 1..count azonosítójú sorokhoz, a hívások naplózásával"""
+    rows = [(number, f"sor {number}") for number in range(1, count + 1)]
+    calls = []
+
+    def fetch_page(after_id, before_id, limit):
+        calls.append((after_id, before_id, limit))
+        if before_id is not None:
+            return [row for row in rows if row[0] < before_id][-limit:]
+        return [row for row in rows if row[0] > (after_id or 0)][:limit]
+
+    return fetch_page, calls, rows
+
+class TestVirtualTable(unittest.TestCase):
+
+    def setUp(self):
+        """Teszt környezet előkészítése"""
+        self.table = FakeTreeview()
+        self.view = VirtualTable(self.table, page_size=10, max_rows=30)
+        self.fetch_page, self.calls, self.rows = make_source(100)
+
+    def scroll(self, first, last):
+        self.table.first = first
+        self.table.yscrollcommand(first, last)
+        self.table.run_idle()
+
+    def test_first_page(self):
+        """Csak az első lap töltődik be"""
+        self.view.load("nap", self.fetch_page)
+
+        self.assertEqual(self.table.items, [str(number) for number in range(1, 11)])
+        self.assertEqual(self.calls, [(None, None, 11)])
+        self.assertTrue(self.view.has_more)
+
+    def test_scroll_loads_next_page(self):
+        """Az ablak végéhez görgetve a következő lap kulcsos lapozással érkezik"""
+        self.view.load("nap", self.fetch_page)
+
+        self.scroll(0.5, 1.0)
+
+        self.assertEqual(self.calls[-1], (10, None, 11))
+        self.assertEqual(len(self.table.items), 20)
+
+    def test_window_is_bounded(self):
+        """Az ablak nem nő a max_rows fölé, visszagörgetéskor visszatöltődik"""
+        self.view.load("nap", self.fetch_page)
+        for _ in range(5):
+            self.scroll(0.9, 1.0)
+
+        self.assertEqual(len(self.table.items), 30)
+        self.assertEqual(self.table.items[0], "31")
+        self.assertEqual(self.view.start_after, 30)
+
+        self.scroll(0.0, 0.1)
+
+        self.assertEqual(self.calls[-1], (None, 31, 11))
+        self.assertEqual(self.table.items[0], "21")
+        self.assertEqual(len(self.table.items), 30)
+        self.assertTrue(self.view.has_more)
+
+    def test_refresh_keeps_window(self):
+        """Ugyanarra a kulcsra az ablak megmarad, új kulcsra az elejére áll"""
+        self.view.load("nap", self.fetch_page)
+        self.scroll(0.9, 1.0)
+
+        self.view.load("nap", self.fetch_page)
+        self.assertEqual(len(self.table.items), 20)
+
+        self.view.load("másik nap", self.fetch_page)
+        self.assertEqual(len(self.table.items), 10)
+
+    def test_short_list(self):
+        """Rövid listánál nincs további lapozás"""
+        fetch_page, calls, _ = make_source(3)
+        self.view.load("nap", fetch_page)
+        self.scroll(0.0, 1.0)
+
+        self.assertEqual(self.table.items, ["1", "2", "3"])
+        self.assertEqual(len(calls), 1)
+
+        self.view.clear()
+        self.assertEqual(self.table.items, [])
+
+    def test_scrollbar(self):
+        """A görgetősáv megkapja a pozíciót"""
+        scrollbar = MagicMock()
+        self.view.attach_scrollbar(scrollbar)
+
+        self.table.yscrollcommand(0.0, 0.5)
+
+        scrollbar.set.assert_called_once_with(0.0, 0.5)
+
+    def test_one_view_per_table(self):
+        """Egy táblázathoz egy VirtualTable tartozik"""
+        table = FakeTreeview()
+        self.assertIs(virtual_table(table), virtual_table(table))
+
+if __name__ == '__main__':
+    unittest.main()
+
+"""  python -m unittest app/tesztek/test_virtual_table.py
+     coverage run -m unittest app/tesztek/test_virtual_table.py
+     coverage report
+"""
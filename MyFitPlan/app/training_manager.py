@@ -1,7 +1,14 @@
 import ttkbootstrap as ttk
 import sqlite3
+import time
+from app.repositories import MUSCLE_GROUPS
+from app.virtual_table import virtual_table
+from app.table_sync import sync_rows, pending_iid, is_pending
 
 class TrainingManager:
+    MAX_DAYS = 7
+    MAX_CHAR_LENGTH = 10
+
     def __init__(self, app):
         self.app = app
         self.current_day = None
@@ -10,6 +17,7 @@ class TrainingManager:
         self.day_selector_frame = None
         self.delete_day_btn = None
         self.training_frame = None
+        self.volume_table = None
 
     def training_page(self):
         """
@@ -19,11 +27,22 @@ class TrainingManager:
         - nap hozzáadása és törlése gombot
         - gyakorlatok táblázatát
         - gyakorlat hozzáadása és törlése gombokat
+        - elvégzett sorozat naplózása gombot
+        - a heti terv izomcsoportonkénti összesítését (sorozatok, volumen)
+
+        Az oldal bejelentkezésenként egyszer épül fel (build_training_page),
+        ismételt megjelenítéskor csak a napok és a gyakorlatok töltődnek újra.
+        """
+        self.app.show_screen("training", self.build_training_page, self.refresh_training_page)
+
+    def build_training_page(self, screen):
         """
-        self.app.clear_screen()
-        self.app.load_navigation_bar()
+        Az edzésterv oldal widgetjeinek létrehozása a képernyő keretében.
 
-        button_container = ttk.Frame(self.app.root)
+        Args:
+            screen: A ScreenManager által létrehozott keret
+        """
+        button_container = ttk.Frame(screen)
         button_container.place(relx=0.5, rely=0.20, anchor="center", relwidth=0.8)
 
         self.day_selector_frame = ttk.Frame(button_container)
@@ -37,29 +56,9 @@ class TrainingManager:
                                          takefocus=False)
         self.delete_day_btn.pack(pady=10, side="right")
 
-        self.app.db_cursor.execute("""SELECT day_name FROM training_days WHERE user_id = ?""",
-                                  (self.app.user_id,))
-        days = [row[0] for row in self.app.db_cursor.fetchall()]
-        
-        days.append("+ Új nap")
-
         self.day_buttons = []
-        first_day = None if not days or days[0] == "+ Új nap" else days[0]
 
-        for day in days:
-            initial_style = "darkbutton.TButton" if day == "+ Új nap" else (
-                "selected.TButton" if day == first_day else "words.TButton")
-            
-            btn = ttk.Button(self.day_selector_frame,
-                             text=day,
-                             style=initial_style,
-                             command=lambda d=day: self.select_training_day(d) if d != "+ Új nap" else self.add_new_day(),
-                             cursor="hand2",
-                             takefocus=False)
-            btn.pack(side="left", padx=10, pady=10)
-            self.day_buttons.append(btn)
-
-        self.training_frame = ttk.Frame(self.app.root,
+        self.training_frame = ttk.Frame(screen,
                                         style="Frameborder.TFrame")
         self.training_frame.place(relx=0.5, rely=0.55, anchor="center", relwidth=0.8, relheight=0.6)
 
@@ -88,7 +87,7 @@ class TrainingManager:
         
         self.training_table.pack(fill="both", expand=True)
 
-        button_frame = ttk.Frame(self.app.root)
+        button_frame = ttk.Frame(screen)
         button_frame.place(relx=0.09, rely=0.87)
 
         ttk.Button(button_frame, 
@@ -105,11 +104,72 @@ class TrainingManager:
                    cursor="hand2",
                    takefocus=False).grid(row=0, column=1, padx=20)
 
-        if first_day:
-            self.current_day = first_day
-            self.load_training_plan(first_day)
+        ttk.Button(button_frame,
+                   text="Sorozat naplózása",
+                   style="darkbutton.TButton",
+                   command=self.log_set,
+                   cursor="hand2",
+                   takefocus=False).grid(row=0, column=2, padx=20)
+
+        volume_frame = ttk.Frame(screen,
+                                 style="Frameborder.TFrame")
+        volume_frame.place(relx=0.9, rely=0.865, anchor="ne", relwidth=0.42, relheight=0.12)
+
+        volume_columns = ("Izomcsoport", "Gyakorlat", "Sorozat", "Heti volumen (kg)")
+
+        self.volume_table = ttk.Treeview(volume_frame,
+                                         columns=volume_columns,
+                                         show="headings",
+                                         style="Custom.Treeview")
+        for col in volume_columns:
+            self.volume_table.heading(col, text=col, anchor="center")
+            self.volume_table.column(col, anchor="center", width=100)
+        self.volume_table.pack(fill="both", expand=True, padx=2, pady=2)
+        self.volume_table['selectmode'] = 'none'
+
+    def refresh_training_page(self):
+        """
+        Napválasztó gombok és a kiválasztott nap gyakorlatainak frissítése.
+
+        Ha a korábban kiválasztott nap még létezik, az marad kiválasztva,
+        különben az első nap (ha van).
+        """
+        days = self.app.training_days.names(self.app.user_id)
+        selected_day = self.current_day if self.current_day in days else (days[0] if days else None)
+
+        self.create_day_buttons(days, selected_day)
+
+        self.current_day = selected_day
+        if selected_day:
+            self.load_training_plan(selected_day)
         else:
-            self.current_day = None
+            virtual_table(self.training_table).clear()
+        self.schedule_volume_summary()
+
+    def create_day_buttons(self, days, selected_day=None):
+        """
+        Napválasztó gombok (újra)létrehozása, a végén az "+ Új nap" gombbal.
+
+        Args:
+            days: A napok nevei a megjelenítés sorrendjében
+            selected_day: A kiemelt nap neve
+        """
+        for btn in self.day_buttons:
+            btn.destroy()
+        self.day_buttons.clear()
+
+        for day in days + ["+ Új nap"]:
+            initial_style = "darkbutton.TButton" if day == "+ Új nap" else (
+                "selected.TButton" if day == selected_day else "words.TButton")
+            
+            btn = ttk.Button(self.day_selector_frame,
+                             text=day,
+                             style=initial_style,
+                             command=lambda d=day: self.select_training_day(d) if d != "+ Új nap" else self.add_new_day(),
+                             cursor="hand2",
+                             takefocus=False)
+            btn.pack(side="left", padx=10, pady=10)
+            self.day_buttons.append(btn)
 
     def add_new_day(self):
         """
@@ -123,25 +183,24 @@ class TrainingManager:
         
         Az új nap elmentődik az adatbázisba.
         """
-        MAX_DAYS = 7
-        MAX_CHAR_LENGTH = 10
-        
         current_days = len([btn for btn in self.day_buttons if btn['text'] != "+ Új nap"])
         
-        if current_days >= MAX_DAYS:
+        if current_days >= self.MAX_DAYS:
             self.app.custom_messagebox("Hiba", "Maximum 7 napot lehet létrehozni!")
             return
 
-        popup = ttk.Toplevel()
-        popup.title("Új nap hozzáadása")
-        popup.geometry("400x200")
-        
-        popup.update_idletasks()
-        width = popup.winfo_width()
-        height = popup.winfo_height()
-        x = (popup.winfo_screenwidth() // 2) - (width // 2)
-        y = (popup.winfo_screenheight() // 2) - (height // 2)
-        popup.geometry(f"{width}x{height}+{x}+{y}")
+        dialog = self.app.dialogs.get("add_day", "Új nap hozzáadása", 400, 200, self.build_day_dialog)
+        dialog.show()
+
+    def build_day_dialog(self, dialog):
+        """
+        Az új nap ablak widgetjeinek létrehozása.
+
+        Args:
+            dialog: A DialogPool által létrehozott Dialog
+        """
+        MAX_CHAR_LENGTH = self.MAX_CHAR_LENGTH
+        popup = dialog.window
 
         ttk.Label(popup, text=f"Nap neve (max {MAX_CHAR_LENGTH} karakter):", 
                  font=("Colibri", 12), style="Custom.TLabel").pack(pady=(20,5))
@@ -168,44 +227,15 @@ class TrainingManager:
                 self.app.custom_messagebox("Hiba", f"A nap neve nem lehet hosszabb {MAX_CHAR_LENGTH} karakternél!")
                 return
 
-            self.app.db_cursor.execute("""SELECT day_name FROM training_days WHERE user_id = ? AND day_name = ?""",
-                                      (self.app.user_id, day_name))
-
-            if self.app.db_cursor.fetchone():
+            if self.app.training_days.find_id(self.app.user_id, day_name) is not None:
                 self.app.custom_messagebox("Hiba", "Már létezik ilyen nevű nap!")
                 return
 
-            try:
-                self.app.db_cursor.execute("""
-                    INSERT INTO training_days (user_id, day_name)
-                    VALUES (?, ?)
-                """, (self.app.user_id, day_name))
-                self.app.db_connection.commit()
-            except sqlite3.Error:
-                self.app.custom_messagebox("Hiba", "Nem sikerült menteni az új napot!")
-                return
-
-            for btn in self.day_buttons:
-                btn.destroy()
-            self.day_buttons.clear()
-
-            self.app.db_cursor.execute("""SELECT day_name FROM training_days WHERE user_id = ? ORDER BY day_name""",
-                                      (self.app.user_id,))
-            days = [row[0] for row in self.app.db_cursor.fetchall()]
-            days.append("+ Új nap")
-
-            for day in days:
-                btn = ttk.Button(self.day_selector_frame,
-                                 text=day,
-                                 style="words.TButton" if day != "+ Új nap" else "darkbutton.TButton",
-                                 command=lambda d=day: self.select_training_day(d) if d != "+ Új nap" else self.add_new_day(),
-                                 cursor="hand2",
-                                 takefocus=False)
-                btn.pack(side="left", padx=10, pady=10)
-                self.day_buttons.append(btn)
-            
-            popup.destroy()
-            self.select_training_day(day_name)
+            dialog.hide()
+            self.app.db_worker.submit(
+                self.app.training_days.add, self.app.user_id, day_name,
+                callback=lambda _: self.show_new_day(day_name),
+                error_callback=lambda e: self.app.custom_messagebox("Hiba", "Nem sikerült menteni az új napot!"))
 
         ttk.Button(popup,
                    text="Mentés",
@@ -214,6 +244,21 @@ class TrainingManager:
                    cursor="hand2",
                    takefocus=False).pack(pady=20)
 
+        def reset():
+            day_input.delete(0, "end")
+            day_input.focus_set()
+
+        dialog.on_reset = reset
+
+    def show_new_day(self, day_name):
+        """
+        Napválasztó gombok újraépítése egy új nap mentése után,
+        majd az új nap kiválasztása.
+        """
+        self.create_day_buttons(sorted(self.app.training_days.names(self.app.user_id)))
+
+        self.select_training_day(day_name)
+
     def select_training_day(self, day):
         """
         Edzésnap kiválasztása.
@@ -234,10 +279,6 @@ class TrainingManager:
                 break
 
         self.current_day = day
-        self.app.db_cursor.execute(
-            "SELECT id FROM training_days WHERE user_id = ? AND day_name = ?",
-            (self.app.user_id, day))
-        
         self.load_training_plan(day)
 
     def add_exercise(self):
@@ -251,19 +292,18 @@ class TrainingManager:
             self.app.custom_messagebox("Hiba", "Kérlek, először válassz vagy hozz létre egy napot!")
             return
 
-        popup = ttk.Toplevel()
-        popup.title("Gyakorlat hozzáadása")
-        popup.geometry("800x500")
-        
-        popup.update_idletasks()
-        width = popup.winfo_width()
-        height = popup.winfo_height()
-        x = (popup.winfo_screenwidth() // 2) - (width // 2)
-        y = (popup.winfo_screenheight() // 2) - (height // 2)
-        popup.geometry(f"{width}x{height}+{x}+{y}")
-        
-        muscle_groups = ['bicepsz', 'comb', 'has', 'hát', 'kardió', 'mell', 
-                        'far', 'tricepsz', 'vádli', 'váll']
+        dialog = self.app.dialogs.get("add_exercise", "Gyakorlat hozzáadása", 800, 500, self.build_exercise_dialog)
+        dialog.show()
+
+    def build_exercise_dialog(self, dialog):
+        """
+        A gyakorlat hozzáadása ablak widgetjeinek létrehozása.
+
+        Args:
+            dialog: A DialogPool által létrehozott Dialog
+        """
+        popup = dialog.window
+        muscle_groups = list(MUSCLE_GROUPS)
 
         ttk.Label(popup,
                   text="Izomcsoport:",
@@ -366,25 +406,14 @@ class TrainingManager:
         weight_input.grid(row=0, column=5, padx=5)
 
         def update_exercises(*args):
-            selected_group = muscle_group_var.get()
-            self.app.db_cursor.execute(f"""
-                SELECT [Gyakorlat neve], [Szükséges eszközök], [Nehézségi szint] 
-                FROM {selected_group}
-            """)
-            exercises = self.app.db_cursor.fetchall()
-            exercise_combo['values'] = [f"{ex[0]} | {ex[1]} | {ex[2]}" for ex in exercises]
+            exercise_combo['values'] = self.app.exercise_catalog.labels(muscle_group_var.get())
         
         def update_info(*args):
             if not exercise_var.get():
                 return
             exercise_name = exercise_var.get().split(" | ")[0]
             selected_group = muscle_group_var.get()
-            self.app.db_cursor.execute(f"""
-                SELECT [Szükséges eszközök], [Nehézségi szint], Leírás 
-                FROM {selected_group} 
-                WHERE [Gyakorlat neve] = ?
-            """, (exercise_name,))
-            info = self.app.db_cursor.fetchone()
+            info = self.app.exercise_catalog.info(selected_group, exercise_name)
             if info:
                 equipment_label.config(text=f"Kellékek: {info[0]}")
                 difficulty_label.config(text=f"Nehézség: {info[1]}")
@@ -410,50 +439,43 @@ class TrainingManager:
             selected_group = muscle_group_var.get()
             
             try:
-                self.app.db_cursor.execute(f"""
-                    SELECT [Szükséges eszközök], [Nehézségi szint], [Leírás]
-                    FROM "{selected_group}" 
-                    WHERE [Gyakorlat neve] = ?
-                """, (exercise_name,))
-                
-                info = self.app.db_cursor.fetchone()
+                info = self.app.exercise_catalog.info(selected_group, exercise_name)
                 if not info:
                     self.app.custom_messagebox("Hiba", "A gyakorlat nem található az adatbázisban!")
                     return
 
-                self.app.db_cursor.execute("""
-                    SELECT id FROM training_days 
-                    WHERE user_id = ? AND day_name = ?
-                """, (self.app.user_id, self.current_day))
-                
-                day_result = self.app.db_cursor.fetchone()
-                if not day_result:
+                day_id = self.app.training_days.find_id(self.app.user_id, self.current_day)
+                if day_id is None:
                     self.app.custom_messagebox("Hiba", "A kiválasztott nap nem található!")
                     return
-                    
-                day_id = day_result[0]
 
                 sets_to_insert = sets if sets is not None else ""
                 reps_to_insert = reps if reps is not None else ""
                 weight_to_insert = weight if weight is not None else ""
 
-                self.app.db_cursor.execute("""
-                    INSERT INTO exercises (
-                        day_id, exercise_name, sets, reps, weight, 
-                        equipment, difficulty, description
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (day_id, exercise_name, sets_to_insert, reps_to_insert, weight_to_insert,
-                      info[0], info[1], info[2]))
-                
-                self.app.db_connection.commit()
-                self.load_training_plan(self.current_day)
-                popup.destroy()
-                
             except sqlite3.Error as e:
                 self.app.custom_messagebox("Hiba", f"Adatbázis hiba történt: {str(e)}")
                 return
 
+            self.training_table.insert("", "end", iid=pending_iid(), values=(exercise_name, sets_to_insert, reps_to_insert,
+                                                          weight_to_insert, info[0], info[1], info[2]))
+            current_day = self.current_day
+
+            def saved(_):
+                self.schedule_training_plan(current_day)
+                self.schedule_volume_summary()
+
+            def undo_insert(error):
+                self.schedule_training_plan(current_day)
+                self.app.custom_messagebox("Hiba", f"Adatbázis hiba történt: {str(error)}")
+
+            self.app.db_worker.submit(self.app.exercises.add,
+                                      day_id, exercise_name, sets_to_insert, reps_to_insert, weight_to_insert,
+                                      info[0], info[1], info[2], selected_group,
+                                      callback=saved,
+                                      error_callback=undo_insert)
+            dialog.hide()
+
         ttk.Button(popup,
                    text="Hozzáadás",
                    style="darkbutton.TButton", 
@@ -461,36 +483,213 @@ class TrainingManager:
                    cursor="hand2",
                    takefocus=False).pack(pady=20)
 
+        def reset():
+            muscle_group_var.set("")
+            exercise_var.set("")
+            exercise_combo['values'] = []
+            for label in (equipment_label, difficulty_label, description_label):
+                label.config(text="")
+            for entry in (sets_input, reps_input, weight_input):
+                entry.delete(0, "end")
+
+        dialog.on_reset = reset
+
     def delete_exercise(self):
         """
-        Kiválasztott gyakorlat törlése.
+        Kiválasztott gyakorlatok törlése.
         
         Ellenőrzi, hogy van-e kiválasztott gyakorlat,
-        majd törli azt az adatbázisból és a táblázatból.
-        Megerősítő üzenetet jelenít meg sikeres törlés esetén.
+        majd az összes kijelölt gyakorlatot egy tranzakcióban
+        törli az adatbázisból, és eltávolítja őket a táblázatból.
+        A sorok azonosítója a gyakorlat azonosítója, így a törlés pontosan
+        a kijelölt sorokat érinti (azonos értékű sorok közül is csak azt).
+        A még mentés alatt álló sorok (ideiglenes azonosító) nem törölhetők,
+        amíg a mentés vissza nem igazolódik.
         """
         selected_items = self.training_table.selection()
         if not selected_items:
             self.app.custom_messagebox("Hiba", "Kérlek, válassz ki egy gyakorlatot a törléshez!")
             return
-        
-        for selected_item in selected_items:
-            values = self.training_table.item(selected_item)['values']
-            
-            self.app.db_cursor.execute("""SELECT id FROM training_days WHERE user_id = ? AND day_name = ?""",
-                                      (self.app.user_id, self.current_day))
-            day_id_result = self.app.db_cursor.fetchone()
-            
-            if not day_id_result:
-                self.app.custom_messagebox("Hiba", "Nem található a kiválasztott nap!")
+        if any(is_pending(item) for item in selected_items):
+            self.app.custom_messagebox("Hiba", "A gyakorlat mentése még folyamatban van, kérlek, próbáld újra!")
+            return
+
+        current_day = self.current_day
+
+        def undo_delete(error):
+            self.schedule_training_plan(current_day)
+            self.app.custom_messagebox("Hiba", f"Adatbázis hiba történt: {str(error)}")
+
+        self.app.db_worker.submit(self.app.exercises.delete_many, list(selected_items),
+                                  callback=lambda _: self.schedule_volume_summary(),
+                                  error_callback=undo_delete)
+
+        self.training_table.delete(*selected_items)
+
+    def log_set(self):
+        """
+        Elvégzett sorozat naplózása a kijelölt gyakorlathoz.
+
+        Az ablak az ismétlést és a súlyt a gyakorlat legutóbb naplózott
+        sorozatából (ennek hiányában a tervből) tölti ki, és mentés után
+        nyitva marad, így edzés közben sorozatonként egy kattintás a naplózás.
+        """
+        selected_items = self.training_table.selection()
+        if len(selected_items) != 1:
+            self.app.custom_messagebox("Hiba", "Kérlek, válassz ki egy gyakorlatot a naplózáshoz!")
+            return
+
+        values = self.training_table.item(selected_items[0])['values']
+        exercise_name, planned_reps, planned_weight = str(values[0]), values[2], values[3]
+        last_set = self.app.workout_sets.last_set(self.app.user_id, exercise_name)
+        if last_set:
+            planned_reps, planned_weight = last_set
+
+        dialog = self.app.dialogs.get("log_set", "Sorozat naplózása", 700, 460, self.build_log_dialog)
+        dialog.show(exercise_name, planned_reps, planned_weight)
+
+    def build_log_dialog(self, dialog):
+        """
+        A sorozat naplózása ablak widgetjeinek létrehozása.
+
+        Args:
+            dialog: A DialogPool által létrehozott Dialog
+        """
+        popup = dialog.window
+        state = {"exercise": None}
+
+        exercise_label = ttk.Label(popup,
+                                   text="",
+                                   font=("Colibri", 15),
+                                   style="Custom.TLabel")
+        exercise_label.pack(pady=(20, 10))
+
+        input_frame = ttk.Frame(popup)
+        input_frame.pack(pady=10)
+
+        def validate_number(P):
+            return P == "" or (P.isdigit() and int(P) <= 99999)
+
+        def validate_decimal(P):
+            if P == "":
+                return True
+            try:
+                return float(P) <= 99999
+            except ValueError:
+                return False
+
+        ttk.Label(input_frame, text="Ismétlés:", font=("Colibri", 12), style="Custom.TLabel").grid(row=0, column=0, padx=5)
+        reps_input = ttk.Spinbox(input_frame,
+                                 to=99999,
+                                 font=("Colibri", 12),
+                                 bootstyle="warning",
+                                 width=10,
+                                 validate="key",
+                                 validatecommand=(popup.register(validate_number), '%P'))
+        reps_input.grid(row=0, column=1, padx=5)
+
+        ttk.Label(input_frame, text="Súly (kg):", font=("Colibri", 12), style="Custom.TLabel").grid(row=0, column=2, padx=5)
+        weight_input = ttk.Entry(input_frame,
+                                 font=("Colibri", 12),
+                                 bootstyle="warning",
+                                 width=10,
+                                 validate="key",
+                                 validatecommand=(popup.register(validate_decimal), '%P'))
+        weight_input.grid(row=0, column=3, padx=5)
+
+        history_frame = ttk.Frame(popup, style="Frameborder.TFrame")
+        history_frame.pack(fill="both", expand=True, padx=20, pady=(10, 20))
+
+        history_columns = ("Dátum", "Sorozat", "Ismétlés", "Max. súly (kg)", "Volumen (kg)")
+        history_table = ttk.Treeview(history_frame,
+                                     columns=history_columns,
+                                     show="headings",
+                                     style="Custom.Treeview",
+                                     height=10)
+        for col in history_columns:
+            history_table.heading(col, text=col, anchor="center")
+            history_table.column(col, anchor="center", width=110)
+        history_table.pack(fill="both", expand=True, padx=2, pady=2)
+        history_table['selectmode'] = 'none'
+
+        def load_history():
+            sessions = self.app.workout_sets.recent_sessions(self.app.user_id, state["exercise"])
+            sync_rows(history_table, [(day, (day, sets, reps, f"{weight:g}", f"{volume:,.0f}".replace(",", " ")))
+                                      for day, sets, reps, weight, volume in sessions])
+
+        def save_set():
+            if not reps_input.get().isdigit() or int(reps_input.get()) <= 0:
+                self.app.custom_messagebox("Hiányzó adatok", "Kérlek, adj meg egy érvényes ismétlésszámot!")
                 return
-            day_id = day_id_result[0]
+            reps = int(reps_input.get())
+            weight = float(weight_input.get()) if weight_input.get() else 0.0
 
-            self.app.db_cursor.execute("""DELETE FROM exercises WHERE day_id = ? AND exercise_name = ? AND sets = ? AND reps = ? AND weight = ?""",
-                                      (day_id, values[0], values[1], values[2], values[3]))
-            self.app.db_connection.commit()
-            
-            self.training_table.delete(selected_item)
+            def failed(error):
+                self.app.custom_messagebox("Hiba", f"Adatbázis hiba történt: {str(error)}")
+
+            self.app.db_worker.submit(self.app.workout_sets.add,
+                                      self.app.user_id, state["exercise"], reps, weight, time.time(),
+                                      callback=lambda _: self.app.scheduler.schedule("workout_history", load_history),
+                                      error_callback=failed)
+
+        button_frame = ttk.Frame(popup)
+        button_frame.pack(before=history_frame, pady=10)
+
+        ttk.Button(button_frame,
+                   text="Sorozat mentése",
+                   style="darkbutton.TButton",
+                   command=save_set,
+                   cursor="hand2",
+                   takefocus=False).pack(side="left", padx=10)
+
+        ttk.Button(button_frame,
+                   text="Bezárás",
+                   style="darkbutton.TButton",
+                   command=dialog.hide,
+                   cursor="hand2",
+                   takefocus=False).pack(side="left", padx=10)
+
+        def reset(exercise_name, reps, weight):
+            state["exercise"] = exercise_name
+            exercise_label.configure(text=exercise_name)
+            reps_input.delete(0, "end")
+            reps_input.insert(0, "" if reps in (None, "") else str(reps))
+            weight_input.delete(0, "end")
+            weight_input.insert(0, "" if weight in (None, "") else f"{float(weight):g}")
+            load_history()
+
+        dialog.on_reset = reset
+
+    def schedule_training_plan(self, day):
+        """
+        A nap gyakorlatainak újratöltése a következő üresjáratban, ha addig
+        is az a nap marad kiválasztva. Több egymás utáni mentés egy
+        újratöltéssé vonódik össze.
+        """
+        def reload():
+            if self.current_day == day:
+                self.load_training_plan(day)
+
+        self.app.scheduler.schedule("training_plan", reload)
+
+    def schedule_volume_summary(self):
+        """Az izomcsoportonkénti összesítés újratöltésének ütemezése (a sorozatos kérések egyesülnek)."""
+        self.app.scheduler.schedule("training_volume", self.load_volume_summary)
+
+    def load_volume_summary(self):
+        """
+        A heti terv összesítése izomcsoportonként: gyakorlatok és sorozatok
+        száma, valamint a volumen (sorozat × ismétlés × súly).
+
+        Az adatok a triggerekkel karbantartott training_volume táblából
+        jönnek (izomcsoportonként egy sor), így a terv méretétől függetlenül
+        azonnal megjelennek.
+        """
+        rows = []
+        for muscle_group, exercises, sets, volume in self.app.exercises.volume_by_group(self.app.user_id):
+            name = muscle_group or "egyéb"
+            rows.append((name, (name, exercises, sets, f"{volume:,.0f}".replace(",", " "))))
+        sync_rows(self.volume_table, rows)
 
     def load_training_plan(self, day):
         """
@@ -501,24 +700,18 @@ class TrainingManager:
         
         Betölti az adatbázisból a naphoz tartozó gyakorlatokat
         és megjeleníti őket a táblázatban a részletes információkkal együtt.
+        A táblázat lapozva töltődik (VirtualTable), a sorok a gyakorlat
+        azonosítójával szerepelnek, így újratöltéskor csak a megváltozott
+        sorok íródnak át.
         """
-        for item in self.training_table.get_children():
-            self.training_table.delete(item)
-        
-        self.app.db_cursor.execute("""SELECT id FROM training_days WHERE user_id = ? AND day_name = ?""",
-                                  (self.app.user_id, day))
-        
-        result = self.app.db_cursor.fetchone()
-        if result is None:
+        day_id = self.app.training_days.find_id(self.app.user_id, day)
+        if day_id is None:
+            virtual_table(self.training_table).clear()
             return
         
-        day_id = result[0]
-        
-        self.app.db_cursor.execute("""SELECT exercise_name, sets, reps, weight, equipment, difficulty, description FROM exercises WHERE day_id = ?""",
-            (day_id,))
-        
-        for row in self.app.db_cursor.fetchall():
-            self.training_table.insert("", "end", values=row)
+        virtual_table(self.training_table).load(
+            day_id,
+            lambda after_id, before_id, limit: self.app.exercises.for_day_page(day_id, after_id, before_id, limit))
 
     def delete_current_day(self):
         """
@@ -536,34 +729,31 @@ class TrainingManager:
             self.app.custom_messagebox("Hiba", "Nincs kiválasztott nap!")
             return
 
-        confirm_window = ttk.Toplevel(self.app.root)
-        confirm_window.title("Megerősítés")
-        screen_width = self.app.root.winfo_screenwidth()
-        screen_height = self.app.root.winfo_screenheight()
-        window_width = 600
-        window_height = 200
-        position_right = int(screen_width / 2 - window_width / 2)
-        position_down = int(screen_height / 2 - window_height / 2)
-        confirm_window.geometry(f"{window_width}x{window_height}+{position_right}+{position_down}")
-        confirm_window.grab_set()
-
-        ttk.Label(confirm_window, 
-                 text=f"Biztosan törölni szeretnéd a(z) {self.current_day} napot?",
-                 font=("Colibri", 15),
-                 bootstyle="secondary").pack(pady=50)
+        dialog = self.app.dialogs.get("delete_day", "Megerősítés", 600, 200, self.build_delete_day_dialog, modal=True)
+        dialog.show(self.current_day)
+
+    def build_delete_day_dialog(self, dialog):
+        """
+        A nap törlését megerősítő ablak widgetjeinek létrehozása.
+
+        Args:
+            dialog: A DialogPool által létrehozott Dialog
+        """
+        confirm_window = dialog.window
+
+        question_label = ttk.Label(confirm_window, 
+                                   text="",
+                                   font=("Colibri", 15),
+                                   bootstyle="secondary")
+        question_label.pack(pady=50)
 
         button_frame = ttk.Frame(confirm_window)
         button_frame.pack(pady=10)
 
         def confirm_delete():
-            self.app.db_cursor.execute("""SELECT id FROM training_days WHERE user_id = ? AND day_name = ?""",
-                                      (self.app.user_id, self.current_day))
-            day_id = self.app.db_cursor.fetchone()[0]
-
-            self.app.db_cursor.execute("DELETE FROM exercises WHERE day_id = ?", (day_id,))
-            
-            self.app.db_cursor.execute("DELETE FROM training_days WHERE id = ?", (day_id,))
-            self.app.db_connection.commit()
+            day_id = self.app.training_days.find_id(self.app.user_id, self.current_day)
+            self.app.db_worker.submit(self.app.training_days.delete, day_id,
+                                      callback=lambda _: self.schedule_volume_summary())
 
             for btn in self.day_buttons:
                 if btn['text'] == self.current_day:
@@ -571,11 +761,10 @@ class TrainingManager:
                     self.day_buttons.remove(btn)
                     break
 
-            for item in self.training_table.get_children():
-                self.training_table.delete(item)
+            virtual_table(self.training_table).clear()
 
             self.current_day = None
-            confirm_window.destroy()
+            dialog.hide()
             self.app.custom_messagebox("Sikeres törlés", "A nap sikeresen törölve!")
 
         ttk.Button(button_frame,
@@ -590,4 +779,9 @@ class TrainingManager:
                    style="lightbutton.TButton",
                    cursor="hand2",
                    takefocus=False,
-                   command=confirm_window.destroy).pack(side="right", padx=10)
\ No newline at end of file
+                   command=dialog.hide).pack(side="right", padx=10)
+
+        def reset(day_name):
+            question_label.configure(text=f"Biztosan törölni szeretnéd a(z) {day_name} napot?")
+
+        dialog.on_reset = reset
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Kalória trend grafikon
+----------------------
+Az étrend oldal grafikonja: a kiválasztott napig tartó 30 nap kalória
+összegei oszlopokban (a kereten felüliek kiemelve), a 7 napos mozgó
+átlag vonala és a napi keret (TDEE) szaggatott vonala, felette a trendek
+összefoglalója. A képpont koordinátákat a MealTrends.plot() számolja
+vektorosan, itt csak a Canvas elemek jönnek létre.
+"""
+
+BAR_COLOR = "#8b87dc"
+OVER_COLOR = "#ff4e1a"
+LINE_COLOR = "white"
+TARGET_COLOR = "#ff4e1a"
+
+
+def summary_text(summary):
+    """Returns: A TrendSummary egy soros szövege"""
+    if not summary.logged_days:
+        return "Még nincs naplózott nap."
+    parts = [f"7 napos átlag: {summary.average_7} kcal"]
+    if summary.balance_30 is not None:
+        parts.append(f"egyenleg (30 nap): {summary.balance_30:+d} kcal/nap")
+    if summary.current_streak is not None:
+        parts.append(f"keret alatt: {summary.current_streak} nap (max. {summary.longest_streak})")
+    return " | ".join(parts)
+
+
+class TrendChart:
+    """
+    A trendek kirajzolása egy Canvas-ra és egy összefoglaló címkére.
+    """
+
+    def __init__(self, canvas, label):
+        """
+        Args:
+            canvas: ttk.Canvas, amire a grafikon kerül
+            label: ttk.Label az összefoglalóhoz
+        """
+        self.canvas = canvas
+        self.label = label
+
+    def draw(self, trends, last, tdee=None):
+        """
+        A grafikon újrarajzolása.
+
+        Érvénytelen dátumnál, vagy amíg a Canvas még nem kapott méretet,
+        a grafikon üres marad.
+
+        Args:
+            trends: MealTrends
+            last: A grafikon utolsó napja ("YYYY-MM-DD")
+            tdee: Napi kalória keret
+        """
+        self.canvas.delete("all")
+        self.label.configure(text=summary_text(trends.summary(tdee)))
+
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            return
+        try:
+            geometry = trends.plot(last, width, height, tdee)
+        except ValueError:
+            return
+
+        for bar, over in zip(geometry.bars, geometry.over):
+            self.canvas.create_rectangle(*bar, fill=OVER_COLOR if over else BAR_COLOR, width=0)
+        if len(geometry.line) >= 4:
+            self.canvas.create_line(*geometry.line, fill=LINE_COLOR, width=2)
+        if geometry.target is not None:
+            self.canvas.create_line(0, geometry.target, width, geometry.target,
+                                    fill=TARGET_COLOR, dash=(4, 2))
@@ -54,7 +54,7 @@ class UserManager:
         ttk.Button(udv,
                    text="Bezárás",
                    style="lightbutton.TButton",
-                   command=self.app.root.quit,
+                   command=self.app.quit,
                    width=15,
                    cursor="hand2",
                    takefocus=False).grid(row=1, column=1, padx=(15, 30), pady=(35, 35), sticky="snew"),
@@ -161,10 +161,7 @@ class UserManager:
             self.app.custom_messagebox("Hibás jelszó", "A jelszavak nem egyeznek!")
             return
 
-        self.app.db_cursor.execute('SELECT email FROM users WHERE email = ?', (email,))
-        existing_email = self.app.db_cursor.fetchone()
-        
-        if existing_email:
+        if self.app.users.email_exists(email):
             self.app.custom_messagebox("Hiba", "Ez az email cím már regisztrálva van!")
             return
 
@@ -249,7 +246,8 @@ class UserManager:
         - nem
         - aktivitási szint
         
-        Sikeres mentés esetén átirányít a bejelentkező oldalra.
+        A mentés az adatbázis háttérszálán fut, sikeres mentés esetén
+        átirányít a bejelentkező oldalra.
         """
         eletkor = self.eletkor_input.get()
         magassag = self.magassag_input.get()
@@ -261,16 +259,11 @@ class UserManager:
             self.app.custom_messagebox("Hiányzó adatok", "Kérlek, töltsd ki az összes mezőt!")
             return
 
-        try:
-            self.app.db_cursor.execute('''
-                INSERT INTO users (vezeteknev, keresztnev, email, jelszo, eletkor, magassag, testsuly, nem, aktivitas)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (self.vezeteknev, self.keresztnev, self.email, self.jelszo, eletkor, magassag, testsuly, nem, aktivitas))
-            self.app.db_connection.commit()
-            self.app.custom_messagebox("Sikeres regisztráció", "A regisztráció sikeres volt!", login=True)
-
-        except Exception as e:
-            self.app.custom_messagebox("Hiba", f"Hiba történt: {e}")
+        self.app.db_worker.submit(
+            self.app.users.add,
+            self.vezeteknev, self.keresztnev, self.email, self.jelszo, eletkor, magassag, testsuly, nem, aktivitas,
+            callback=lambda user_id: self.app.custom_messagebox("Sikeres regisztráció", "A regisztráció sikeres volt!", login=True),
+            error_callback=lambda e: self.app.custom_messagebox("Hiba", f"Hiba történt: {e}"))
 
 
     # BEJELENTKEZÉS ----------------------
@@ -320,8 +313,7 @@ class UserManager:
         email = self.email_input_login.get()
         jelszo = self.jelszo_input_login.get()
 
-        self.app.db_cursor.execute('SELECT * FROM users WHERE email = ? AND jelszo = ?', (email, jelszo))
-        user = self.app.db_cursor.fetchone()
+        user = self.app.users.find_by_credentials(email, jelszo)
 
         if user:
             self.app.logged_in_user = email
@@ -340,156 +332,163 @@ class UserManager:
         - Aktivitási szint
         
         Lehetőséget ad az adatok módosítására és mentésére.
-        """
-        self.app.clear_screen()
-        self.app.load_navigation_bar()
-
-        self.app.db_cursor.execute(
-            'SELECT vezeteknev, keresztnev, email, eletkor, magassag, testsuly, nem, aktivitas FROM users WHERE email = ?', 
-            (self.app.logged_in_user,)
-            )
-        user_data = self.app.db_cursor.fetchone()
 
-        if user_data:
-            vezeteknev, keresztnev, email, eletkor, magassag, testsuly, nem, aktivitas = user_data
-
-            user_info_frame = ttk.Labelframe(
-                self.app.root,
-                labelwidget=ttk.Label(self.app.root,
-                                      text="Felhasználói adatok",
-                                      font=("Colibri", 20),
-                                      style="Custom.TLabelframe.Label"),
-                                      bootstyle="light")
-            user_info_frame.place(relx=0.5, rely=0.5, anchor="center")
-            
-            fields = {"Vezetéknév": vezeteknev,
-                      "Keresztnév": keresztnev,
-                      "Életkor": eletkor,
-                      "Magasság (cm)": magassag,
-                      "Testsúly (kg)": testsuly,}
+        Az oldal bejelentkezésenként egyszer épül fel (build_profile_page),
+        ismételt megjelenítéskor csak az adatok töltődnek újra (refresh_profile_page).
+        """
+        self.app.show_screen("profile", self.build_profile_page, self.refresh_profile_page)
 
-            original_data = fields.copy()
-            original_data["Aktivitás"] = aktivitas
+    def build_profile_page(self, screen):
+        """
+        A profil oldal widgetjeinek létrehozása a képernyő keretében.
+        A mezők értékeit a refresh_profile_page tölti ki.
 
-            self.entries = {}
-            self.activity_combobox = None
+        Args:
+            screen: A ScreenManager által létrehozott keret
+        """
+        user_info_frame = ttk.Labelframe(
+            screen,
+            labelwidget=ttk.Label(screen,
+                                  text="Felhasználói adatok",
+                                  font=("Colibri", 20),
+                                  style="Custom.TLabelframe.Label"),
+                                  bootstyle="light")
+        user_info_frame.place(relx=0.5, rely=0.5, anchor="center")
 
-            for idx, (label_text, default_value) in enumerate(fields.items()):
-                ttk.Label(user_info_frame,
-                          text=label_text,
-                          font=("Colibri", 14)).grid(row=idx, column=0, padx=20, pady=10, sticky="w")
+        fields = ["Vezetéknév", "Keresztnév", "Életkor", "Magasság (cm)", "Testsúly (kg)"]
 
-                entry_var = ttk.StringVar(value=default_value)
-                entry = ttk.Entry(user_info_frame,
-                                  font=("Colibri", 14),
-                                  width=20,
-                                  textvariable=entry_var,
-                                  state='readonly')
-                entry.grid(row=idx, column=1, padx=20, pady=10, sticky="we")
+        original_data = {}
 
-                self.entries[label_text] = (entry, entry_var)
+        self.entries = {}
+        self.activity_combobox = None
 
+        for idx, label_text in enumerate(fields):
             ttk.Label(user_info_frame,
-                      text="Aktivitás",
-                      font=("Colibri", 14)).grid(row=len(fields) + 1, column=0, padx=20, pady=10, sticky="w")
-
-            activity_var = ttk.StringVar(value=aktivitas)
-            activity_entry = ttk.Entry(user_info_frame,
-                                       font=("Colibri", 14),
-                                       width=20,
-                                       textvariable=activity_var,
-                                       state='readonly')
-            activity_entry.grid(row=len(fields) + 1, column=1, padx=20, pady=10, sticky="we")
-            self.entries["Aktivitás"] = (activity_entry, activity_var)
-
-            def enable_editing():
-                for entry, _ in self.entries.values():
-                    entry.config(state='normal')
-                activity_entry.grid_forget()
-
+                      text=label_text,
+                      font=("Colibri", 14)).grid(row=idx, column=0, padx=20, pady=10, sticky="w")
+
+            entry_var = ttk.StringVar()
+            entry = ttk.Entry(user_info_frame,
+                              font=("Colibri", 14),
+                              width=20,
+                              textvariable=entry_var,
+                              state='readonly')
+            entry.grid(row=idx, column=1, padx=20, pady=10, sticky="we")
+
+            self.entries[label_text] = (entry, entry_var)
+
+        ttk.Label(user_info_frame,
+                  text="Aktivitás",
+                  font=("Colibri", 14)).grid(row=len(fields) + 1, column=0, padx=20, pady=10, sticky="w")
+
+        activity_var = ttk.StringVar()
+        activity_entry = ttk.Entry(user_info_frame,
+                                   font=("Colibri", 14),
+                                   width=20,
+                                   textvariable=activity_var,
+                                   state='readonly')
+        activity_entry.grid(row=len(fields) + 1, column=1, padx=20, pady=10, sticky="we")
+        self.entries["Aktivitás"] = (activity_entry, activity_var)
+
+        def enable_editing():
+            for entry, _ in self.entries.values():
+                entry.config(state='normal')
+            activity_entry.grid_forget()
+
+            if self.activity_combobox is None:
                 self.activity_combobox = ttk.Combobox(user_info_frame,
                                                       font=("Colibri", 14),
                                                       width=18,
                                                       textvariable=activity_var,
                                                       state='readonly',
                                                       values=list(self.app.activity_factors.keys()))
-                self.activity_combobox.grid(row=len(fields) + 1, column=1, padx=20, pady=10, sticky="we")
-
-                self.entries["Aktivitás"] = (self.activity_combobox, activity_var)
-
-                modify_button.grid_forget()
-                save_button.grid(row=len(fields) + 2, column=1, pady=20, padx=20, sticky="e")
-                cancel_button.grid(row=len(fields) + 2, column=0, pady=20, padx=20, sticky="w")
-
-            modify_button = ttk.Button(user_info_frame,
-                                       text="Módosítás",
-                                       style="darkbutton.TButton",
-                                       command=enable_editing,
-                                       cursor="hand2",
-                                       takefocus=False)
-            modify_button.grid(row=len(fields) + 2, column=0, pady=20, padx=20, sticky="w")
-
-            def save_changes():
-                updated_data = {label: var.get() for label, (entry, var) in self.entries.items()}
-
-                if not (updated_data["Életkor"].isdigit() and
-                        updated_data["Magasság (cm)"].isdigit() and
-                        updated_data["Testsúly (kg)"].isdigit()):
-                    self.app.custom_messagebox("Hiba", "Érvénytelen adatokat adtál meg!", profile=True)
-                    return
-
-                self.app.db_cursor.execute(""" 
-                    UPDATE users 
-                    SET vezeteknev = ?, keresztnev = ?, eletkor = ?, 
-                        magassag = ?, testsuly = ?, aktivitas = ? 
-                    WHERE email = ? 
-                """, (
-                    updated_data["Vezetéknév"],
-                    updated_data["Keresztnév"],
-                    updated_data["Életkor"],
-                    updated_data["Magasság (cm)"],
-                    updated_data["Testsúly (kg)"],
-                    updated_data["Aktivitás"],
-                    email
-                ))
-                self.app.db_connection.commit()
-                self.app.custom_messagebox("Siker", "Az adatok sikeresen frissültek!", profile=True)
-
-            save_button = ttk.Button(user_info_frame,
-                                     text="Mentés",
-                                     style="darkbutton.TButton",
-                                     command=save_changes,
-                                     cursor="hand2",
-                                     takefocus=False)
-            save_button.grid_forget()
+            self.activity_combobox.grid(row=len(fields) + 1, column=1, padx=20, pady=10, sticky="we")
+
+            self.entries["Aktivitás"] = (self.activity_combobox, activity_var)
+
+            modify_button.grid_forget()
+            save_button.grid(row=len(fields) + 2, column=1, pady=20, padx=20, sticky="e")
+            cancel_button.grid(row=len(fields) + 2, column=0, pady=20, padx=20, sticky="w")
+
+        modify_button = ttk.Button(user_info_frame,
+                                   text="Módosítás",
+                                   style="darkbutton.TButton",
+                                   command=enable_editing,
+                                   cursor="hand2",
+                                   takefocus=False)
+        modify_button.grid(row=len(fields) + 2, column=0, pady=20, padx=20, sticky="w")
+
+        def save_changes():
+            updated_data = {label: var.get() for label, (entry, var) in self.entries.items()}
+
+            if not (updated_data["Életkor"].isdigit() and
+                    updated_data["Magasság (cm)"].isdigit() and
+                    updated_data["Testsúly (kg)"].isdigit()):
+                self.app.custom_messagebox("Hiba", "Érvénytelen adatokat adtál meg!", profile=True)
+                return
+
+            self.app.db_worker.submit(
+                self.app.users.update_profile,
+                self.app.logged_in_user,
+                updated_data["Vezetéknév"],
+                updated_data["Keresztnév"],
+                updated_data["Életkor"],
+                updated_data["Magasság (cm)"],
+                updated_data["Testsúly (kg)"],
+                updated_data["Aktivitás"],
+                callback=lambda _: self.app.custom_messagebox("Siker", "Az adatok sikeresen frissültek!", profile=True))
+
+        save_button = ttk.Button(user_info_frame,
+                                 text="Mentés",
+                                 style="darkbutton.TButton",
+                                 command=save_changes,
+                                 cursor="hand2",
+                                 takefocus=False)
+        save_button.grid_forget()
+
+        def cancel_changes():
+            for label, (entry, var) in self.entries.items():
+                var.set(original_data.get(label, ""))
+                entry.config(state='readonly')
+
+            if self.activity_combobox:
+                self.activity_combobox.grid_forget()
+                activity_entry.grid(row=len(fields) + 1, column=1, padx=20, pady=10, sticky="we")
+                self.entries["Aktivitás"] = (activity_entry, activity_var)
 
-            def cancel_changes():
-                for label, (entry, var) in self.entries.items():
-                    var.set(original_data[label])
-                    entry.config(state='readonly')
-
-                if self.activity_combobox:
-                    self.activity_combobox.grid_forget()
-                    
-                    activity_entry = ttk.Entry(user_info_frame,
-                                               font=("Colibri", 14),
-                                               width=20,
-                                               textvariable=self.entries["Aktivitás"][1],
-                                               state='readonly')
-                    activity_entry.grid(row=len(fields) + 1, column=1, padx=20, pady=10, sticky="w")
-
-                    self.entries["Aktivitás"] = (activity_entry, self.entries["Aktivitás"][1])
-
-                save_button.grid_forget()
-                cancel_button.grid_forget()
-                modify_button.grid(row=len(fields) + 2, column=0, pady=20, padx=20, sticky="w") 
-            cancel_button = ttk.Button(user_info_frame,
-                                       text="Mégse",
-                                       style="darkbutton.TButton",
-                                       command=cancel_changes,
-                                       cursor="hand2",
-                                       takefocus=False)
+            save_button.grid_forget()
             cancel_button.grid_forget()
+            modify_button.grid(row=len(fields) + 2, column=0, pady=20, padx=20, sticky="w") 
+        cancel_button = ttk.Button(user_info_frame,
+                                   text="Mégse",
+                                   style="darkbutton.TButton",
+                                   command=cancel_changes,
+                                   cursor="hand2",
+                                   takefocus=False)
+        cancel_button.grid_forget()
+
+        def reload_profile():
+            user_data = self.app.users.profile(self.app.logged_in_user)
+            if not user_data:
+                return
+
+            vezeteknev, keresztnev, email, eletkor, magassag, testsuly, nem, aktivitas = user_data
+            original_data.update({"Vezetéknév": vezeteknev,
+                                  "Keresztnév": keresztnev,
+                                  "Életkor": eletkor,
+                                  "Magasság (cm)": magassag,
+                                  "Testsúly (kg)": testsuly,
+                                  "Aktivitás": aktivitas})
+            cancel_changes()
+
+        self.reload_profile = reload_profile
+
+    def refresh_profile_page(self):
+        """
+        A profil adatainak újratöltése az adatbázisból.
+        Egy félbehagyott szerkesztés elvetésre kerül, a mezők újra csak olvashatók.
+        """
+        self.reload_profile()
 
     def logout(self):
         """
@@ -0,0 +1,179 @@
+"""
+Virtuális táblázat
+------------------
+Hosszú listák (étkezések, gyakorlatok, napló) megjelenítése Treeview-ban
+úgy, hogy egyszerre csak egy ablaknyi sor létezik a widgetben.
+
+A sorok lapokban (PAGE_SIZE) érkeznek az adatbázisból, azonosító szerinti
+kulcsos lapozással (keyset: `id > utolsó azonosító`), így egy lap lekérése
+nem függ attól, hogy hányadik lapnál tart a görgetés. Ha a látható rész
+az ablak végéhez közelít (OVERSCAN sor), a következő lap betöltődik;
+ha az ablak túlnő a MAX_ROWS soron, a túloldali sorok törlődnek, és
+visszagörgetéskor töltődnek újra.
+
+A sorok anyagba öntését a sync_rows végzi, így frissítéskor itt is csak
+a megváltozott sorok íródnak át.
+"""
+
+import weakref
+from app.table_sync import sync_rows
+
+_tables = weakref.WeakKeyDictionary()
+
+
+def virtual_table(table):
+    """
+    A táblázathoz tartozó VirtualTable (első hívásra létrehozza).
+
+    Args:
+        table: ttk.Treeview
+    """
+    view = _tables.get(table)
+    if view is None:
+        view = VirtualTable(table)
+        _tables[table] = view
+    return view
+
+
+class VirtualTable:
+    """
+    Görgetéskor lapozva töltődő Treeview.
+
+    Az adatforrás egy `fetch_page(after_id, before_id, limit)` függvény,
+    ami azonosító szerint növekvő sorrendben adja vissza a sorokat:
+    [(id, érték, ...), ...]. `after_id` esetén az utána következő,
+    `before_id` esetén az előtte lévő legfeljebb `limit` sort.
+    """
+    PAGE_SIZE = 50
+    OVERSCAN = 20
+    MAX_ROWS = 150
+
+    def __init__(self, table, page_size=PAGE_SIZE, max_rows=MAX_ROWS):
+        """
+        Args:
+            table: ttk.Treeview
+            page_size: Egy lekérdezés legfeljebb ennyi sort tölt be
+            max_rows: Egyszerre legfeljebb ennyi sor van a táblázatban
+        """
+        self.table = table
+        self.page_size = page_size
+        self.max_rows = max_rows
+        self.key = None
+        self.fetch_page = None
+        self.rows = []
+        self.start_after = None
+        self.has_more = False
+        self.pending = None
+        self.scrollbar_set = None
+        table.configure(yscrollcommand=self._on_scroll)
+
+    def attach_scrollbar(self, scrollbar):
+        """Görgetősáv hozzákapcsolása (a yscrollcommand-ot a tábla használja)."""
+        self.scrollbar_set = scrollbar.set
+        scrollbar.configure(command=self.table.yview)
+
+    def load(self, key, fetch_page):
+        """
+        Adatforrás megjelenítése.
+
+        Ugyanarra a kulcsra (pl. ugyanaz a nap) a jelenlegi ablak frissül,
+        a görgetési pozíció és a kijelölés megmarad. Új kulcsra az ablak
+        a lista elejére áll.
+
+        Args:
+            key: Az adatforrás azonosítója (pl. (user_id, dátum, étkezés))
+            fetch_page: fetch_page(after_id, before_id, limit)
+        """
+        if key != self.key:
+            self.key = key
+            self.rows = []
+            self.start_after = None
+        self.fetch_page = fetch_page
+        self.refresh()
+
+    def refresh(self):
+        """Az aktuális ablak újratöltése az adatbázisból."""
+        if self.fetch_page is None:
+            return
+        limit = max(len(self.rows), self.page_size)
+        rows = self._fetch(self.start_after, None, limit + 1)
+        if not rows and self.start_after is not None:
+            self.start_after = None
+            rows = self._fetch(None, None, limit + 1)
+        self.has_more = len(rows) > limit
+        self._show(rows[:limit])
+
+    def clear(self):
+        """Táblázat ürítése, adatforrás nélkül."""
+        self.key = None
+        self.fetch_page = None
+        self.start_after = None
+        self.has_more = False
+        self._show([])
+
+    def load_next(self):
+        """A következő lap hozzáfűzése az ablak végéhez."""
+        if not self.has_more or not self.rows:
+            return
+        rows = self._fetch(self.rows[-1][0], None, self.page_size + 1)
+        self.has_more = len(rows) > self.page_size
+        top = self._top_index()
+        window = self.rows + rows[:self.page_size]
+
+        overflow = len(window) - self.max_rows
+        if overflow > 0:
+            self.start_after = window[overflow - 1][0]
+            window = window[overflow:]
+        self._show(window)
+        if overflow > 0:
+            self._scroll_to(top - overflow)
+
+    def load_previous(self):
+        """Az ablak előtti lap visszatöltése (visszagörgetéskor)."""
+        if self.start_after is None or not self.rows:
+            return
+        rows = self._fetch(None, self.rows[0][0], self.page_size + 1)
+        if len(rows) > self.page_size:
+            self.start_after = rows[0][0]
+            rows = rows[1:]
+        else:
+            self.start_after = None
+        top = self._top_index()
+        window = rows + self.rows
+
+        if len(window) > self.max_rows:
+            window = window[:self.max_rows]
+            self.has_more = True
+        self._show(window)
+        self._scroll_to(top + len(rows))
+
+    def _fetch(self, after_id, before_id, limit):
+        return [(row[0], tuple(row[1:])) for row in self.fetch_page(after_id, before_id, limit)]
+
+    def _show(self, rows):
+        self.rows = rows
+        sync_rows(self.table, rows)
+
+    def _top_index(self):
+        first, _ = self.table.yview()
+        return round(float(first) * len(self.rows))
+
+    def _scroll_to(self, index):
+        if self.rows:
+            self.table.yview_moveto(max(index, 0) / len(self.rows))
+
+    def _on_scroll(self, first, last):
+        if self.scrollbar_set:
+            self.scrollbar_set(first, last)
+        if self.pending is not None or not self.rows:
+            return
+        top = float(first) * len(self.rows)
+        bottom = float(last) * len(self.rows)
+        if self.has_more and bottom >= len(self.rows) - self.OVERSCAN:
+            self.pending = self.table.after_idle(self._load_pending, self.load_next)
+        elif self.start_after is not None and top <= self.OVERSCAN:
+            self.pending = self.table.after_idle(self._load_pending, self.load_previous)
+
+    def _load_pending(self, load):
+        self.pending = None
+        load()
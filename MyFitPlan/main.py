@@ -1,6 +1,18 @@
-import ttkbootstrap as ttk
-from app.app import MyFitPlan
+import sys
+import time
 
-window = ttk.Window(themename="myfitplan_theme")
-app = MyFitPlan(window)
+started = time.perf_counter()
+
+from app.startup import StartupProfiler
+
+profiler = StartupProfiler.from_argv(sys.argv, started)
+
+with profiler.phase("ttkbootstrap import"):
+    import ttkbootstrap as ttk
+with profiler.phase("alkalmazás import"):
+    from app.app import MyFitPlan
+with profiler.phase("főablak"):
+    window = ttk.Window(themename="myfitplan_theme")
+
+app = MyFitPlan(window, profiler)
 window.mainloop()
\ No newline at end of file